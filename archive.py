@@ -0,0 +1,154 @@
+from __future__ import annotations
+import hashlib, os, tempfile, time, zipfile
+
+import metrics
+from foldercache import LRUCache
+
+ARCHIVE_EXTENSIONS = (".zip",)
+CACHE_SIZE = 64
+EXTRACT_DIR = os.path.join(tempfile.gettempdir(), "EgansFloatboard", "zip")
+
+
+class ArchiveIndex:
+    """Directory tree of one zip, built from its central directory only (nothing is decompressed)."""
+
+    def __init__(self, zip_path: str):
+        self.zip_path = zip_path
+        # inner folder ("" = root, os.sep separated) -> {child name: (is_dir, size, mtime)}
+        self.children: dict[str, dict[str, tuple[bool, int, float]]] = {"": {}}
+        self.members: dict[str, str] = {}  # inner path -> name inside the zip
+        with zipfile.ZipFile(zip_path) as zf:
+            for info in zf.infolist():
+                parts = [p for p in info.filename.replace("\\", "/").split("/") if p not in ("", ".")]
+                if not parts or ".." in parts:
+                    continue  # never offer names that would escape the extraction folder
+                mtime = _zip_time(info.date_time)
+                for depth in range(len(parts) - 1):
+                    self._add(parts[:depth], parts[depth], True, 0, mtime)
+                if info.is_dir():
+                    self._add(parts[:-1], parts[-1], True, 0, mtime)
+                else:
+                    self._add(parts[:-1], parts[-1], False, info.file_size, mtime)
+                    self.members[os.sep.join(parts)] = info.filename
+
+    def _add(self, parent: list[str], name: str, is_dir: bool, size: int, mtime: float):
+        folder = os.sep.join(parent)
+        entries = self.children.setdefault(folder, {})
+        if name not in entries or not entries[name][0]:
+            entries[name] = (is_dir, size, mtime)
+        if is_dir:
+            self.children.setdefault(os.sep.join(parent + [name]), {})
+
+    def tree_size(self, inner: str) -> tuple[int, int, int]:
+        """(bytes uncompressed, files, folders) below `inner`."""
+        size = files = folders = 0
+        pending = [inner]
+        while pending:
+            folder = pending.pop()
+            for name, (is_dir, n, _m) in self.children.get(folder, {}).items():
+                if is_dir:
+                    folders += 1
+                    pending.append(os.path.join(folder, name) if folder else name)
+                else:
+                    files += 1
+                    size += n
+        return size, files, folders
+
+
+def _zip_time(date_time) -> float:
+    try:
+        return time.mktime(tuple(date_time) + (0, 0, -1))
+    except (OverflowError, ValueError):
+        return 0.0
+
+
+# ---------------- Cached lookup ----------------
+_cache = LRUCache(CACHE_SIZE)
+
+
+def is_archive(path: str) -> bool:
+    path = str(path)
+    return path.lower().endswith(ARCHIVE_EXTENSIONS) and os.path.isfile(path)
+
+
+def split_archive(path: str) -> tuple[str, str] | None:
+    """("C:\\x\\a.zip", "sub\\f.txt") for a path inside an archive, ("...a.zip", "") for its root."""
+    path = os.path.normpath(str(path))
+    low = path.lower()
+    for ext in ARCHIVE_EXTENSIONS:
+        i = low.find(ext + os.sep)
+        while i >= 0:
+            zip_path = path[:i + len(ext)]
+            if zip_path in _cache or os.path.isfile(zip_path):
+                return zip_path, path[i + len(ext) + 1:]
+            i = low.find(ext + os.sep, i + 1)
+        if low.endswith(ext) and (path in _cache or os.path.isfile(path)):
+            return path, ""
+    return None
+
+
+def mtime(zip_path: str) -> float | None:
+    try:
+        return os.stat(zip_path).st_mtime
+    except OSError:
+        return None
+
+
+def index(zip_path: str) -> ArchiveIndex | None:
+    """The archive's index, re-read only when the zip's mtime changes. None if unreadable."""
+    m = mtime(zip_path)
+    hit = _cache.get(zip_path)
+    if hit is not None and hit[0] == m:
+        return hit[1]
+    try:
+        with metrics.timed("archive_index"):
+            idx = ArchiveIndex(zip_path)
+    except (OSError, zipfile.BadZipFile) as e:
+        print(f"[Archive] {zip_path}: {e}")
+        idx = None
+    _cache.put(zip_path, (m, idx))
+    return idx
+
+
+def listing(zip_path: str, inner: str) -> tuple[list[str], set[str], dict[str, float], dict[str, int]]:
+    """(paths, dirs, mtimes, sizes) for one folder inside the archive, shaped like a disk listing."""
+    idx = index(zip_path)
+    files, dirs, mtimes, sizes = [], set(), {}, {}
+    base = os.path.join(zip_path, inner) if inner else zip_path
+    for name, (is_dir, size, m) in (idx.children.get(inner, {}) if idx else {}).items():
+        p = os.path.join(base, name)
+        files.append(p)
+        mtimes[p] = m
+        sizes[p] = size
+        if is_dir:
+            dirs.add(p)
+    return files, dirs, mtimes, sizes
+
+
+def tree_size(path: str) -> tuple[int, int, int] | None:
+    arc = split_archive(path)
+    if arc is None:
+        return None
+    idx = index(arc[0])
+    return idx.tree_size(arc[1]) if idx else (0, 0, 0)
+
+
+def extract(path: str) -> str:
+    """Extract just the member at `path` (reused if already there) and return where it landed."""
+    arc = split_archive(path)
+    if arc is None or not arc[1]:
+        raise FileNotFoundError(path)
+    zip_path, inner = arc
+    idx = index(zip_path)
+    name = idx.members.get(inner) if idx else None
+    if name is None:
+        raise FileNotFoundError(path)
+    tag = hashlib.sha1(zip_path.encode("utf-8", "surrogatepass")).hexdigest()[:12]
+    dest = os.path.join(EXTRACT_DIR, f"{tag}-{int(mtime(zip_path) or 0)}")
+    with zipfile.ZipFile(zip_path) as zf:
+        info = zf.getinfo(name)
+        out = os.path.join(dest, *inner.split(os.sep))
+        if os.path.isfile(out) and os.path.getsize(out) == info.file_size:
+            return out
+        with metrics.timed("archive_extract"):
+            return zf.extract(info, dest)
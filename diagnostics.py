@@ -0,0 +1,129 @@
+from __future__ import annotations
+import tracemalloc
+
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QTableWidget, QTableWidgetItem, QCheckBox,
+    QSpinBox, QPlainTextEdit, QPushButton, QHeaderView, QWidget
+)
+from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, QTimer
+
+import ioscheduler
+import metrics
+
+REFRESH_MS = 1000
+ZONE_COLUMNS = ("Zone", "Widgets", "Files", "Cells built", "Last refresh (ms)", "Repaints avoided", "Idle", "Save pending")
+
+
+def _mb(n: float) -> str:
+    return f"{n / (1024 * 1024):.1f} MB"
+
+
+class DiagnosticsDialog(QDialog):
+    """Live view of what the zones cost: widgets, caches, scans, saves and memory."""
+
+    def __init__(self, app, parent=None):
+        super().__init__(parent)
+        self.app = app
+        self.setWindowTitle("Diagnostics")
+        self.resize(720, 520)
+        layout = QVBoxLayout(self)
+
+        self.summary = QLabel()
+        self.summary.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        layout.addWidget(self.summary)
+
+        self.table = QTableWidget(0, len(ZONE_COLUMNS))
+        self.table.setHorizontalHeaderLabels(ZONE_COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        layout.addWidget(self.table, 2)
+
+        row = QHBoxLayout()
+        self.trace_box = QCheckBox("Track allocations (tracemalloc)")
+        self.trace_box.setChecked(tracemalloc.is_tracing())
+        self.trace_box.toggled.connect(self._toggle_tracing)
+        self.top_n = QSpinBox(); self.top_n.setRange(5, 100); self.top_n.setValue(15)
+        self.top_n.setPrefix("Top ")
+        export = QPushButton("Write metrics file")
+        export.clicked.connect(self.write_metrics)
+        row.addWidget(self.trace_box)
+        row.addWidget(self.top_n)
+        row.addStretch(1)
+        row.addWidget(export)
+        layout.addLayout(row)
+
+        self.allocs = QPlainTextEdit()
+        self.allocs.setReadOnly(True)
+        font = QFont("Consolas")
+        font.setStyleHint(QFont.StyleHint.Monospace)
+        self.allocs.setFont(font)
+        layout.addWidget(self.allocs, 1)
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(REFRESH_MS)
+        self.refresh()
+
+    def _toggle_tracing(self, on: bool):
+        if on and not tracemalloc.is_tracing():
+            tracemalloc.start(10)
+        elif not on and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.refresh()
+
+    def write_metrics(self):
+        path = self.app.write_metrics()
+        self.summary.setToolTip(f"Metrics written to {path}")
+
+    def refresh(self):
+        zones = list(self.app.zones)
+        totals, last = metrics.snapshot()
+        import zone as zone_mod
+
+        hits, misses = totals.get("icon_cache_hits", 0), totals.get("icon_cache_misses", 0)
+        hit_rate = hits / (hits + misses) * 100 if hits + misses else 0.0
+
+        def avg_ms(name):
+            n = totals.get(name + "_total", 0)
+            return totals.get(name + "_seconds_total", 0) / n * 1000 if n else 0.0
+
+        io = ioscheduler.current()
+        volumes = "    ".join(
+            f"{name}: {v['queued']} queued, {v['running']}/{v['limit']} running, "
+            f"last {v['last_latency_seconds'] * 1000:.1f} ms"
+            for name, v in sorted((io.stats() if io else {}).items())) or "idle"
+
+        self.summary.setText(
+            f"Process RSS: {_mb(metrics.process_rss())}    Zones: {len(zones)}    "
+            f"Pending saves: {sum(1 for z in zones if z.save_pending)}\n"
+            f"Cells built: {int(totals.get('cells_built', 0))}    "
+            f"Icon cache: {zone_mod.icon_cache_size()} icons, {hit_rate:.1f}% hit rate\n"
+            f"Grid refresh: last {last.get('refresh_grid_seconds', 0) * 1000:.1f} ms, avg {avg_ms('refresh_grid'):.1f} ms    "
+            f"Folder listing avg {avg_ms('folder_listing'):.2f} ms    "
+            f"Virtual scan last {last.get('virtual_scan_seconds', 0) * 1000:.0f} ms\n"
+            f"I/O: {volumes}\n"
+            f"Metrics file: {self.app.metrics_path}"
+        )
+
+        self.table.setRowCount(len(zones))
+        for r, z in enumerate(zones):
+            values = (z.title_bar.text(), len(z.findChildren(QWidget)), len(z.file_list), z.cells_built,
+                      f"{z.last_refresh_ms:.1f}", z.repaints_avoided, "yes" if z.idle else "",
+                      "yes" if z.save_pending else "")
+            for c, v in enumerate(values):
+                self.table.setItem(r, c, QTableWidgetItem(str(v)))
+
+        if tracemalloc.is_tracing():
+            stats = tracemalloc.take_snapshot().statistics("lineno")[: self.top_n.value()]
+            current, peak = tracemalloc.get_traced_memory()
+            lines = [f"traced: {_mb(current)} (peak {_mb(peak)})", ""]
+            lines += [f"{s.size / 1024:9.1f} KB {s.count:7d}  {s.traceback[0].filename}:{s.traceback[0].lineno}"
+                      for s in stats]
+            self.allocs.setPlainText("\n".join(lines))
+        else:
+            self.allocs.setPlainText("Allocation tracking is off.")
+
+    def closeEvent(self, event):
+        self.timer.stop()
+        super().closeEvent(event)
@@ -4,18 +4,20 @@ from PyQt6.QtGui import QIcon
 from PyQt6.QtCore import Qt, QSize
 
 from saver import asset_path  # new import
+import foldersize
 
 def human_size(path):
-    """Return human-readable size string for a file."""
+    """Return human-readable size string for a file, or the cached recursive size of a folder."""
+    if os.path.isdir(path):
+        info = foldersize.sizes().get(path)
+        if info is None:
+            foldersize.sizes().request(path)  # shows up the next time the tooltip is built
+            return ""
+        return info.describe()
     try:
-        size = os.path.getsize(path)
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size < 1024.0:
-                return f"{size:.1f} {unit}"
-            size /= 1024.0
+        return foldersize.format_size(os.path.getsize(path))
     except Exception:
         return ""
-    return ""
 
 class FileIcon(QFrame):
     def __init__(self, path, icon_size=64, parent=None):
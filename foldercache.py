@@ -0,0 +1,182 @@
+from __future__ import annotations
+import os, threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+import ioscheduler
+import metrics
+
+
+class LRUCache:
+    """Small bounded mapping; least recently used entries are dropped first.
+
+    `on_evict(key, value)` is called for entries pushed out by the size bound,
+    which lets callers release Qt widgets they were holding on to.
+    """
+
+    def __init__(self, max_entries: int = 16, on_evict: Callable[[Hashable, Any], None] | None = None):
+        self.max_entries = max_entries
+        self.on_evict = on_evict
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key, value):
+        evicted = []
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                evicted.append(self._data.popitem(last=False))
+        if self.on_evict:
+            for k, v in evicted:
+                self.on_evict(k, v)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def keys(self) -> list:
+        with self._lock:
+            return list(self._data.keys())
+
+    def clear(self):
+        with self._lock:
+            items = list(self._data.items())
+            self._data.clear()
+        if self.on_evict:
+            for k, v in items:
+                self.on_evict(k, v)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+
+def _folder_mtime(path: str) -> float | None:
+    if ".zip" in path.lower():
+        import archive
+        arc = archive.split_archive(path)
+        if arc is not None:
+            return archive.mtime(arc[0])  # folders inside an archive change with the archive
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+class ListingCache:
+    """Folder listings keyed by path, revalidated against the folder's mtime.
+
+    Entries remember which children are folders and each child's mtime (free
+    from scandir on Windows) so cells and the Recent index don't have to stat
+    every path again. Background fetches go through the shared I/O scheduler.
+
+    `listeners(folder, files, dirs, mtimes)` are called whenever a folder is
+    actually re-read, on whichever thread did the reading.
+    """
+
+    def __init__(self, max_entries: int = 32):
+        self._cache = LRUCache(max_entries)
+        self.listeners: list[Callable[[str, list[str], frozenset, dict[str, float]], None]] = []
+
+    def listing(self, folder: str) -> list[str]:
+        mtime = _folder_mtime(folder)
+        hit = self._cache.get(folder)
+        if hit is not None and hit[0] == mtime:
+            return list(hit[1])
+        import archive, shortcuts
+        files, dirs, mtimes, sizes = [], set(), {}, {}
+        arc = archive.split_archive(folder) if ".zip" in folder.lower() else None
+        try:
+            if arc is not None:
+                files, dirs, mtimes, sizes = archive.listing(*arc)
+            else:
+                with metrics.timed("folder_listing"), os.scandir(folder) as it:
+                    for entry in it:
+                        files.append(entry.path)
+                        try:
+                            st = entry.stat()
+                            mtimes[entry.path] = st.st_mtime
+                            sizes[entry.path] = st.st_size
+                            if entry.is_dir():
+                                dirs.add(entry.path)
+                            elif shortcuts.is_shortcut(entry.name):
+                                # parsed here (usually on an I/O worker) so cells only hit the cache
+                                shortcuts.resolve(entry.path, mtimes[entry.path])
+                        except OSError:
+                            pass
+        except Exception:
+            files, dirs, mtimes, sizes = [], set(), {}, {}
+        dirs = frozenset(dirs)
+        self._cache.put(folder, (mtime, files, dirs, mtimes, sizes))
+        for listener in list(self.listeners):
+            listener(folder, files, dirs, mtimes)
+        return list(files)
+
+    def peek(self, folder: str) -> tuple[list[str], frozenset, dict[str, float]] | None:
+        """The cached (files, dirs, mtimes) for `folder`, without touching the disk."""
+        hit = self._cache.get(folder)
+        return (list(hit[1]), hit[2], dict(hit[3])) if hit is not None else None
+
+    def is_fresh(self, folder: str) -> bool:
+        hit = self._cache.get(folder)
+        return hit is not None and hit[0] == _folder_mtime(folder)
+
+    def is_dir(self, path: str) -> bool:
+        """Answer from the parent's cached listing when there is one."""
+        path = str(path)
+        hit = self._cache.get(os.path.dirname(path))
+        if hit is not None and (path in hit[2] or path in hit[3]):
+            return path in hit[2]
+        return os.path.isdir(path)
+
+    def size_of(self, path: str) -> int | None:
+        """A file's size from the parent's cached listing (None if unknown)."""
+        hit = self._cache.get(os.path.dirname(str(path)))
+        return hit[4].get(str(path)) if hit is not None else None
+
+    def mtime_of(self, path: str) -> float | None:
+        """A file's mtime from the parent's cached listing (None if unknown)."""
+        hit = self._cache.get(os.path.dirname(str(path)))
+        return hit[3].get(str(path)) if hit is not None else None
+
+    def fetch(self, folder: str, callback: Callable[[list[str]], None], priority: int | None = None):
+        """List `folder` on the I/O scheduler; `callback(files)` runs on the GUI thread."""
+        if priority is None:
+            priority = ioscheduler.VISIBLE
+        return ioscheduler.scheduler().submit(("listing", folder), lambda: self.listing(folder),
+                                              folder, priority, callback)
+
+    def prefetch(self, folder: str):
+        """Warm the listing in the background (used when a folder cell is hovered)."""
+        # same key and function as fetch(), so a later fetch joins this job
+        ioscheduler.scheduler().submit(("listing", folder), lambda: self.listing(folder),
+                                       folder, ioscheduler.BACKGROUND)
+
+    def invalidate(self, folder: str | None = None):
+        if folder is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(folder)
+
+
+_shared: ListingCache | None = None
+
+
+def shared_listings() -> ListingCache:
+    """One listing cache for all zones, so zones on the same folder share work."""
+    global _shared
+    if _shared is None:
+        _shared = ListingCache(max_entries=256)
+    return _shared
@@ -0,0 +1,197 @@
+from __future__ import annotations
+import os, threading, time
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+import ioscheduler
+import metrics
+from foldercache import LRUCache, shared_listings
+
+SLICE_SECONDS = 0.05      # work per scheduler job before yielding the volume to others
+THROTTLE_EVERY = 2000     # entries between short sleeps inside a slice
+THROTTLE_SLEEP = 0.002
+MAX_SECONDS = 20.0        # total budget per folder; bigger trees are reported as "at least"
+STALE_AFTER = 600.0       # re-measure eventually: nested changes don't touch the folder's mtime
+CACHE_SIZE = 2048
+
+
+def format_size(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB", "TB"):
+        if size < 1024.0:
+            return f"{size:.1f} {unit}"
+        size /= 1024.0
+    return f"{size:.1f} PB"
+
+
+class FolderSize:
+    """Totals for one folder tree; `complete` is False if the time budget ran out first."""
+
+    def __init__(self, size: int = 0, files: int = 0, folders: int = 0, complete: bool = True):
+        self.size = size
+        self.files = files
+        self.folders = folders
+        self.complete = complete
+
+    def describe(self) -> str:
+        more = "" if self.complete else "at least "
+        return (f"{more}{format_size(self.size)} — {self.files} files, "
+                f"{self.folders} folder{'s' if self.folders != 1 else ''}")
+
+
+class _Walk:
+    """Resumable scandir walk; each run() call does at most one slice of work.
+
+    A slice can end in the middle of a directory: its open scandir iterator
+    is kept and the next slice carries on from there.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.pending = [root]
+        self.total = FolderSize(complete=False)
+        self.spent = 0.0
+        self._it = None  # half-read directory
+
+    def run(self) -> bool:
+        """Returns True when the tree is done (or the total budget is used up)."""
+        t0 = time.perf_counter()
+        seen = 0
+        while self._it is not None or self.pending:
+            if self._it is None:
+                try:
+                    self._it = os.scandir(self.pending.pop())
+                except OSError:
+                    continue
+            try:
+                for entry in self._it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            self.total.folders += 1
+                            self.pending.append(entry.path)
+                        else:
+                            self.total.files += 1
+                            self.total.size += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        pass
+                    seen += 1
+                    if seen % THROTTLE_EVERY == 0:
+                        time.sleep(THROTTLE_SLEEP)
+                    if time.perf_counter() - t0 >= SLICE_SECONDS:
+                        break
+                else:
+                    self._close()
+            except OSError:
+                self._close()  # the directory went away (or the share) while being read
+            if time.perf_counter() - t0 >= SLICE_SECONDS:
+                break
+        self.spent += time.perf_counter() - t0
+        if self._it is None and not self.pending:
+            self.total.complete = True
+        finished = self.total.complete or self.spent >= MAX_SECONDS
+        if finished:
+            self._close()
+        return finished
+
+    def _close(self):
+        if self._it is not None:
+            self._it.close()
+            self._it = None
+
+
+class FolderSizes(QObject):
+    """Recursive folder sizes measured on the I/O scheduler and cached per folder.
+
+    A measurement runs as a chain of short background jobs, so a huge tree
+    never holds a volume slot for long and other zones' work slots in between.
+    Entries are revalidated against the folder's mtime (taken from the
+    parent's cached listing when possible) and expire after STALE_AFTER.
+    """
+    ready = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cache = LRUCache(CACHE_SIZE)
+        self._walks: dict[str, _Walk] = {}
+        self._lock = threading.Lock()
+
+    def _mtime(self, folder: str) -> float | None:
+        cached = shared_listings().peek(os.path.dirname(folder))
+        if cached is not None and folder in cached[2]:
+            return cached[2][folder]
+        try:
+            return os.stat(folder).st_mtime
+        except OSError:
+            return None
+
+    def get(self, folder: str) -> FolderSize | None:
+        folder = os.path.normpath(folder)
+        if ".zip" in folder.lower():
+            import archive
+            totals = archive.tree_size(folder)  # from the cached central directory
+            if totals is not None:
+                return FolderSize(*totals)
+        hit = self._cache.get(folder)
+        if hit is None:
+            return None
+        mtime, measured, result = hit
+        if mtime != self._mtime(folder) or time.monotonic() - measured > STALE_AFTER:
+            return None
+        return result
+
+    def last_known(self, folder: str) -> FolderSize | None:
+        """The previous result even if it's outdated (good enough to sort by while re-measuring)."""
+        if ".zip" in folder.lower():
+            return self.get(folder)
+        hit = self._cache.get(os.path.normpath(folder))
+        return hit[2] if hit is not None else None
+
+    def request(self, folder: str, priority: int = ioscheduler.BACKGROUND):
+        """Measure `folder` unless a fresh result or a measurement is already there."""
+        folder = os.path.normpath(folder)
+        if self.get(folder) is not None:
+            return
+        with self._lock:
+            if folder in self._walks:
+                return
+            walk = self._walks[folder] = _Walk(folder)
+        self._submit(walk, priority, self._mtime(folder))
+
+    def _submit(self, walk: _Walk, priority: int, mtime: float | None):
+        def step() -> bool:
+            try:
+                return walk.run()
+            except Exception as e:
+                # report what was counted so far; the folder can be measured again later
+                print(f"[FolderSize] {walk.root}: {e}")
+                walk._close()
+                return True
+
+        def done(finished):
+            if finished is False:
+                # back of the queue, so other folders and zones get their turn
+                self._submit(walk, priority, mtime)
+                return
+            with self._lock:
+                self._walks.pop(walk.root, None)
+            self._cache.put(walk.root, (mtime, time.monotonic(), walk.total))
+            metrics.observe("folder_size", walk.spent)
+            self.ready.emit(walk.root)
+        ioscheduler.scheduler().submit(("size", walk.root, id(walk), walk.spent), step,
+                                       walk.root, priority, done)
+
+    def invalidate(self, path: str):
+        """Drop `path` and every cached folder above it (their totals include it)."""
+        path = os.path.normpath(path)
+        for key in self._cache.keys():
+            if path == key or path.startswith(key.rstrip(os.sep) + os.sep):
+                self._cache.pop(key)
+
+
+_sizes: FolderSizes | None = None
+
+
+def sizes() -> FolderSizes:
+    global _sizes
+    if _sizes is None:
+        _sizes = FolderSizes()
+    return _sizes
@@ -0,0 +1,99 @@
+"""Compare per-window hosting with single-surface hosting.
+
+    python hostbench.py --zones 40 --files 30 --rounds 20
+
+For each mode this reports the number of native top-level windows the
+compositor has to manage, the time to show all zones, and the time for a
+theme change (restyle every zone and repaint synchronously). Runs on the
+real desktop, or headless with QT_QPA_PLATFORM=offscreen.
+"""
+from __future__ import annotations
+import argparse, os, statistics, sys, tempfile, time
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QColor
+from PyQt6.QtCore import QRect
+
+
+def _make_folder(root: str, files: int) -> str:
+    folder = os.path.join(root, "bench")
+    os.makedirs(folder, exist_ok=True)
+    for i in range(files):
+        open(os.path.join(folder, f"file_{i:04d}.txt"), "a").close()
+    return folder
+
+
+def _restyle(zones, color: QColor):
+    for z in zones:
+        z.bg_color = color
+        z._apply_title_style()
+        z.grid_widget.setStyleSheet(f"background-color: {color.name()};")
+
+
+def run_mode(app, single_surface: bool, zones_n: int, folder: str, rounds: int) -> dict:
+    from zone import Zone
+    from surface import SurfaceHost
+
+    host = SurfaceHost()
+    t0 = time.perf_counter()
+    zones = []
+    for i in range(zones_n):
+        z = Zone(title=f"Bench {i}", folder=folder)
+        z.refresh_grid()
+        z.setGeometry(QRect(20 + (i % 8) * 60, 20 + (i // 8) * 40, z.width(), z.height()))
+        z.show()
+        zones.append(z)
+    if single_surface:
+        host.host_all(zones)
+    app.processEvents()
+    show_ms = (time.perf_counter() - t0) * 1000
+
+    windows = sum(1 for w in app.topLevelWidgets() if w.isVisible())
+    repaint_ms = []
+    for r in range(rounds):
+        color = QColor("#323232" if r % 2 else "#28303a")
+        t = time.perf_counter()
+        _restyle(zones, color)
+        if single_surface:
+            host.repaint()
+        else:
+            for z in zones:
+                z.repaint()
+        app.processEvents()
+        repaint_ms.append((time.perf_counter() - t) * 1000)
+
+    host.release_all(zones)
+    for z in zones:
+        z.close()
+        z.deleteLater()
+    app.processEvents()
+    return {
+        "mode": "single-surface" if single_surface else "per-window",
+        "native_windows": windows,
+        "show_ms": show_ms,
+        "theme_ms_median": statistics.median(repaint_ms),
+        "theme_ms_max": max(repaint_ms),
+    }
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--zones", type=int, default=40)
+    ap.add_argument("--files", type=int, default=30)
+    ap.add_argument("--rounds", type=int, default=20)
+    args = ap.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = _make_folder(tmp, args.files)
+        results = [run_mode(app, False, args.zones, folder, args.rounds),
+                   run_mode(app, True, args.zones, folder, args.rounds)]
+    print(f"{'mode':<16}{'windows':>9}{'show ms':>10}{'theme ms (median)':>20}{'theme ms (max)':>16}")
+    for r in results:
+        print(f"{r['mode']:<16}{r['native_windows']:>9}{r['show_ms']:>10.1f}"
+              f"{r['theme_ms_median']:>20.2f}{r['theme_ms_max']:>16.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
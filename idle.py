@@ -0,0 +1,89 @@
+from __future__ import annotations
+import sys
+
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtGui import QPainter, QPixmap
+from PyQt6.QtCore import QObject, QAbstractNativeEventFilter, pyqtSignal
+
+IDLE_AFTER_MS = 8000  # quiet time before a zone swaps its widgets for a cached pixmap
+
+# process-wide count of paint events served from cached pixmaps
+repaints_avoided = 0
+
+
+class IdleSnapshot(QWidget):
+    """Paints a pre-rendered image of a zone in place of its widget tree."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pixmap = QPixmap()
+        self.avoided = 0
+        self.hide()
+
+    def set_pixmap(self, pixmap: QPixmap):
+        self.pixmap = pixmap
+        self.update()
+
+    def paintEvent(self, event):
+        global repaints_avoided
+        if self.pixmap.isNull():
+            return
+        p = QPainter(self)
+        p.drawPixmap(0, 0, self.pixmap)
+        p.end()
+        self.avoided += 1
+        repaints_avoided += 1
+
+
+# ---------------- Session lock notifications ----------------
+WM_WTSSESSION_CHANGE = 0x02B1
+WTS_SESSION_LOCK = 0x7
+WTS_SESSION_UNLOCK = 0x8
+NOTIFY_FOR_THIS_SESSION = 0
+
+
+class _WtsFilter(QAbstractNativeEventFilter):
+    def __init__(self, monitor: "SessionMonitor"):
+        super().__init__()
+        self.monitor = monitor
+
+    def nativeEventFilter(self, event_type, message):
+        if event_type == b"windows_generic_MSG":
+            from ctypes import wintypes
+            msg = wintypes.MSG.from_address(int(message))
+            if msg.message == WM_WTSSESSION_CHANGE:
+                if msg.wParam == WTS_SESSION_LOCK:
+                    self.monitor.set_locked(True)
+                elif msg.wParam == WTS_SESSION_UNLOCK:
+                    self.monitor.set_locked(False)
+        return False, 0
+
+
+class SessionMonitor(QObject):
+    """Emits locked_changed when the Windows session is locked/unlocked.
+
+    Elsewhere it stays silent; callers can still drive set_locked() themselves.
+    """
+    locked_changed = pyqtSignal(bool)
+
+    def __init__(self, app, parent=None):
+        super().__init__(parent)
+        self.locked = False
+        self._filter = None
+        self._anchor = None
+        if sys.platform == "win32":
+            try:
+                import ctypes
+                # any native window of ours can receive the notifications
+                self._anchor = QWidget()
+                hwnd = int(self._anchor.winId())
+                ctypes.windll.wtsapi32.WTSRegisterSessionNotification(hwnd, NOTIFY_FOR_THIS_SESSION)
+                self._filter = _WtsFilter(self)
+                app.installNativeEventFilter(self._filter)
+            except Exception as e:
+                print(f"[Idle] Session notifications unavailable: {e}")
+
+    def set_locked(self, locked: bool):
+        if locked != self.locked:
+            self.locked = locked
+            self.locked_changed.emit(locked)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+import os, shutil, threading
+from typing import Iterable
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+CHUNK_SIZE = 200  # files per grid update / save
+
+
+def unique_destination(folder: str, name: str, taken: set[str] | None = None) -> str:
+    """Return folder/name, or folder/"name (2).ext" etc. if that name is already used."""
+    base, ext = os.path.splitext(name)
+    candidate = os.path.join(folder, name)
+    n = 2
+    while os.path.exists(candidate) or (taken is not None and candidate in taken):
+        candidate = os.path.join(folder, f"{base} ({n}){ext}")
+        n += 1
+    if taken is not None:
+        taken.add(candidate)
+    return candidate
+
+
+def same_volume(a: str, b: str) -> bool:
+    try:
+        return os.stat(a).st_dev == os.stat(b).st_dev
+    except OSError:
+        return False
+
+
+def _is_inside(path: str, folder: str) -> bool:
+    path, folder = os.path.normcase(os.path.abspath(path)), os.path.normcase(os.path.abspath(folder))
+    return path == folder or path.startswith(folder.rstrip(os.sep) + os.sep)
+
+
+class IngestJob(QObject):
+    """Copies or moves dropped paths into a folder on a worker thread.
+
+    Results are reported in chunks so the zone rebuilds and saves once per
+    chunk rather than once per file.
+    """
+    progress = pyqtSignal(int, int)          # done, total
+    chunk_done = pyqtSignal(list)            # destination paths
+    finished = pyqtSignal(int, list)         # done, errors
+
+    def __init__(self, sources: Iterable[str], dest: str, move: bool = False, parent=None):
+        super().__init__(parent)
+        self.sources = [os.path.normpath(s) for s in sources]
+        self.dest = dest
+        self.move = move
+        self._cancel = threading.Event()
+
+    def start(self):
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def _transfer(self, src: str, taken: set[str]) -> str | None:
+        if os.path.dirname(src) == os.path.normpath(self.dest):
+            return None  # dropped onto its own folder
+        if os.path.isdir(src) and _is_inside(self.dest, src):
+            raise OSError(f"cannot place {src} inside itself")
+        target = unique_destination(self.dest, os.path.basename(src), taken)
+        if self.move:
+            shutil.move(src, target)
+        elif os.path.isdir(src):
+            shutil.copytree(src, target)
+        else:
+            shutil.copy2(src, target)
+        return target
+
+    def _run(self):
+        total = len(self.sources)
+        done = 0
+        errors: list[str] = []
+        chunk: list[str] = []
+        taken: set[str] = set()
+        for src in self.sources:
+            if self._cancel.is_set():
+                break
+            try:
+                target = self._transfer(src, taken)
+                if target:
+                    chunk.append(target)
+            except Exception as e:
+                errors.append(f"{src}: {e}")
+            done += 1
+            if len(chunk) >= CHUNK_SIZE:
+                self.chunk_done.emit(chunk)
+                chunk = []
+            if done % 25 == 0 or done == total:
+                self.progress.emit(done, total)
+        if chunk:
+            self.chunk_done.emit(chunk)
+        self.progress.emit(done, total)
+        self.finished.emit(done, errors)
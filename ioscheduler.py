@@ -0,0 +1,239 @@
+from __future__ import annotations
+import heapq, itertools, os, sys, threading, time
+from typing import Any, Callable, Hashable
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+import metrics
+
+# Priority classes; lower runs first.
+USER = 0        # the user is waiting on it (opening a folder, navigating)
+VISIBLE = 1     # keeps an on-screen zone current
+HIDDEN = 2      # zone is hidden or parked in the pool
+BACKGROUND = 3  # speculative (hover prefetch, folder sizes)
+
+LOCAL_LIMIT = 2    # concurrent jobs per local volume
+NETWORK_LIMIT = 1  # shares and USB sticks thrash quickly when hit in parallel
+DRIVE_REMOVABLE, DRIVE_FIXED, DRIVE_REMOTE, DRIVE_RAMDISK = 2, 3, 4, 6
+
+
+# ---------------- Volumes ----------------
+_volume_cache: dict[str, str] = {}
+_drive_types: dict[str, int] = {}
+
+
+def volume_of(path: str) -> str:
+    """A stable name for the device `path` lives on ("C:", "\\\\NAS\\SHARE", "dev:2049")."""
+    path = os.path.abspath(str(path))
+    drive, _ = os.path.splitdrive(path)
+    if drive:
+        return drive.upper()
+    parent = os.path.dirname(path)
+    hit = _volume_cache.get(parent)
+    if hit is None:
+        try:
+            hit = f"dev:{os.stat(parent).st_dev}"
+        except OSError:
+            hit = "?"
+        _volume_cache[parent] = hit
+    return hit
+
+
+def drive_type(drive: str) -> int | None:
+    """GetDriveTypeW for a drive letter ("Z:"); None off Windows or when it can't be told."""
+    drive = drive.upper()
+    if sys.platform != "win32" or len(drive) != 2 or not drive.endswith(":"):
+        return None
+    if drive not in _drive_types:
+        try:
+            import ctypes
+            _drive_types[drive] = ctypes.windll.kernel32.GetDriveTypeW(drive + "\\")
+        except Exception:
+            return None
+    return _drive_types[drive]
+
+
+def default_limit(volume: str) -> int:
+    if volume.startswith("\\\\"):
+        return NETWORK_LIMIT
+    if drive_type(volume) in (DRIVE_REMOVABLE, DRIVE_REMOTE):
+        return NETWORK_LIMIT
+    return LOCAL_LIMIT
+
+
+# ---------------- Jobs ----------------
+class _Job:
+    __slots__ = ("key", "fn", "volume", "priority", "requests", "submitted", "started", "cancelled")
+
+    def __init__(self, key: Hashable, fn: Callable[[], Any], volume: str, priority: int):
+        self.key = key
+        self.fn = fn
+        self.volume = volume
+        self.priority = priority
+        self.requests: list[IORequest] = []
+        self.submitted = time.perf_counter()
+        self.started = False
+        self.cancelled = False
+
+
+class IORequest:
+    """Handle returned by IOScheduler.submit(); cancel() drops interest in the result."""
+
+    def __init__(self, scheduler: "IOScheduler", job: _Job, callback: Callable[[Any], None] | None):
+        self._scheduler = scheduler
+        self.job = job
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        self._scheduler._cancel(self)
+
+
+class _Volume:
+    __slots__ = ("limit", "queue", "queued", "running", "completed", "wait_total", "run_total", "last_latency")
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.queue: list[tuple[int, int, _Job]] = []
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.wait_total = 0.0
+        self.run_total = 0.0
+        self.last_latency = 0.0
+
+
+# ---------------- Scheduler ----------------
+class IOScheduler(QObject):
+    """Runs file-system jobs for all zones with per-volume concurrency caps.
+
+    Identical pending requests (same key) share one job; callbacks run on the
+    GUI thread. Jobs already running are never joined, so a request made after
+    a change always sees a listing taken after it. A job that raises calls
+    back with None.
+    """
+    _completed = pyqtSignal(object, object, object)
+
+    def __init__(self, limits: dict[str, int] | None = None, parent=None):
+        super().__init__(parent)
+        self.limits = dict(limits or {})
+        self._lock = threading.Lock()
+        self._volumes: dict[str, _Volume] = {}
+        self._pending: dict[Hashable, _Job] = {}
+        self._seq = itertools.count()
+        self._completed.connect(self._deliver)
+
+    def submit(self, key: Hashable, fn: Callable[[], Any], path: str, priority: int = VISIBLE,
+               callback: Callable[[Any], None] | None = None) -> IORequest:
+        volume = volume_of(path)
+        with self._lock:
+            vol = self._volume(volume)
+            job = self._pending.get(key)
+            if job is None:
+                job = _Job(key, fn, volume, priority)
+                self._pending[key] = job
+                vol.queued += 1
+                heapq.heappush(vol.queue, (priority, next(self._seq), job))
+                metrics.inc("io_jobs_submitted")
+            else:
+                metrics.inc("io_jobs_deduplicated")
+                if priority < job.priority:
+                    # re-queue at the higher class; the old heap entry is skipped later
+                    job.priority = priority
+                    heapq.heappush(vol.queue, (priority, next(self._seq), job))
+            req = IORequest(self, job, callback)
+            job.requests.append(req)
+            start = vol.running < vol.limit
+            if start:
+                vol.running += 1
+        if start:
+            threading.Thread(target=self._work, args=(volume,), daemon=True).start()
+        return req
+
+    def _volume(self, volume: str) -> _Volume:
+        vol = self._volumes.get(volume)
+        if vol is None:
+            vol = self._volumes[volume] = _Volume(self.limits.get(volume) or default_limit(volume))
+        return vol
+
+    def _cancel(self, req: IORequest):
+        with self._lock:
+            if req.cancelled:
+                return
+            req.cancelled = True
+            job = req.job
+            if req in job.requests:
+                job.requests.remove(req)
+            if not job.requests and not job.started and not job.cancelled:
+                job.cancelled = True
+                self._pending.pop(job.key, None)
+                self._volumes[job.volume].queued -= 1
+                metrics.inc("io_jobs_cancelled")
+
+    def _next(self, vol: _Volume) -> _Job | None:
+        while vol.queue:
+            priority, _, job = heapq.heappop(vol.queue)
+            if job.started or job.cancelled or priority != job.priority:
+                continue
+            job.started = True
+            vol.queued -= 1
+            self._pending.pop(job.key, None)
+            return job
+        return None
+
+    def _work(self, volume: str):
+        while True:
+            with self._lock:
+                vol = self._volumes[volume]
+                job = self._next(vol)
+                if job is None:
+                    vol.running -= 1
+                    return
+            t0 = time.perf_counter()
+            try:
+                result, error = job.fn(), None
+            except Exception as e:
+                result, error = None, e
+            t1 = time.perf_counter()
+            with self._lock:
+                vol.completed += 1
+                vol.wait_total += t0 - job.submitted
+                vol.run_total += t1 - t0
+                vol.last_latency = t1 - job.submitted
+            self._completed.emit(job, result, error)
+
+    def _deliver(self, job: _Job, result, error):
+        if error is not None:
+            # callers still hear back (with None) so they can drop their in-flight state
+            print(f"[IO] {job.key!r} failed: {error}")
+        with self._lock:
+            requests = [r for r in job.requests if not r.cancelled]
+        for req in requests:
+            if req.callback is not None:
+                try:
+                    req.callback(result)
+                except Exception as e:
+                    print(f"[IO] Callback for {job.key!r} failed: {e}")
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Per-volume queue depth, running jobs and latency totals."""
+        with self._lock:
+            return {name: {"limit": v.limit, "queued": v.queued, "running": v.running,
+                           "completed": v.completed, "wait_seconds_total": v.wait_total,
+                           "run_seconds_total": v.run_total, "last_latency_seconds": v.last_latency}
+                    for name, v in self._volumes.items()}
+
+
+_scheduler: IOScheduler | None = None
+
+
+def scheduler() -> IOScheduler:
+    """The process-wide scheduler; created on first use (from the GUI thread)."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = IOScheduler()
+    return _scheduler
+
+
+def current() -> IOScheduler | None:
+    return _scheduler
@@ -0,0 +1,198 @@
+"""Input-to-paint latency for everyday zone interactions.
+
+    python latencybench.py --files 300 --samples 200
+    python latencybench.py --files 2000 --only search
+
+Scripted input is replayed as synthetic Qt events and the time until the
+result reaches the screen is measured:
+
+  search     key press in the search box -> first paint of the filtered grid
+  drag       mouse move on the title bar  -> the zone window actually moves
+  customize  spin-box step in the Local customizer -> first paint of the zone
+
+A drag needs no repaint (the compositor moves the window), so its end point
+is the move itself, which includes waiting for the refresh-rate-capped frame
+tick. Runs headless with QT_QPA_PLATFORM=offscreen; zone configs are written
+to a temporary folder.
+"""
+from __future__ import annotations
+import argparse, os, sys, tempfile, time
+
+TIMEOUT = 2.0  # seconds to wait for a paint before counting the sample as lost
+INTERACTIONS = ("search", "drag", "customize")
+
+
+class PaintProbe:
+    """Application-wide event filter noting when a watched window next paints (or moves)."""
+
+    def __init__(self, app):
+        from PyQt6.QtCore import QObject, QEvent
+
+        probe = self
+
+        class _Filter(QObject):
+            def eventFilter(self, obj, event):
+                if probe.armed and event.type() in probe.types:
+                    window = obj.window() if hasattr(obj, "window") else None
+                    if window is probe.target:
+                        probe.hit = time.perf_counter()
+                        probe.armed = False
+                return False
+
+        self.app = app
+        self.armed = False
+        self.hit = 0.0
+        self.target = None
+        self.types = (QEvent.Type.Paint,)
+        self._filter = _Filter()
+        app.installEventFilter(self._filter)
+
+    def measure(self, target, send, types=None) -> float | None:
+        """Run `send()` and return ms until `target` paints, or None on timeout."""
+        from PyQt6.QtCore import QEvent
+        self.app.processEvents()  # start from a quiet event queue
+        self.target = target
+        self.types = types or (QEvent.Type.Paint,)
+        self.hit = 0.0
+        self.armed = True
+        t0 = time.perf_counter()
+        send()
+        while self.armed and time.perf_counter() - t0 < TIMEOUT:
+            self.app.processEvents()
+        self.armed = False
+        return (self.hit - t0) * 1000 if self.hit else None
+
+
+def percentile(values: list[float], q: float) -> float:
+    values = sorted(values)
+    if not values:
+        return 0.0
+    k = (len(values) - 1) * q
+    lo = int(k)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+
+# ---------------- Scripts ----------------
+def run_search(app, probe, zone, samples: int) -> list[float | None]:
+    from PyQt6.QtGui import QKeyEvent
+    from PyQt6.QtCore import QEvent, Qt
+    if zone.search_bar is None:
+        zone.open_zone_menu(None)
+    bar = zone.search_bar
+    bar.setFocus()
+    script = "file_1"
+    out = []
+    for i in range(samples):
+        typing = i % (2 * len(script)) < len(script)
+        if typing:
+            ch = script[i % len(script)]
+            key, text = Qt.Key.Key_A, ch  # the key code doesn't matter to QLineEdit, the text does
+        else:
+            key, text = Qt.Key.Key_Backspace, ""
+
+        def send():
+            app.sendEvent(bar, QKeyEvent(QEvent.Type.KeyPress, key, Qt.KeyboardModifier.NoModifier, text))
+            app.sendEvent(bar, QKeyEvent(QEvent.Type.KeyRelease, key, Qt.KeyboardModifier.NoModifier, text))
+        out.append(probe.measure(zone, send))
+    return out
+
+
+def run_drag(app, probe, zone, samples: int) -> list[float | None]:
+    from PyQt6.QtGui import QMouseEvent
+    from PyQt6.QtCore import QEvent, Qt, QPointF
+    title = zone.title_bar
+    local = QPointF(title.width() / 2, title.height() / 2)
+    start = QPointF(title.mapToGlobal(local.toPoint()))
+
+    def mouse(kind, pos, buttons):
+        return QMouseEvent(kind, title.mapFromGlobal(pos.toPoint()).toPointF(), pos, pos,
+                           Qt.MouseButton.LeftButton if kind != QEvent.Type.MouseMove else Qt.MouseButton.NoButton,
+                           buttons, Qt.KeyboardModifier.NoModifier)
+
+    app.sendEvent(title, mouse(QEvent.Type.MouseButtonPress, start, Qt.MouseButton.LeftButton))
+    out = []
+    pos = QPointF(start)
+    for i in range(samples):
+        step = 37 if (i // 10) % 2 == 0 else -37  # wander back and forth, away from snap targets
+        pos = QPointF(pos.x() + step, pos.y() + 3 * (1 if i % 2 else -1))
+        ev = mouse(QEvent.Type.MouseMove, pos, Qt.MouseButton.LeftButton)
+        out.append(probe.measure(zone, lambda ev=ev: app.sendEvent(title, ev), (QEvent.Type.Move,)))
+    app.sendEvent(title, mouse(QEvent.Type.MouseButtonRelease, pos, Qt.MouseButton.NoButton))
+    return out
+
+
+def run_customize(app, probe, zone, samples: int) -> list[float | None]:
+    from PyQt6.QtGui import QKeyEvent
+    from PyQt6.QtCore import QEvent, Qt
+    from customizer import CustomizerDialog
+    dlg = CustomizerDialog(zone, zone, mode="Local")
+    spin, override = dlg.widgets["text_size"]
+    override.setChecked(True)
+    dlg.show()
+    out = []
+    for i in range(samples):
+        key = Qt.Key.Key_Up if (i // 4) % 2 == 0 else Qt.Key.Key_Down
+
+        def send(key=key):
+            app.sendEvent(spin, QKeyEvent(QEvent.Type.KeyPress, key, Qt.KeyboardModifier.NoModifier))
+            app.sendEvent(spin, QKeyEvent(QEvent.Type.KeyRelease, key, Qt.KeyboardModifier.NoModifier))
+        out.append(probe.measure(zone, send))
+    dlg.close()
+    dlg.deleteLater()
+    return out
+
+
+# ---------------- Runner ----------------
+def make_zone(folder: str, files: int):
+    from PyQt6.QtCore import QRect
+    from zone import Zone
+    from saver import DEFAULT_GLOBALS
+    os.makedirs(folder, exist_ok=True)
+    for i in range(files):
+        open(os.path.join(folder, f"file_{i:05d}.{('txt', 'pdf', 'png')[i % 3]}"), "a").close()
+    z = Zone("Latency", folder, dict(DEFAULT_GLOBALS))
+    z.refresh_grid()
+    z.setGeometry(QRect(400, 300, z.width(), z.height()))
+    z.show()
+    return z
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--files", type=int, default=300, help="entries in the zone's folder")
+    ap.add_argument("--samples", type=int, default=100, help="inputs per interaction")
+    ap.add_argument("--warmup", type=int, default=5, help="inputs per interaction that aren't counted")
+    ap.add_argument("--only", choices=INTERACTIONS, action="append", help="run just these interactions")
+    args = ap.parse_args(argv)
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["LOCALAPPDATA"] = os.path.join(tmp, "appdata")
+        from PyQt6.QtWidgets import QApplication
+        app = QApplication.instance() or QApplication(sys.argv[:1])
+        probe = PaintProbe(app)
+        zone = make_zone(os.path.join(tmp, "zone"), args.files)
+        app.processEvents()
+
+        runners = {"search": run_search, "drag": run_drag, "customize": run_customize}
+        results = {}
+        for name in args.only or INTERACTIONS:
+            runners[name](app, probe, zone, args.warmup)
+            results[name] = runners[name](app, probe, zone, args.samples)
+        zone.close()
+        zone.deleteLater()
+        app.processEvents()
+
+    print(f"zone with {args.files} entries, {args.samples} samples per interaction\n")
+    print(f"{'interaction':<12}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}{'lost':>6}")
+    for name, values in results.items():
+        got = [v for v in values if v is not None]
+        lost = len(values) - len(got)
+        print(f"{name:<12}{percentile(got, .50):>9.2f}{percentile(got, .95):>9.2f}"
+              f"{percentile(got, .99):>9.2f}{max(got, default=0.0):>9.2f}{lost:>6}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+from __future__ import annotations
+import os, sys, threading, time
+from collections import defaultdict
+from contextlib import contextmanager
+
+# Process-wide counters, cheap enough to bump from hot paths and worker threads.
+counters: defaultdict[str, float] = defaultdict(float)
+last: dict[str, float] = {}
+_lock = threading.Lock()
+
+
+def inc(name: str, n: float = 1):
+    with _lock:
+        counters[name] += n
+
+
+def observe(name: str, seconds: float):
+    """Record one duration: <name>_seconds_total, <name>_total and the last value."""
+    with _lock:
+        counters[name + "_seconds_total"] += seconds
+        counters[name + "_total"] += 1
+        last[name + "_seconds"] = seconds
+
+
+@contextmanager
+def timed(name: str):
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - t0)
+
+
+def snapshot() -> tuple[dict[str, float], dict[str, float]]:
+    with _lock:
+        return dict(counters), dict(last)
+
+
+def process_rss() -> int:
+    """Resident set size in bytes (0 if it can't be determined)."""
+    try:
+        import psutil  # optional
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+
+            class PMC(ctypes.Structure):
+                _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                            ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                            ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+            pmc = PMC()
+            pmc.cb = ctypes.sizeof(PMC)
+            ctypes.windll.psapi.GetProcessMemoryInfo(ctypes.windll.kernel32.GetCurrentProcess(),
+                                                     ctypes.byref(pmc), pmc.cb)
+            return int(pmc.WorkingSetSize)
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        return 0
+
+
+# ---------------- Collection / export ----------------
+PREFIX = "floatboard_"
+
+# counters recorded with observe(); exported as Prometheus summaries (_sum/_count)
+DURATIONS = {
+    "refresh_grid": "Time spent rebuilding zone grids",
+    "folder_listing": "Time spent listing folders",
+    "virtual_scan": "Time for complete virtual-zone scans",
+    "zone_save": "Time spent writing zone configs",
+    "profile_switch": "Time spent swapping the visible zone set for another profile",
+    "folder_size": "Time spent measuring recursive folder sizes",
+    "archive_index": "Time spent reading zip central directories",
+    "archive_extract": "Time spent extracting single zip members",
+    "preview": "Time spent reading files for hover previews",
+}
+
+
+def _value(v: float) -> str:
+    v = float(v)
+    return str(int(v)) if v.is_integer() else repr(v)
+
+
+def _label(v: str) -> str:
+    return str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def collect(zones) -> list[tuple[str, str, str, dict, float]]:
+    """Current figures as (name, type, help, labels, value) rows."""
+    from PyQt6.QtWidgets import QWidget
+    import idle
+    import ioscheduler
+    import zone as zone_mod
+    totals, _last = snapshot()
+    rows = [
+        ("zones", "gauge", "Number of zones", {}, len(zones)),
+        ("process_resident_memory_bytes", "gauge", "Resident set size", {}, process_rss()),
+        ("cells_built_total", "counter", "Grid cells built since start", {}, totals.get("cells_built", 0)),
+        ("icon_cache_entries", "gauge", "Icons in the shared icon cache", {}, zone_mod.icon_cache_size()),
+        ("icon_cache_hits_total", "counter", "Icon cache hits", {}, totals.get("icon_cache_hits", 0)),
+        ("icon_cache_misses_total", "counter", "Icon cache misses", {}, totals.get("icon_cache_misses", 0)),
+        ("pending_saves", "gauge", "Zones with a scheduled, unwritten save", {},
+         sum(1 for z in zones if getattr(z, "save_pending", False))),
+        ("repaints_avoided_total", "counter", "Paint events served from idle snapshots", {}, idle.repaints_avoided),
+    ]
+    for name, help_text in DURATIONS.items():
+        rows.append((f"{name}_seconds", "summary", help_text, {"_": "sum"}, totals.get(name + "_seconds_total", 0)))
+        rows.append((f"{name}_seconds", "summary", help_text, {"_": "count"}, totals.get(name + "_total", 0)))
+    io = ioscheduler.current()
+    for volume, v in sorted((io.stats() if io else {}).items()):
+        lbl = {"volume": volume}
+        rows += [
+            ("io_queue_depth", "gauge", "I/O jobs waiting per volume", lbl, v["queued"]),
+            ("io_running", "gauge", "I/O jobs running per volume", lbl, v["running"]),
+            ("io_wait_seconds", "summary", "Time I/O jobs spent queued", dict(lbl, _="sum"), v["wait_seconds_total"]),
+            ("io_wait_seconds", "summary", "Time I/O jobs spent queued", dict(lbl, _="count"), v["completed"]),
+            ("io_run_seconds", "summary", "Time I/O jobs spent running", dict(lbl, _="sum"), v["run_seconds_total"]),
+            ("io_run_seconds", "summary", "Time I/O jobs spent running", dict(lbl, _="count"), v["completed"]),
+        ]
+    rows += [
+        ("io_jobs_submitted_total", "counter", "I/O jobs queued", {}, totals.get("io_jobs_submitted", 0)),
+        ("io_jobs_deduplicated_total", "counter", "I/O requests joined to an identical pending job", {},
+         totals.get("io_jobs_deduplicated", 0)),
+        ("io_jobs_cancelled_total", "counter", "I/O jobs dropped before they ran", {}, totals.get("io_jobs_cancelled", 0)),
+    ]
+    rows.append(("preview_cache_hits_total", "counter", "Hover previews served from the cache", {},
+                 totals.get("preview_cache_hits", 0)))
+    for i, z in enumerate(zones):
+        lbl = {"zone": z.title_bar.text(), "id": str(i)}
+        rows += [
+            ("zone_widgets", "gauge", "Live widgets owned by the zone", lbl, len(z.findChildren(QWidget))),
+            ("zone_files", "gauge", "Entries listed in the zone", lbl, len(z.file_list)),
+            ("zone_cells_built_total", "counter", "Cells built by the zone", lbl, z.cells_built),
+            ("zone_last_refresh_seconds", "gauge", "Duration of the zone's last grid refresh", lbl, z.last_refresh_ms / 1000),
+            ("zone_repaints_avoided_total", "counter", "Paint events served from the zone's snapshot", lbl, z.repaints_avoided),
+            ("zone_idle", "gauge", "1 if the zone is showing its idle snapshot", lbl, 1 if z.idle else 0),
+        ]
+    return rows
+
+
+def to_prometheus(rows) -> str:
+    # each family must be one contiguous block; rows come per volume / per zone, so group by name
+    families: dict[str, list] = {}
+    for row in rows:
+        families.setdefault(row[0], []).append(row)
+    out: list[str] = []
+    for name, family in families.items():
+        full = PREFIX + name
+        out.append(f"# HELP {full} {family[0][2]}")
+        out.append(f"# TYPE {full} {family[0][1]}")
+        for _name, _kind, _help, labels, value in family:
+            labels = dict(labels)
+            suffix = "_" + labels.pop("_") if "_" in labels else ""
+            lbl = ",".join(f'{k}="{_label(v)}"' for k, v in labels.items())
+            out.append(f"{full}{suffix}{{{lbl}}} {_value(value)}" if lbl else f"{full}{suffix} {_value(value)}")
+    return "\n".join(out) + "\n"
+
+
+def write_metrics_file(path, zones) -> None:
+    """Write atomically so a collector never reads a half-written file."""
+    path = str(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(to_prometheus(collect(zones)))
+    os.replace(tmp, path)
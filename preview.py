@@ -0,0 +1,221 @@
+from __future__ import annotations
+import mmap, os
+
+from PyQt6.QtCore import Qt, QSize, QPoint, QRect
+from PyQt6.QtGui import QImage, QImageReader, QPixmap, QFont
+from PyQt6.QtWidgets import QFrame, QLabel, QVBoxLayout, QApplication
+
+import ioscheduler
+import metrics
+from foldercache import LRUCache, shared_listings
+from foldersize import format_size
+
+HEAD_BYTES = 192 * 1024   # mapped from the start of a text file
+TAIL_BYTES = 64 * 1024    # and from its end, when the file is bigger than both together
+MAX_LINES = 20            # lines shown from each end
+MAX_LINE_CHARS = 160
+PREVIEW_SIZE = (360, 260)  # images are decoded straight to this bound
+CACHE_SIZE = 32
+HOVER_DELAY_MS = 350
+
+TEXT_EXTENSIONS = (".txt", ".log", ".md", ".csv", ".tsv", ".json", ".xml", ".yaml", ".yml", ".ini",
+                   ".cfg", ".conf", ".toml", ".py", ".js", ".ts", ".html", ".css", ".c", ".h",
+                   ".cpp", ".cs", ".java", ".sh", ".bat", ".ps1", ".sql")
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".webp", ".tif", ".tiff", ".ico")
+
+
+def can_preview(path: str) -> bool:
+    return str(path).lower().endswith(TEXT_EXTENSIONS + IMAGE_EXTENSIONS)
+
+
+class Preview:
+    """What the popup shows for one file: some text or a scaled image, plus a short detail line."""
+
+    def __init__(self, mtime: float, text: str | None = None, image: QImage | None = None, detail: str = ""):
+        self.mtime = mtime
+        self.text = text
+        self.image = image
+        self.detail = detail
+
+
+# ---------------- Bounded reads ----------------
+def _mapped(f, size: int, offset: int, length: int) -> bytes:
+    """`length` bytes at `offset`, mapping only that window of the file (plus alignment slack)."""
+    start = offset - offset % mmap.ALLOCATIONGRANULARITY
+    length = min(length, size - offset)
+    with mmap.mmap(f.fileno(), length + offset - start, offset=start, access=mmap.ACCESS_READ) as m:
+        return m[offset - start:]
+
+
+def _lines(data: bytes) -> list[str]:
+    text = data.decode("utf-8", errors="replace").lstrip("\ufeff")
+    return [ln if len(ln) <= MAX_LINE_CHARS else ln[:MAX_LINE_CHARS - 1] + "…" for ln in text.splitlines()]
+
+
+def read_text(path: str) -> tuple[str, str] | None:
+    """(text, detail) from the head and tail of a text file, or None if it looks binary."""
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return "", "empty"
+        whole = size <= HEAD_BYTES + TAIL_BYTES
+        head = _mapped(f, size, 0, size if whole else HEAD_BYTES)
+        tail = b"" if whole else _mapped(f, size, size - TAIL_BYTES, TAIL_BYTES)
+    if b"\0" in head[:8192]:
+        return None
+    if whole:
+        lines = _lines(head)
+        if len(lines) <= 2 * MAX_LINES:
+            return "\n".join(lines), format_size(size)
+        end = lines[-MAX_LINES:]
+        skipped = f"··· {len(lines) - 2 * MAX_LINES} lines ···"
+    else:
+        cut = head.rfind(b"\n")
+        lines = _lines(head[:cut] if cut > 0 else head)  # drop the partial last line
+        end = _lines(tail.split(b"\n", 1)[-1])[-MAX_LINES:]  # and the partial first one
+        skipped = f"··· {format_size(size - HEAD_BYTES - TAIL_BYTES)} not read ···"
+    return "\n".join(lines[:MAX_LINES] + [skipped] + end), format_size(size)
+
+
+def read_image(path: str) -> tuple[QImage, str] | None:
+    """The image decoded at preview size (JPEG decoders scale while decoding), and its full size."""
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    full = reader.size()
+    bound = QSize(*PREVIEW_SIZE)
+    if full.isValid() and (full.width() > bound.width() or full.height() > bound.height()):
+        reader.setScaledSize(full.scaled(bound, Qt.AspectRatioMode.KeepAspectRatio))
+    image = reader.read()
+    if image.isNull():
+        return None
+    return image, f"{full.width()} × {full.height()}" if full.isValid() else ""
+
+
+def build(path: str) -> Preview | None:
+    """Runs on an I/O worker; QImage (unlike QPixmap) is safe off the GUI thread."""
+    try:
+        mtime = os.stat(path).st_mtime
+        with metrics.timed("preview"):
+            if path.lower().endswith(IMAGE_EXTENSIONS):
+                got = read_image(path)
+                size = format_size(os.stat(path).st_size)
+                return Preview(mtime, image=got[0], detail=f"{got[1]}, {size}" if got[1] else size) if got else None
+            got = read_text(path)
+            return Preview(mtime, text=got[0], detail=got[1]) if got else None
+    except (OSError, ValueError) as e:
+        print(f"[Preview] {path}: {e}")
+        return None
+
+
+# ---------------- Cache / cancellation ----------------
+class Previews:
+    """Builds previews on the I/O scheduler, at most one wanted at a time, kept in a small LRU.
+
+    Asking for a new preview drops interest in the previous one: a job still
+    queued never runs, and a running one (bounded reads, so short) is ignored.
+    """
+
+    def __init__(self, capacity: int = CACHE_SIZE):
+        self._cache = LRUCache(capacity)
+        self._request: ioscheduler.IORequest | None = None
+
+    def request(self, path: str, callback):
+        """`callback(Preview | None)` on the GUI thread; right away on a cache hit."""
+        self.cancel()
+        path = str(path)
+        mtime = shared_listings().mtime_of(path)
+        hit = self._cache.get((path, mtime)) if mtime is not None else None
+        if hit is not None:
+            metrics.inc("preview_cache_hits")
+            callback(hit)
+            return
+
+        def done(result):
+            self._request = None
+            if result is not None:
+                self._cache.put((path, result.mtime), result)
+            callback(result)
+        self._request = ioscheduler.scheduler().submit(("preview", path), lambda: build(path), path,
+                                                       ioscheduler.VISIBLE, done)
+
+    def cancel(self):
+        if self._request is not None:
+            self._request.cancel()
+            self._request = None
+
+
+_previews: Previews | None = None
+
+
+def previews() -> Previews:
+    global _previews
+    if _previews is None:
+        _previews = Previews()
+    return _previews
+
+
+# ---------------- Popup ----------------
+class PreviewPopup(QFrame):
+    """Tooltip-style window next to the hovered cell."""
+
+    def __init__(self):
+        super().__init__(None, Qt.WindowType.ToolTip | Qt.WindowType.FramelessWindowHint)
+        self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating)
+        self.setStyleSheet("QFrame { background:#202020; border:1px solid #555; } QLabel { color:#e0e0e0; border:none; }")
+        v = QVBoxLayout(self)
+        v.setContentsMargins(6, 4, 6, 6)
+        v.setSpacing(4)
+        self.header = QLabel()
+        font = QFont()
+        font.setBold(True)
+        self.header.setFont(font)
+        self.body = QLabel()
+        self.body.setTextFormat(Qt.TextFormat.PlainText)
+        self.body.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        mono = QFont("Consolas")
+        mono.setStyleHint(QFont.StyleHint.Monospace)
+        mono.setPixelSize(11)
+        self.body.setFont(mono)
+        self.body.setMaximumWidth(PREVIEW_SIZE[0] * 2)
+        v.addWidget(self.header)
+        v.addWidget(self.body)
+
+    def show_for(self, anchor: QRect, title: str, preview: Preview | None):
+        detail = preview.detail if preview is not None else ""
+        self.header.setText(f"{title}   {detail}" if detail else title)
+        self.body.clear()
+        if preview is not None and preview.image is not None:
+            self.body.setPixmap(QPixmap.fromImage(preview.image))
+        elif preview is not None and preview.text:
+            self.body.setText(preview.text)
+        self.body.setVisible(preview is not None and (preview.image is not None or bool(preview.text)))
+        self.adjustSize()
+        self.move(self._place(anchor))
+        self.show()
+        self.raise_()
+
+    def _place(self, anchor: QRect) -> QPoint:
+        """Right of the cell, or left of it if that runs off the screen; kept on screen vertically."""
+        screen = QApplication.screenAt(anchor.center()) or QApplication.primaryScreen()
+        area = screen.availableGeometry() if screen is not None else QRect(0, 0, 1 << 15, 1 << 15)
+        x = anchor.right() + 8
+        if x + self.width() > area.right():
+            x = max(area.left(), anchor.left() - 8 - self.width())
+        y = min(max(anchor.top(), area.top()), area.bottom() - self.height())
+        return QPoint(x, max(y, area.top()))
+
+
+_popup: PreviewPopup | None = None
+
+
+def popup() -> PreviewPopup:
+    global _popup
+    if _popup is None:
+        _popup = PreviewPopup()
+    return _popup
+
+
+def hide_popup():
+    previews().cancel()
+    if _popup is not None:
+        _popup.hide()
@@ -0,0 +1,201 @@
+from __future__ import annotations
+import heapq, os, threading
+from typing import Hashable
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+import ioscheduler
+from foldercache import shared_listings
+
+RECENT_CAPACITY = 200   # entries kept ranked; a Recent zone shows up to this many
+DEFAULT_RECENT = 30
+
+
+class RecentIndex(QObject):
+    """The most recently modified files across every zone, kept up to date incrementally.
+
+    Zones register what they show (a folder, or the paths of a virtual zone).
+    Folder contents arrive from the shared listing cache whenever a folder is
+    re-read, so the index never lists anything itself. Only the top
+    `capacity` entries sit in a min-heap; it is rebuilt from the known mtimes
+    (no disk access) only when one of its own members is removed or changes.
+    """
+    changed = pyqtSignal()
+
+    def __init__(self, capacity: int = RECENT_CAPACITY, parent=None):
+        super().__init__(parent)
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._owners: dict[int, Hashable] = {}          # id(zone) -> source key
+        self._users: dict[Hashable, int] = {}           # source key -> zones using it
+        self._contrib: dict[Hashable, dict[str, float]] = {}
+        self._refs: dict[str, int] = {}
+        self._mtimes: dict[str, float] = {}
+        self._heap: list[tuple[float, str]] = []
+        self._in_top: set[str] = set()
+        self._dirty = False
+
+    # ---------------- Sources ----------------
+    def set_folder(self, owner, folder: str | None):
+        """`owner` now shows `folder` (None: nothing, e.g. parked)."""
+        if folder and ".zip" in folder.lower():
+            import archive
+            if archive.split_archive(folder):
+                folder = None  # members of an archive aren't files anyone edits
+        key = ("folder", os.path.normpath(folder)) if folder else None
+        entries = None
+        if key is not None:
+            cached = shared_listings().peek(key[1])
+            if cached is not None:
+                entries = _file_entries(*cached)
+        self._set_source(owner, key, entries)
+
+    def set_paths(self, owner, paths: list[str]):
+        """`owner` shows an explicit list of paths (virtual zones)."""
+        key = ("zone", id(owner))
+        known, missing = {}, []
+        for p in paths:
+            m = self._cached_mtime(p)
+            if m is None:
+                missing.append(p)
+            else:
+                known[p] = m
+        self._set_source(owner, key, known)
+        if missing:
+            def stat_all():
+                out = {}
+                for p in missing:
+                    try:
+                        st = os.stat(p)
+                    except OSError:
+                        continue
+                    if not os.path.isdir(p):
+                        out[p] = st.st_mtime
+                return out
+
+            def done(found):
+                with self._lock:
+                    if self._owners.get(id(owner)) != key:
+                        return
+                    self._apply(key, dict(self._contrib.get(key, {}), **(found or {})))
+                self.changed.emit()
+            ioscheduler.scheduler().submit(("recent-stat", id(owner), len(paths)), stat_all,
+                                           missing[0], ioscheduler.BACKGROUND, done)
+
+    def remove(self, owner):
+        self._set_source(owner, None, None)
+
+    def _cached_mtime(self, path: str) -> float | None:
+        cached = shared_listings().peek(os.path.dirname(path))
+        if cached is None:
+            return None
+        files, dirs, mtimes = cached
+        return None if path in dirs else mtimes.get(path)
+
+    def _set_source(self, owner, key, entries):
+        with self._lock:
+            old = self._owners.get(id(owner))
+            if old != key:
+                if old is not None:
+                    self._release(old)
+                if key is None:
+                    self._owners.pop(id(owner), None)
+                else:
+                    self._owners[id(owner)] = key
+                    self._users[key] = self._users.get(key, 0) + 1
+            if key is not None and entries is not None:
+                self._apply(key, entries)
+        self.changed.emit()
+
+    def _release(self, key):
+        self._users[key] -= 1
+        if self._users[key] <= 0:
+            del self._users[key]
+            self._apply(key, {})
+            self._contrib.pop(key, None)
+
+    def on_listing(self, folder: str, files: list[str], dirs: frozenset, mtimes: dict[str, float]):
+        """ListingCache listener; may run on an I/O worker thread."""
+        key = ("folder", os.path.normpath(folder))
+        with self._lock:
+            if key not in self._users:
+                return
+            self._apply(key, _file_entries(files, dirs, mtimes))
+        self.changed.emit()
+
+    # ---------------- Ranking ----------------
+    def _apply(self, key, entries: dict[str, float]):
+        old = self._contrib.get(key, {})
+        for p in old.keys() - entries.keys():
+            self._unref(p)
+        for p, m in entries.items():
+            before = old.get(p)
+            if before is None:
+                self._ref(p, m)
+            elif before != m:
+                self._touch(p, m)
+        self._contrib[key] = entries
+
+    def _ref(self, path: str, mtime: float):
+        self._refs[path] = self._refs.get(path, 0) + 1
+        if self._refs[path] == 1:
+            self._mtimes[path] = mtime
+            self._offer(path, mtime)
+        elif self._mtimes[path] != mtime:
+            self._touch(path, mtime)
+
+    def _unref(self, path: str):
+        self._refs[path] -= 1
+        if self._refs[path] <= 0:
+            del self._refs[path]
+            del self._mtimes[path]
+            if path in self._in_top:
+                self._dirty = True
+
+    def _touch(self, path: str, mtime: float):
+        self._mtimes[path] = mtime
+        if path in self._in_top:
+            self._dirty = True  # its heap position is stale
+        else:
+            self._offer(path, mtime)
+
+    def _offer(self, path: str, mtime: float):
+        if self._dirty:
+            return  # the rebuild will see it
+        if len(self._heap) < self.capacity:
+            heapq.heappush(self._heap, (mtime, path))
+            self._in_top.add(path)
+        elif (mtime, path) > self._heap[0]:
+            _m, evicted = heapq.heapreplace(self._heap, (mtime, path))
+            self._in_top.discard(evicted)
+            self._in_top.add(path)
+
+    def top(self, n: int = DEFAULT_RECENT) -> list[str]:
+        """Up to `n` paths, newest first."""
+        with self._lock:
+            if self._dirty:
+                self._heap = heapq.nlargest(self.capacity, ((m, p) for p, m in self._mtimes.items()))
+                heapq.heapify(self._heap)
+                self._in_top = {p for _m, p in self._heap}
+                self._dirty = False
+            return [p for _m, p in heapq.nlargest(n, self._heap)]
+
+    def __len__(self):
+        with self._lock:
+            return len(self._mtimes)
+
+
+def _file_entries(files, dirs, mtimes) -> dict[str, float]:
+    return {p: mtimes[p] for p in files if p not in dirs and p in mtimes}
+
+
+_index: RecentIndex | None = None
+
+
+def index() -> RecentIndex:
+    """The process-wide index, hooked to the shared listing cache on first use."""
+    global _index
+    if _index is None:
+        _index = RecentIndex()
+        shared_listings().listeners.append(_index.on_listing)
+    return _index
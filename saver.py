@@ -2,17 +2,19 @@ from __future__ import annotations
 import os, json
 from pathlib import Path
 from typing import Any, Dict
-from PyQt6.QtGui import QColor
+from PyQt6.QtGui import QColor, QPixmap
 
 # Root: %LOCALAPPDATA%/EgansFloatboard/Zones  (fallback: HOME)
-BASE_DIR = Path(os.getenv("LOCALAPPDATA", Path.home())) / "EgansFloatboard" / "Zones"
+BASE_DIR = Path(os.getenv("LOCALAPPDATA", Path.home())) / "EgansFloatboard"
 ZONES_DIR = BASE_DIR / "Zones"
 SETTINGS_DIR = BASE_DIR / "Settings"
+PROFILES_DIR = BASE_DIR / "Profiles"
+SNAPSHOTS_DIR = BASE_DIR / "Snapshots"
+DEFAULT_PROFILE = "Default"  # lives in ZONES_DIR so existing setups keep working
 GLOBAL_CONFIG_FILE = SETTINGS_DIR / "global_config.json"
 
 # Project Root
 ASSETS_DIR = Path(__file__).resolve().parent / "Assets"
-ASSETS_DIR.mkdir(exist_ok=True)
 
 def asset_path(name: str) -> Path:
     p = ASSETS_DIR / name
@@ -33,11 +35,16 @@ DEFAULT_GLOBALS: Dict[str, Any] = {
     "title_bg": "#9f00f0",
     "title_text": "#ffffff",
     "folders_first": True,
+    "sort_by": "name",      # or "size" (folders by recursive size)
+    "hover_preview": False,  # popup with a text/image preview of the hovered file
+    "single_surface": False,
+    "active_profile": DEFAULT_PROFILE,
 }
 
-# Ensure folders exist
-for d in (ZONES_DIR, SETTINGS_DIR):
-    d.mkdir(parents=True, exist_ok=True)
+def ensure_dirs():
+    """Create the data folders. Called by the writers, never at import time."""
+    for d in (ZONES_DIR, SETTINGS_DIR):
+        d.mkdir(parents=True, exist_ok=True)
 
 def _serialize(v: Any) -> Any:
     return v.name() if isinstance(v, QColor) else v
@@ -47,99 +54,44 @@ def safe_name(name: str) -> str:
     s = s.replace(" ", "_")
     return (s or "Zone")[:60]
 
-def save_zone_config(zone_or_dict) -> Path:
-    """Accepts a Zone instance (preferred) or a dict from Zone.to_dict()."""
-    data = zone_or_dict.to_dict() if hasattr(zone_or_dict, "to_dict") else dict(zone_or_dict)
-    name = data.get("zone_name") or "Zone"
-    path = ZONES_DIR / f"{safe_name(name)}.json"
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-    return path
-
-def load_zone_files() -> list[Dict[str, Any]]:
-    zones: list[Dict[str, Any]] = []
-    for p in ZONES_DIR.glob("*.json"):
-        if p.name.lower() == GLOBAL_CONFIG_FILE.name.lower():
-            continue
-        try:
-            with open(p, "r", encoding="utf-8") as f:
-                zones.append(json.load(f))
-        except Exception:
-            pass
-    return zones
-
-def load_global_config() -> Dict[str, Any]:
-    if GLOBAL_CONFIG_FILE.exists():
-        try:
-            with open(GLOBAL_CONFIG_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            pass
-    return DEFAULT_GLOBALS.copy()
+# ---------------- Profiles ----------------
+_active_profile = DEFAULT_PROFILE
 
-def save_global_config(app_or_dict) -> Path:
-    if isinstance(app_or_dict, dict):from __future__ import annotations
-import os, json
-from pathlib import Path
-from typing import Any, Dict
-from PyQt6.QtGui import QColor
+def profile_dir(name: str) -> Path:
+    return ZONES_DIR if name == DEFAULT_PROFILE else PROFILES_DIR / safe_name(name)
 
-# Root: %LOCALAPPDATA%/EgansFloatboard/Zones  (fallback: HOME)
-BASE_DIR = Path(os.getenv("LOCALAPPDATA", Path.home())) / "EgansFloatboard"
-ZONES_DIR = BASE_DIR / "Zones"
-SETTINGS_DIR = BASE_DIR / "Settings"
-GLOBAL_CONFIG_FILE = SETTINGS_DIR / "global_config.json"
+def list_profiles() -> list[str]:
+    names = [DEFAULT_PROFILE]
+    if PROFILES_DIR.exists():
+        names += sorted(p.name for p in PROFILES_DIR.iterdir() if p.is_dir() and p.name != DEFAULT_PROFILE)
+    return names
 
-# Project Root
-ASSETS_DIR = Path(__file__).resolve().parent / "Assets"
-ASSETS_DIR.mkdir(exist_ok=True)
+def active_profile() -> str:
+    return _active_profile
 
-def asset_path(name: str) -> Path:
-    p = ASSETS_DIR / name
-    return p if p.exists() else Path(name)  # fallback
-
-DEFAULT_GLOBALS: Dict[str, Any] = {
-    "rows": 5,
-    "cols": 4,
-    "cell_icon_size": 48,
-    "text_size": 10,
-    "title_text_size": 14,
-    "title_height": 28,
-    "label_height": 16,
-    "scale_offset_x": 1,
-    "scale_offset_y": 1,
-    "bg_color": "#323232",
-    "name_color": "#ffffff",
-    "title_bg": "#9f00f0",
-    "title_text": "#ffffff",
-    "folders_first": True,
-}
-
-# Ensure folders exist
-for d in (ZONES_DIR, SETTINGS_DIR):
+def set_active_profile(name: str) -> Path:
+    """Point zone saving/loading at another profile, creating it if needed."""
+    global _active_profile
+    _active_profile = name if name == DEFAULT_PROFILE else safe_name(name)
+    d = profile_dir(_active_profile)
     d.mkdir(parents=True, exist_ok=True)
+    return d
 
-def _serialize(v: Any) -> Any:
-    return v.name() if isinstance(v, QColor) else v
-
-def safe_name(name: str) -> str:
-    s = "".join(c for c in (name or "") if c.isalnum() or c in "-_ ").strip()
-    s = s.replace(" ", "_")
-    return (s or "Zone")[:60]
-
-def save_zone_config(zone_or_dict) -> Path:
+def save_zone_config(zone_or_dict, profile: str | None = None) -> Path:
     """Accepts a Zone instance (preferred) or a dict from Zone.to_dict()."""
     data = zone_or_dict.to_dict() if hasattr(zone_or_dict, "to_dict") else dict(zone_or_dict)
     name = data.get("zone_name") or "Zone"
-    path = ZONES_DIR / f"{safe_name(name)}.json"
+    folder = profile_dir(profile or _active_profile)
+    folder.mkdir(parents=True, exist_ok=True)
+    path = folder / f"{safe_name(name)}.json"
     with open(path, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2)
     return path
 
-def load_zone_dicts() -> list[Dict[str, Any]]:
-    """Load raw zone JSONs into dictionaries."""
+def load_zone_dicts(profile: str | None = None) -> list[Dict[str, Any]]:
+    """Load raw zone JSONs of a profile (default: the active one) into dictionaries."""
     zones: list[Dict[str, Any]] = []
-    for p in ZONES_DIR.glob("*.json"):
+    for p in profile_dir(profile or _active_profile).glob("*.json"):
         if p.name.lower() == GLOBAL_CONFIG_FILE.name.lower():
             continue
         try:
@@ -149,6 +101,32 @@ def load_zone_dicts() -> list[Dict[str, Any]]:
             print(f"[Tray] Failed to load {p}:", e)
     return zones
 
+# ---------------- Zone snapshots ----------------
+def _snapshot_base(zone_name: str, profile: str | None = None) -> Path:
+    return SNAPSHOTS_DIR / f"{safe_name(profile or _active_profile)}__{safe_name(zone_name)}"
+
+def save_zone_snapshot(zone_name: str, pixmap: QPixmap, meta: Dict[str, Any], profile: str | None = None) -> Path:
+    """Store a rendered zone image plus its metadata (scroll position, listing fingerprint)."""
+    base = _snapshot_base(zone_name, profile)
+    SNAPSHOTS_DIR.mkdir(parents=True, exist_ok=True)
+    pixmap.save(str(base) + ".png", "PNG")  # PNG keeps the pixels but not the scale factor
+    with open(str(base) + ".json", "w", encoding="utf-8") as f:
+        json.dump({**meta, "dpr": pixmap.devicePixelRatio()}, f)
+    return base
+
+def load_zone_snapshot(zone_name: str, profile: str | None = None) -> tuple[QPixmap | None, Dict[str, Any]]:
+    base = _snapshot_base(zone_name, profile)
+    try:
+        with open(str(base) + ".json", "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except Exception:
+        return None, {}
+    pixmap = QPixmap(str(base) + ".png")
+    if pixmap.isNull():
+        return None, meta
+    pixmap.setDevicePixelRatio(float(meta.get("dpr") or 1.0))
+    return pixmap, meta
+
 def load_zone_objects(ZoneClass) -> list[Any]:
     """Return actual Zone widgets, given the Zone class."""
     zones = []
@@ -182,13 +160,7 @@ def save_global_config(app_or_dict) -> Path:
         data = app_or_dict
     else:
         data = {k: _serialize(getattr(app_or_dict, k, DEFAULT_GLOBALS[k])) for k in DEFAULT_GLOBALS}
-    with open(GLOBAL_CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-    return GLOBAL_CONFIG_FILE
-
-        data = app_or_dict
-    else:
-        data = {k: _serialize(getattr(app_or_dict, k, DEFAULT_GLOBALS[k])) for k in DEFAULT_GLOBALS}
+    ensure_dirs()
     with open(GLOBAL_CONFIG_FILE, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2)
     return GLOBAL_CONFIG_FILE
@@ -0,0 +1,282 @@
+"""Read Windows shortcuts (.lnk Shell Links and .url Internet Shortcuts) without the shell.
+
+    python shortcuts.py "C:\\Users\\me\\Desktop\\App.lnk"   # dump what was parsed
+
+Only the structures a zone needs are decoded: target path, arguments,
+working directory, icon location and URL. Everything is plain file parsing,
+so it behaves the same on any OS.
+"""
+from __future__ import annotations
+import ntpath, os, stat, struct, sys
+
+import ioscheduler
+from foldercache import LRUCache
+
+SHORTCUT_EXTENSIONS = (".lnk", ".url")
+
+LNK_HEADER_SIZE = 0x4C
+LNK_CLSID = bytes.fromhex("0114020000000000c000000000000046")
+
+# LinkFlags
+HAS_ID_LIST = 0x1
+HAS_LINK_INFO = 0x2
+HAS_NAME = 0x4
+HAS_RELATIVE_PATH = 0x8
+HAS_WORKING_DIR = 0x10
+HAS_ARGUMENTS = 0x20
+HAS_ICON_LOCATION = 0x40
+IS_UNICODE = 0x80
+
+# LinkInfoFlags
+VOLUME_ID_AND_LOCAL_BASE_PATH = 0x1
+COMMON_NETWORK_RELATIVE_LINK = 0x2
+
+# ExtraData block signatures
+ENVIRONMENT_BLOCK = 0xA0000001
+ICON_ENVIRONMENT_BLOCK = 0xA0000007
+
+ANSI = "cp1252"
+CACHE_SIZE = 4096
+
+
+class ShortcutError(ValueError):
+    pass
+
+
+class Shortcut:
+    """What a shortcut points at. `broken` is None when it can't be told cheaply (URLs, shares)."""
+
+    def __init__(self, kind: str, target: str = "", arguments: str = "", working_dir: str = "",
+                 icon_location: str = "", icon_index: int = 0, url: str = "", description: str = ""):
+        self.kind = kind
+        self.target = target
+        self.arguments = arguments
+        self.working_dir = working_dir
+        self.icon_location = icon_location
+        self.icon_index = icon_index
+        self.url = url
+        self.description = description
+        self.broken: bool | None = None
+        self.target_is_dir = False
+        self.has_icon_file = False  # icon_location is a local .ico that exists
+
+    def tooltip(self, name: str) -> str:
+        lines = [name]
+        if self.description:
+            lines.append(self.description)
+        if self.url:
+            lines.append(self.url)
+        elif self.target:
+            lines.append(f"\u2192 {self.target} {self.arguments}".rstrip())
+        if self.broken:
+            lines.append("Broken shortcut: target not found")
+        return "\n".join(lines)
+
+    def __repr__(self):
+        fields = ", ".join(f"{k}={v!r}" for k, v in vars(self).items() if v not in ("", 0, None))
+        return f"Shortcut({fields})"
+
+
+# ---------------- Shell Link (.lnk) ----------------
+def _cstring(data: bytes, offset: int, unicode: bool = False) -> str:
+    if unicode:
+        end = offset
+        while end + 1 < len(data) and data[end:end + 2] != b"\0\0":
+            end += 2
+        return data[offset:end].decode("utf-16-le", "replace")
+    end = data.find(b"\0", offset)
+    return data[offset:end if end >= 0 else len(data)].decode(ANSI, "replace")
+
+
+def _link_info(data: bytes, start: int) -> str:
+    """Target path from a LinkInfo structure (local base path or network share + suffix)."""
+    size, header_size, flags, _vol, local_off, net_off, suffix_off = struct.unpack_from("<7I", data, start)
+    info = data[start:start + size]
+    unicode = header_size >= 0x24
+    if unicode:
+        local_off_u, suffix_off_u = struct.unpack_from("<2I", info, 28)
+    suffix = _cstring(info, suffix_off_u, True) if unicode and suffix_off_u else _cstring(info, suffix_off)
+
+    if flags & VOLUME_ID_AND_LOCAL_BASE_PATH:
+        base = _cstring(info, local_off_u, True) if unicode and local_off_u else _cstring(info, local_off)
+        return base + suffix
+    if flags & COMMON_NETWORK_RELATIVE_LINK:
+        _size, _nflags, name_off = struct.unpack_from("<3I", info, net_off)
+        share = _cstring(info, net_off + name_off)
+        if name_off > 0x14:
+            (name_off_u,) = struct.unpack_from("<I", info, net_off + 20)
+            share = _cstring(info, net_off + name_off_u, True)
+        return ntpath.join(share, suffix) if suffix else share
+    return ""
+
+
+def parse_lnk(data: bytes) -> tuple[Shortcut, str]:
+    """Decode a shell link; also returns its relative path, which is resolved against the file's folder."""
+    if len(data) < LNK_HEADER_SIZE or struct.unpack_from("<I", data)[0] != LNK_HEADER_SIZE \
+            or data[4:20] != LNK_CLSID:
+        raise ShortcutError("not a shell link")
+    flags = struct.unpack_from("<I", data, 20)[0]
+    icon_index = struct.unpack_from("<i", data, 56)[0]
+    pos = LNK_HEADER_SIZE
+    try:
+        if flags & HAS_ID_LIST:
+            pos += 2 + struct.unpack_from("<H", data, pos)[0]
+        target = ""
+        if flags & HAS_LINK_INFO:
+            target = _link_info(data, pos)
+            pos += struct.unpack_from("<I", data, pos)[0]
+
+        strings: dict[int, str] = {}
+        for flag in (HAS_NAME, HAS_RELATIVE_PATH, HAS_WORKING_DIR, HAS_ARGUMENTS, HAS_ICON_LOCATION):
+            if flags & flag:
+                count = struct.unpack_from("<H", data, pos)[0]
+                pos += 2
+                if flags & IS_UNICODE:
+                    strings[flag] = data[pos:pos + count * 2].decode("utf-16-le", "replace")
+                    pos += count * 2
+                else:
+                    strings[flag] = data[pos:pos + count].decode(ANSI, "replace")
+                    pos += count
+
+        env_target = env_icon = ""
+        while pos + 8 <= len(data):
+            size, sig = struct.unpack_from("<2I", data, pos)
+            if size < 4:
+                break  # terminal block
+            if sig in (ENVIRONMENT_BLOCK, ICON_ENVIRONMENT_BLOCK) and size >= 0x314:
+                value = _cstring(data, pos + 268, True) or _cstring(data, pos + 8)
+                if sig == ENVIRONMENT_BLOCK:
+                    env_target = value
+                else:
+                    env_icon = value
+            pos += size
+    except struct.error as e:
+        raise ShortcutError(f"truncated shell link: {e}") from None
+
+    return Shortcut(
+        "lnk",
+        target=target or expand(env_target),
+        arguments=strings.get(HAS_ARGUMENTS, ""),
+        working_dir=expand(strings.get(HAS_WORKING_DIR, "")),
+        icon_location=expand(env_icon or strings.get(HAS_ICON_LOCATION, "")),
+        icon_index=icon_index,
+        description=strings.get(HAS_NAME, ""),
+    ), strings.get(HAS_RELATIVE_PATH, "")
+
+
+def expand(value: str) -> str:
+    """Expand %VAR% the way the shell would (ntpath understands %VAR% on every OS)."""
+    return ntpath.expandvars(value) if "%" in value else value
+
+
+# ---------------- Internet Shortcut (.url) ----------------
+def parse_url(text: str) -> Shortcut:
+    section, values = "", {}
+    for line in text.splitlines():
+        line = line.strip()
+        if line.startswith("[") and line.endswith("]"):
+            section = line[1:-1].strip().lower()
+        elif "=" in line and section == "internetshortcut":
+            key, value = line.split("=", 1)
+            values[key.strip().lower()] = value.strip()
+    if "url" not in values:
+        raise ShortcutError("no [InternetShortcut] URL")
+    try:
+        icon_index = int(values.get("iconindex", 0))
+    except ValueError:
+        icon_index = 0
+    return Shortcut("url", url=values["url"], icon_location=values.get("iconfile", ""), icon_index=icon_index)
+
+
+# ---------------- Resolution with cache ----------------
+_cache = LRUCache(CACHE_SIZE)
+
+
+def is_shortcut(path: str) -> bool:
+    return str(path).lower().endswith(SHORTCUT_EXTENSIONS)
+
+
+def _is_remote(path: str) -> bool:
+    """Shares and drive letters that aren't fixed disks (mapped, removable): a stat there may block."""
+    if path.startswith(("\\\\", "//")):
+        return True
+    drive = ntpath.splitdrive(path)[0]
+    return bool(drive) and ioscheduler.drive_type(drive) not in (None, ioscheduler.DRIVE_FIXED,
+                                                                ioscheduler.DRIVE_RAMDISK)
+
+
+def load(path: str) -> Shortcut:
+    """Parse one shortcut file and check whether a local target and icon file still exist."""
+    path = str(path)
+    with open(path, "rb") as f:
+        data = f.read(1 << 20)
+    if path.lower().endswith(".url"):
+        for enc in ("utf-8-sig", ANSI):
+            try:
+                info = parse_url(data.decode(enc))
+                break
+            except UnicodeDecodeError:
+                continue
+        else:
+            raise ShortcutError("undecodable .url file")
+    else:
+        info, relative = parse_lnk(data)
+        if not info.target and relative:
+            info.target = os.path.normpath(os.path.join(os.path.dirname(path), relative.replace("\\", os.sep)))
+        if info.target and not _is_remote(info.target):  # shares may be slow or offline: left unknown
+            try:
+                info.target_is_dir = stat.S_ISDIR(os.stat(info.target).st_mode)
+                info.broken = False
+            except OSError:
+                info.broken = True
+    loc = info.icon_location
+    if loc.lower().endswith(".ico") and not _is_remote(loc):
+        info.has_icon_file = os.path.isfile(loc)
+    return info
+
+
+def resolve(path: str, mtime: float | None = None) -> Shortcut | None:
+    """Cached load(): re-parsed only when the shortcut file's mtime changes. None if unreadable."""
+    path = str(path)
+    if mtime is None:
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            return None
+    hit = _cache.get(path)
+    if hit is not None and hit[0] == mtime:
+        return hit[1]
+    try:
+        info = load(path)
+    except (OSError, ShortcutError) as e:
+        print(f"[Shortcuts] {path}: {e}")
+        info = None
+    _cache.put(path, (mtime, info))
+    return info
+
+
+def cached(path: str, mtime: float | None = None) -> Shortcut | None:
+    """Whatever resolve() last produced for `path` (at `mtime`, if given), without touching the disk.
+
+    None both for unreadable shortcuts and for ones not resolved yet; callers
+    on the GUI thread never fall back to resolve(), the listing does that.
+    """
+    hit = _cache.get(str(path))
+    return hit[1] if hit is not None and (mtime is None or hit[0] == mtime) else None
+
+
+def main(argv=None) -> int:
+    for path in (argv if argv is not None else sys.argv[1:]):
+        try:
+            info = load(path)
+        except (OSError, ShortcutError) as e:
+            print(f"{path}: {e}")
+            continue
+        print(f"{path}:")
+        for k, v in vars(info).items():
+            print(f"  {k:<14} {v!r}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
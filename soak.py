@@ -0,0 +1,297 @@
+"""Soak test: drive zones with sustained folder churn and watch for leaks.
+
+    python soak.py --duration 600 --zones 4 --csv soak.csv
+    python soak.py --duration 3600 --burst 50 --drop 500 --customize-every 2
+
+Each zone watches its own temporary folder. A workload timer keeps creating,
+deleting and renaming bursts of files in them, drops large batches through
+the normal ingest path and pushes rapid customizer changes. Every sample
+interval the harness records RSS, live QObjects and widgets, event-loop
+latency and grid refresh times. At the end it fits a trend to each series
+(ignoring the warm-up) and flags growth that looks like a leak; the exit code
+is 1 if anything was flagged. Runs headless with QT_QPA_PLATFORM=offscreen.
+"""
+from __future__ import annotations
+import argparse, csv, os, random, statistics, sys, tempfile, time
+
+HEARTBEAT_MS = 20    # event-loop latency probe
+WORKLOAD_MS = 200    # one workload step
+WARMUP_FRACTION = 0.25
+MIN_TREND_SECONDS = 300  # shorter steady phases are reported but never flagged
+
+# series -> allowed growth per hour (fraction of the post-warm-up start value).
+# Object counts are taken per listed file: folders legitimately grow and shrink.
+LEAK_LIMITS = {
+    "rss_bytes": 0.10,
+    "qobjects_per_file": 0.05,
+    "widgets_per_file": 0.05,
+    "refresh_ms_per_file": 0.50,
+}
+
+
+# ---------------- Workload ----------------
+class Workload:
+    def __init__(self, app, zones, folders, staging, args):
+        self.app = app
+        self.zones = zones
+        self.folders = folders
+        self.staging = staging
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.seq = 0
+        self.counts = {"create": 0, "delete": 0, "rename": 0, "drop": 0, "customize": 0}
+        self.last_customize = 0.0
+        self.customizers = {}
+
+    def _name(self, prefix="f") -> str:
+        self.seq += 1
+        return f"{prefix}_{self.seq:08d}.{self.rng.choice(('txt', 'png', 'pdf', 'zip', 'docx'))}"
+
+    def _files(self, folder) -> list[str]:
+        try:
+            return [os.path.join(folder, f) for f in os.listdir(folder)]
+        except OSError:
+            return []
+
+    def step(self):
+        i = self.rng.randrange(len(self.zones))
+        folder = self.folders[i]
+        files = self._files(folder)
+        action = self.rng.choices(("create", "delete", "rename", "drop"), weights=(4, 3, 2, 1))[0]
+        if len(files) > self.args.max_files:
+            action = "delete"
+        elif action == "drop" and (self.zones[i]._ingest_jobs or not self.args.drop):
+            action = "create"
+        getattr(self, "_" + action)(i, folder, files)
+        self.counts[action] += 1
+
+        if self.args.customize_every and time.monotonic() - self.last_customize >= self.args.customize_every:
+            self.last_customize = time.monotonic()
+            self._customize(self.rng.randrange(len(self.zones)))
+            self.counts["customize"] += 1
+
+    def _create(self, i, folder, files):
+        for _ in range(self.args.burst):
+            open(os.path.join(folder, self._name()), "w").close()
+
+    def _delete(self, i, folder, files):
+        for path in self.rng.sample(files, min(len(files), self.args.burst)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _rename(self, i, folder, files):
+        for path in self.rng.sample(files, min(len(files), self.args.burst)):
+            try:
+                os.replace(path, os.path.join(folder, self._name("r")))
+            except OSError:
+                pass
+
+    def _drop(self, i, folder, files):
+        batch = os.path.join(self.staging, f"drop_{self.seq}")
+        os.makedirs(batch)
+        sources = []
+        for _ in range(self.args.drop):
+            path = os.path.join(batch, self._name("d"))
+            open(path, "w").close()
+            sources.append(path)
+        self.zones[i].ingest(sources, folder, move=True)
+
+    def _customize(self, i):
+        """Drive the real Local customizer so its live-apply path gets the churn too."""
+        from customizer import CustomizerDialog
+        from PyQt6.QtWidgets import QSpinBox, QLineEdit
+        z = self.zones[i]
+        dlg = self.customizers.get(i)
+        if dlg is None:
+            dlg = self.customizers[i] = CustomizerDialog(z, z, mode="Local")
+        attr = self.rng.choice(("cols", "text_size", "bg_color", "name_color"))
+        control, chk = dlg.widgets[attr]
+        if isinstance(control, QSpinBox):
+            control.setValue(self.rng.randint(3, 6) if attr == "cols" else self.rng.randint(9, 14))
+        elif isinstance(control, QLineEdit):
+            control.setText(f"#{self.rng.randrange(0x1000000):06x}")
+        if not chk.isChecked():
+            chk.setChecked(True)
+
+
+# ---------------- Probes ----------------
+class LoopProbe:
+    """Measures how late a fixed-interval timer fires: the event loop's responsiveness."""
+
+    def __init__(self):
+        from PyQt6.QtCore import QTimer
+        self.lateness: list[float] = []
+        self._last = time.perf_counter()
+        self.timer = QTimer()
+        self.timer.timeout.connect(self._tick)
+        self.timer.start(HEARTBEAT_MS)
+
+    def _tick(self):
+        now = time.perf_counter()
+        self.lateness.append(max(0.0, (now - self._last) * 1000 - HEARTBEAT_MS))
+        self._last = now
+
+    def take(self) -> list[float]:
+        out, self.lateness = self.lateness, []
+        return out
+
+
+def count_qobjects(app) -> int:
+    from PyQt6.QtCore import QObject
+    tops = app.topLevelWidgets()
+    return len(app.findChildren(QObject)) + sum(1 + len(w.findChildren(QObject)) for w in tops)
+
+
+def _pct(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def sample(app, zones, probe, t0, prev_refresh) -> tuple[dict, tuple]:
+    import metrics
+    totals, _ = metrics.snapshot()
+    refresh = (totals.get("refresh_grid_seconds_total", 0), totals.get("refresh_grid_total", 0))
+    n = refresh[1] - prev_refresh[1]
+    late = probe.take()
+    row = {
+        "t": round(time.monotonic() - t0, 1),
+        "rss_bytes": metrics.process_rss(),
+        "qobjects": count_qobjects(app),
+        "widgets": len(app.allWidgets()),
+        "files": sum(len(z.file_list) for z in zones),
+        "loop_p50_ms": round(_pct(late, 0.50), 2),
+        "loop_p95_ms": round(_pct(late, 0.95), 2),
+        "loop_max_ms": round(max(late, default=0.0), 2),
+        "refresh_ms": round((refresh[0] - prev_refresh[0]) / n * 1000, 2) if n else 0.0,
+        "refreshes": int(n),
+    }
+    per = max(row["files"], 1)
+    row["qobjects_per_file"] = round(row["qobjects"] / per, 3)
+    row["widgets_per_file"] = round(row["widgets"] / per, 3)
+    row["refresh_ms_per_file"] = round(row["refresh_ms"] * len(zones) / per, 4)
+    return row, refresh
+
+
+# ---------------- Trend analysis ----------------
+def slope(xs: list[float], ys: list[float]) -> float:
+    """Least-squares slope of ys over xs (units of y per unit of x)."""
+    if len(xs) < 2:
+        return 0.0
+    mx, my = statistics.fmean(xs), statistics.fmean(ys)
+    den = sum((x - mx) ** 2 for x in xs)
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / den if den else 0.0
+
+
+def trends(samples: list[dict]) -> list[tuple[str, float, float, float, float]]:
+    """(series, growth per hour as a fraction, limit, first, last) over the steady phase."""
+    steady = samples[int(len(samples) * WARMUP_FRACTION):]
+    if len(steady) < 4:
+        return []
+    xs = [s["t"] / 3600 for s in steady]
+    out = []
+    for key, limit in LEAK_LIMITS.items():
+        ys = [float(s[key]) for s in steady]
+        out.append((key, slope(xs, ys) / max(ys[0], 1e-9), limit, ys[0], ys[-1]))
+    return out
+
+
+def find_leaks(samples: list[dict]) -> list[str]:
+    steady = samples[int(len(samples) * WARMUP_FRACTION):]
+    if not steady or steady[-1]["t"] - steady[0]["t"] < MIN_TREND_SECONDS:
+        return []
+    return [f"{key}: {rate * 100:+.1f}%/h (limit {limit * 100:.0f}%/h), {first:g} -> {last:g}"
+            for key, rate, limit, first, last in trends(samples) if rate > limit and last > first]
+
+
+# ---------------- Runner ----------------
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--duration", type=float, default=300, help="seconds to run")
+    ap.add_argument("--zones", type=int, default=4)
+    ap.add_argument("--burst", type=int, default=20, help="files per create/delete/rename burst")
+    ap.add_argument("--drop", type=int, default=200, help="files per large drop (0 = no drops)")
+    ap.add_argument("--max-files", type=int, default=400, help="per-zone folder size that forces deletes")
+    ap.add_argument("--customize-every", type=float, default=5, help="seconds between customizer changes (0 = off)")
+    ap.add_argument("--sample-every", type=float, default=5, help="seconds between samples")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--csv", help="write all samples to this file")
+    args = ap.parse_args(argv)
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    with tempfile.TemporaryDirectory() as tmp:
+        # keep zone configs and snapshots out of the user's data folder
+        os.environ["LOCALAPPDATA"] = os.path.join(tmp, "appdata")
+        from PyQt6.QtWidgets import QApplication
+        from PyQt6.QtCore import QTimer, QRect
+        app = QApplication.instance() or QApplication(sys.argv[:1])
+        from zone import Zone
+        from saver import DEFAULT_GLOBALS
+
+        staging = os.path.join(tmp, "staging")
+        os.makedirs(staging)
+        folders, zones = [], []
+        for i in range(args.zones):
+            folder = os.path.join(tmp, f"zone{i}")
+            os.makedirs(folder)
+            folders.append(folder)
+            z = Zone(f"Soak {i}", folder, dict(DEFAULT_GLOBALS))
+            z.setGeometry(QRect(300 + i * 40, 300 + i * 40, z.width(), z.height()))
+            z.show()
+            zones.append(z)
+
+        work = Workload(app, zones, folders, staging, args)
+        probe = LoopProbe()
+        samples: list[dict] = []
+        t0 = time.monotonic()
+        prev = (0.0, 0)
+
+        def take_sample():
+            nonlocal prev
+            row, prev = sample(app, zones, probe, t0, prev)
+            samples.append(row)
+            print(f"t={row['t']:>7.1f}s rss={row['rss_bytes'] / 2**20:7.1f} MB qobjects={row['qobjects']:>6} "
+                  f"widgets={row['widgets']:>6} files={row['files']:>5} loop p95={row['loop_p95_ms']:>6.1f} ms "
+                  f"refresh={row['refresh_ms']:>6.1f} ms x{row['refreshes']}", flush=True)
+
+        workload_timer = QTimer()
+        workload_timer.timeout.connect(work.step)
+        workload_timer.start(WORKLOAD_MS)
+        sample_timer = QTimer()
+        sample_timer.timeout.connect(take_sample)
+        sample_timer.start(int(args.sample_every * 1000))
+        QTimer.singleShot(int(args.duration * 1000), app.quit)
+        app.exec()
+
+        workload_timer.stop()
+        sample_timer.stop()
+        for z in zones:
+            z.close()
+            z.deleteLater()
+        app.processEvents()
+
+    print("\nworkload:", ", ".join(f"{k} {v}" for k, v in work.counts.items()))
+    if args.csv and samples:
+        with open(args.csv, "w", newline="", encoding="utf-8") as f:
+            w = csv.DictWriter(f, fieldnames=list(samples[0]))
+            w.writeheader()
+            w.writerows(samples)
+        print(f"samples written to {args.csv}")
+
+    for key, rate, limit, first, last in trends(samples):
+        print(f"  {key:<20} {rate * 100:+8.1f}%/h  (limit {limit * 100:.0f}%/h)  {first:g} -> {last:g}")
+    flags = find_leaks(samples)
+    for f in flags:
+        print("LEAK?", f)
+    if not flags:
+        long_enough = samples and samples[-1]["t"] * (1 - WARMUP_FRACTION) >= MIN_TREND_SECONDS
+        print("no sustained growth detected" if long_enough
+              else f"run too short to flag leaks (steady phase under {MIN_TREND_SECONDS} s)")
+    return 1 if flags else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
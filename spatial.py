@@ -0,0 +1,188 @@
+from __future__ import annotations
+from typing import Hashable, Iterable, Iterator
+
+# Rectangles are plain (x, y, w, h) tuples so this module stays independent of Qt.
+Rect = tuple[int, int, int, int]
+
+SNAP_DISTANCE = 12
+ARRANGE_GAP = 8
+
+
+class SpatialIndex:
+    """Uniform grid hash over zone rectangles.
+
+    Each rect is registered in every bucket it overlaps, so a query only
+    looks at the handful of zones near the probe instead of all of them.
+    """
+
+    def __init__(self, bucket: int = 256):
+        self.bucket = bucket
+        self._rects: dict[Hashable, Rect] = {}
+        self._cells: dict[tuple[int, int], set[Hashable]] = {}
+
+    def _buckets(self, r: Rect) -> Iterator[tuple[int, int]]:
+        x, y, w, h = r
+        b = self.bucket
+        for bx in range(x // b, (x + max(w, 1) - 1) // b + 1):
+            for by in range(y // b, (y + max(h, 1) - 1) // b + 1):
+                yield bx, by
+
+    def update(self, key: Hashable, rect: Rect):
+        old = self._rects.get(key)
+        if old == rect:
+            return
+        if old is not None:
+            self.remove(key)
+        self._rects[key] = rect
+        for c in self._buckets(rect):
+            self._cells.setdefault(c, set()).add(key)
+
+    def remove(self, key: Hashable):
+        rect = self._rects.pop(key, None)
+        if rect is None:
+            return
+        for c in self._buckets(rect):
+            keys = self._cells.get(c)
+            if keys:
+                keys.discard(key)
+                if not keys:
+                    del self._cells[c]
+
+    def rect(self, key: Hashable) -> Rect | None:
+        return self._rects.get(key)
+
+    def query(self, rect: Rect, exclude: Hashable | None = None) -> list[tuple[Hashable, Rect]]:
+        """Entries whose rect intersects `rect`."""
+        x, y, w, h = rect
+        seen: set[Hashable] = set()
+        out = []
+        for c in self._buckets(rect):
+            for key in self._cells.get(c, ()):
+                if key in seen or key is exclude:
+                    continue
+                seen.add(key)
+                ox, oy, ow, oh = self._rects[key]
+                if ox < x + w and x < ox + ow and oy < y + h and y < oy + oh:
+                    out.append((key, self._rects[key]))
+        return out
+
+    def __len__(self):
+        return len(self._rects)
+
+
+def _nearest(values: Iterable[int], targets: Iterable[int], limit: int) -> int | None:
+    """Smallest offset (by magnitude) that moves any of `values` onto any of `targets`."""
+    best = None
+    for v in values:
+        for t in targets:
+            d = t - v
+            if abs(d) <= limit and (best is None or abs(d) < abs(best)):
+                best = d
+    return best
+
+
+def snap_rect(rect: Rect, index: SpatialIndex, screens: Iterable[Rect], key: Hashable | None = None,
+              edges: str = "leftrighttopbottom", distance: int = SNAP_DISTANCE) -> Rect:
+    """Snap the given edges of `rect` to screen edges and to edges of nearby zones.
+
+    With all four edges (a move) the rect is translated; with a subset (a
+    resize) only those edges move.
+    """
+    x, y, w, h = rect
+    reach = distance + ARRANGE_GAP  # neighbours we could sit flush against, one gap away
+    probe = (x - reach, y - reach, w + 2 * reach, h + 2 * reach)
+    xs: list[int] = []
+    ys: list[int] = []
+    for sx, sy, sw, sh in screens:
+        xs += [sx, sx + sw]
+        ys += [sy, sy + sh]
+    for _k, (ox, oy, ow, oh) in index.query(probe, exclude=key):
+        # line up with the neighbour's edges and sit flush against its outside
+        xs += [ox, ox + ow, ox - ARRANGE_GAP, ox + ow + ARRANGE_GAP]
+        ys += [oy, oy + oh, oy - ARRANGE_GAP, oy + oh + ARRANGE_GAP]
+
+    moving = edges == "leftrighttopbottom"
+    left, right, top, bottom = x, x + w, y, y + h
+    if moving:
+        dx = _nearest((left, right), xs, distance) or 0
+        dy = _nearest((top, bottom), ys, distance) or 0
+        return x + dx, y + dy, w, h
+    if "left" in edges:
+        left += _nearest((left,), xs, distance) or 0
+    if "right" in edges:
+        right += _nearest((right,), xs, distance) or 0
+    if "top" in edges:
+        top += _nearest((top,), ys, distance) or 0
+    if "bottom" in edges:
+        bottom += _nearest((bottom,), ys, distance) or 0
+    return left, top, right - left, bottom - top
+
+
+def screen_for(rect: Rect, screens: list[Rect]) -> int:
+    """Index of the screen containing the rect's centre (or the nearest one)."""
+    cx, cy = rect[0] + rect[2] // 2, rect[1] + rect[3] // 2
+    best, best_d = 0, None
+    for i, (sx, sy, sw, sh) in enumerate(screens):
+        if sx <= cx < sx + sw and sy <= cy < sy + sh:
+            return i
+        dx = max(sx - cx, 0, cx - (sx + sw))
+        dy = max(sy - cy, 0, cy - (sy + sh))
+        d = dx * dx + dy * dy
+        if best_d is None or d < best_d:
+            best, best_d = i, d
+    return best
+
+
+def arrange(rects: dict[Hashable, Rect], screens: list[Rect], gap: int = ARRANGE_GAP) -> dict[Hashable, Rect]:
+    """Pack zones onto the screen they mostly sit on, in shelves, without overlap.
+
+    Zones keep their size. Tallest zones go first; each shelf fills left to
+    right and a new shelf starts below the tallest zone of the previous one.
+    Zones that don't fit on their screen are packed onto another screen with
+    room; any still left are cascaded in the strip below their screen's last
+    shelf, overlapping only each other.
+    """
+    if not screens:
+        return dict(rects)
+    per_screen: dict[int, list[Hashable]] = {}
+    for key, r in rects.items():
+        per_screen.setdefault(screen_for(r, screens), []).append(key)
+    shelves = [[sx + gap, sy + gap, 0] for sx, sy, _sw, _sh in screens]  # x, y, height of the open shelf
+
+    def place(si: int, w: int, h: int) -> Rect | None:
+        sx, sy, sw, sh = screens[si]
+        cx, cy, shelf_h = shelves[si]
+        if cx + w + gap > sx + sw and cx > sx + gap:
+            cx, cy, shelf_h = sx + gap, cy + shelf_h + gap, 0
+        if cy + h + gap > sy + sh:
+            return None
+        shelves[si] = [cx + w + gap, cy, max(shelf_h, h)]
+        return cx, cy, w, h
+
+    out: dict[Hashable, Rect] = {}
+    left: list[tuple[int, Hashable]] = []
+    for si, keys in per_screen.items():
+        keys.sort(key=lambda k: (-rects[k][3], -rects[k][2]))
+        for k in keys:
+            r = place(si, *rects[k][2:])
+            if r is None:
+                left.append((si, k))
+            else:
+                out[k] = r
+    stuck: list[tuple[int, Hashable]] = []
+    for si, k in left:
+        for other in range(len(screens)):
+            r = place(other, *rects[k][2:]) if other != si else None
+            if r is not None:
+                out[k] = r
+                break
+        else:
+            stuck.append((si, k))
+    cascaded: dict[int, int] = {}
+    for si, k in stuck:
+        sx, sy, sw, sh = screens[si]
+        _cx, cy, shelf_h = shelves[si]
+        _x, _y, w, h = rects[k]
+        n = cascaded[si] = cascaded.get(si, -1) + 1
+        out[k] = (sx + gap + n * 24 % max(1, sw - w - 2 * gap), cy + shelf_h + gap, w, h)
+    return out
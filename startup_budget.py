@@ -0,0 +1,107 @@
+"""Startup budget check: import time, time-to-tray and import side effects.
+
+    python startup_budget.py            # exit code 1 if any budget is blown
+    python startup_budget.py --verbose  # also list the slowest imports
+
+Each measurement runs in a fresh interpreter (``-X importtime``) with an
+empty LOCALAPPDATA and the offscreen Qt platform, so results don't depend on
+the user's saved zones or on a display being available.
+"""
+from __future__ import annotations
+import argparse, os, subprocess, sys, tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+IMPORT_BUDGET_MS = 250      # cumulative import time of trayapp (incl. PyQt6)
+TRAY_BUDGET_MS = 600        # interpreter start -> tray icon shown, no saved zones
+RUNS = 3                    # best-of, to smooth out a cold disk cache
+
+# Only needed once the user opens them; must not be imported at startup.
+LAZY_MODULES = ("customizer", "diagnostics", "hostbench", "soak", "latencybench")
+
+_TRAY_SNIPPET = """
+import time
+t0 = time.perf_counter()
+import trayapp
+app = trayapp.TrayApp([])
+print(f"TRAY_MS={(time.perf_counter() - t0) * 1000:.1f}")
+"""
+
+
+def _env(data_dir: str) -> dict:
+    env = dict(os.environ)
+    env["LOCALAPPDATA"] = data_dir
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return env
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """Map module -> (self_us, cumulative_us) from `-X importtime` output."""
+    out = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        try:
+            self_us, cum_us, name = (p.strip() for p in line[len("import time:"):].split("|"))
+            out[name] = (int(self_us), int(cum_us))
+        except ValueError:
+            continue  # header line
+    return out
+
+
+def measure_imports(module: str = "trayapp") -> tuple[dict[str, tuple[int, int]], list[str]]:
+    with tempfile.TemporaryDirectory() as data_dir:
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                              cwd=HERE, env=_env(data_dir), capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr)
+        created = sorted(os.listdir(data_dir))
+    return parse_importtime(proc.stderr), created
+
+
+def measure_time_to_tray() -> float:
+    with tempfile.TemporaryDirectory() as data_dir:
+        proc = subprocess.run([sys.executable, "-c", _TRAY_SNIPPET],
+                              cwd=HERE, env=_env(data_dir), capture_output=True, text=True)
+    for line in proc.stdout.splitlines():
+        if line.startswith("TRAY_MS="):
+            return float(line.split("=", 1)[1])
+    raise RuntimeError(proc.stderr)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--verbose", action="store_true")
+    args = ap.parse_args(argv)
+
+    failures = []
+    runs = [measure_imports() for _ in range(RUNS)]
+    timings, created = min(runs, key=lambda r: r[0]["trayapp"][1])
+    import_ms = timings["trayapp"][1] / 1000
+    print(f"import trayapp: {import_ms:.1f} ms (budget {IMPORT_BUDGET_MS} ms)")
+    if import_ms > IMPORT_BUDGET_MS:
+        failures.append("import time over budget")
+
+    if created:
+        failures.append(f"importing created files/folders: {created}")
+    eager = [m for m in LAZY_MODULES if m in timings]
+    if eager:
+        failures.append(f"imported at startup but should be lazy: {eager}")
+
+    tray_ms = min(measure_time_to_tray() for _ in range(RUNS))
+    print(f"time to tray:   {tray_ms:.1f} ms (budget {TRAY_BUDGET_MS} ms)")
+    if tray_ms > TRAY_BUDGET_MS:
+        failures.append("time to tray over budget")
+
+    if args.verbose:
+        print("\nslowest imports (self time):")
+        for name, (self_us, cum_us) in sorted(timings.items(), key=lambda kv: -kv[1][0])[:15]:
+            print(f"  {self_us / 1000:8.1f} ms  {cum_us / 1000:8.1f} ms cum  {name}")
+
+    for f in failures:
+        print("FAIL:", f)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
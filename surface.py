@@ -0,0 +1,78 @@
+from __future__ import annotations
+from PyQt6.QtWidgets import QWidget, QApplication
+from PyQt6.QtCore import Qt, QRect
+
+from spatial import screen_for
+
+
+class ZoneSurface(QWidget):
+    """One transparent, bottom-most window covering a screen; zones live on it as child panels.
+
+    Transparent areas are left unpainted so clicks fall through to the desktop.
+    """
+
+    def __init__(self, screen):
+        super().__init__(None)
+        self.setWindowFlags(
+            Qt.WindowType.FramelessWindowHint |
+            Qt.WindowType.WindowStaysOnBottomHint |
+            Qt.WindowType.Tool
+        )
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
+        self.screen_ref = screen
+        self.setGeometry(screen.geometry())
+
+
+class SurfaceHost:
+    """Moves zones between their own top-level windows and one ZoneSurface per screen."""
+
+    def __init__(self):
+        self.surfaces: list[ZoneSurface] = []
+
+    @property
+    def active(self) -> bool:
+        return bool(self.surfaces)
+
+    def _ensure_surfaces(self):
+        if not self.surfaces:
+            self.surfaces = [ZoneSurface(s) for s in QApplication.screens()]
+            for surf in self.surfaces:
+                surf.show()
+
+    def attach(self, zone):
+        self._ensure_surfaces()
+        geom = zone.global_geometry()
+        screens = [(g.x(), g.y(), g.width(), g.height()) for g in (s.geometry() for s in self.surfaces)]
+        surf = self.surfaces[screen_for((geom.x(), geom.y(), geom.width(), geom.height()), screens)]
+        visible = zone.isVisible() or zone.parentWidget() is not None
+        zone.setParent(surf, Qt.WindowType.Widget)
+        zone.set_global_geometry(geom)
+        if visible:
+            zone.show()
+
+    def detach(self, zone):
+        if zone.parentWidget() is None:
+            return
+        geom = zone.global_geometry()
+        visible = zone.isVisible()
+        zone.setParent(None, zone.WINDOW_FLAGS)
+        zone.setGeometry(geom)
+        if visible:
+            zone.show()
+
+    def host_all(self, zones):
+        for z in zones:
+            self.attach(z)
+
+    def release_all(self, zones):
+        for z in zones:
+            self.detach(z)
+        for surf in self.surfaces:
+            surf.hide()
+            surf.deleteLater()
+        self.surfaces = []
+
+    def repaint(self):
+        for surf in self.surfaces:
+            surf.repaint()
@@ -0,0 +1,27 @@
+import os, sys, time
+
+import pytest
+
+# the modules live at the repo root; widgets render without a display
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def pump(qapp):
+    """pump(until) processes Qt events until `until()` is true (or a 5 s timeout)."""
+    def run(until, timeout: float = 5.0):
+        end = time.monotonic() + timeout
+        while not until() and time.monotonic() < end:
+            qapp.processEvents()
+            time.sleep(0.001)
+        return until()
+    return run
@@ -0,0 +1,72 @@
+"""Regenerate the shortcut fixtures: python tests/fixtures/make_shortcuts.py
+
+The .lnk files are built by hand from the MS-SHLLINK layout, so they only
+contain the structures shortcuts.py reads.
+"""
+import os, struct
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CLSID = bytes.fromhex("0114020000000000c000000000000046")
+
+
+def _counted(s: str) -> bytes:
+    return struct.pack("<H", len(s)) + s.encode("utf-16-le")
+
+
+def _local_info(target: str, unicode: bool) -> bytes:
+    if unicode:
+        base = target.encode("utf-16-le") + b"\0\0"
+        hs = 0x24  # LocalBasePathOffsetUnicode / CommonPathSuffixOffsetUnicode follow
+        body = b"\0" + b"\0" + base + b"\0\0"
+        fields = (1, 0, hs, 0, hs + 1, hs + 2, hs + 2 + len(base))
+        return struct.pack("<9I", hs + len(body), hs, *fields) + body
+    base = target.encode("cp1252") + b"\0"
+    hs = 0x1C
+    body = base + b"\0"
+    return struct.pack("<7I", hs + len(body), hs, 1, 0, hs, 0, hs + len(base)) + body
+
+
+def _network_info(share: str, suffix: str) -> bytes:
+    hs = 0x1C
+    name = share.encode("cp1252") + b"\0"
+    net = struct.pack("<5I", 0x14 + len(name), 0, 0x14, 0, 0) + name
+    suf = suffix.encode("cp1252") + b"\0"
+    return struct.pack("<7I", hs + len(net) + len(suf), hs, 2, 0, 0, hs, hs + len(net)) + net + suf
+
+
+def lnk(info: bytes = b"", name="", relative="", working_dir="", args="", icon="", env="", icon_index=0) -> bytes:
+    flags = 0x80 | (0x2 if info else 0)
+    body = info
+    for flag, s in ((0x4, name), (0x8, relative), (0x10, working_dir), (0x20, args), (0x40, icon)):
+        if s:
+            flags |= flag
+            body += _counted(s)
+    if env:
+        body += struct.pack("<2I", 0x314, 0xA0000001) + env.encode("cp1252").ljust(260, b"\0") \
+            + env.encode("utf-16-le").ljust(520, b"\0")
+    body += b"\0\0\0\0"
+    header = struct.pack("<I", 0x4C) + CLSID + struct.pack("<2I", flags, 0) + b"\0" * 24 \
+        + struct.pack("<IiIH", 0, icon_index, 1, 0) + b"\0" * 10
+    return header + body
+
+
+FILES = {
+    "local_ansi.lnk": lnk(_local_info(r"C:\Tools\app.exe", False), args="--fast", icon_index=2),
+    "local_unicode.lnk": lnk(_local_info("C:\\Users\\Zoë\\Документы", True), name="My documents",
+                             working_dir="%USERPROFILE%", icon=r"C:\icons\docs.ico"),
+    "network.lnk": lnk(_network_info(r"\\NAS\share", r"reports\q3.xlsx")),
+    "relative.lnk": lnk(relative=r"..\notes\todo.txt"),
+    "environment.lnk": lnk(env=r"%SystemRoot%\notepad.exe"),
+    "not_a_link.lnk": b"MZ\x90\0 this is not a shell link" + b"\0" * 80,
+    "web.url": b"[InternetShortcut]\r\nURL=https://example.com/docs\r\nIconFile=C:\\icons\\web.ico\r\nIconIndex=3\r\n",
+    "web_bom.url": "\ufeff[{000214A0-0000-0000-C000-000000000046}]\r\nProp3=19,11\r\n"
+                   "[InternetShortcut]\r\nIDList=\r\nURL=https://example.org/ü\r\nIconIndex=x\r\n".encode("utf-8"),
+    "no_url.url": b"[InternetShortcut]\r\nIconFile=C:\\icons\\web.ico\r\n",
+}
+FILES["truncated.lnk"] = FILES["local_ansi.lnk"][:0x4C + 12]
+
+
+if __name__ == "__main__":
+    for name, data in FILES.items():
+        with open(os.path.join(HERE, name), "wb") as f:
+            f.write(data)
@@ -0,0 +1,91 @@
+import os, time, zipfile
+
+import pytest
+
+import archive
+
+
+@pytest.fixture
+def zip_path(tmp_path):
+    path = str(tmp_path / "data.zip")
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("readme.txt", "hello")
+        zf.writestr("src/a.py", "x" * 100)
+        zf.writestr("src/pkg/b.py", "y" * 50)
+        zf.writestr("empty/", "")
+        zf.writestr("../escape.txt", "no")
+        zf.writestr("./dot/c.txt", "z")
+    return path
+
+
+def test_split_archive(zip_path):
+    assert archive.split_archive(zip_path) == (zip_path, "")
+    inner = os.path.join(zip_path, "src", "pkg")
+    assert archive.split_archive(inner) == (zip_path, os.path.join("src", "pkg"))
+    assert archive.split_archive(os.path.dirname(zip_path)) is None
+
+
+def test_split_archive_ignores_folders_named_like_zips(tmp_path):
+    folder = tmp_path / "not.zip" / "inside"
+    folder.mkdir(parents=True)
+    assert archive.split_archive(str(folder)) is None
+    assert not archive.is_archive(str(tmp_path / "not.zip"))
+
+
+def test_index_tree_and_sizes(zip_path):
+    idx = archive.ArchiveIndex(zip_path)
+    assert sorted(idx.children[""]) == ["dot", "empty", "readme.txt", "src"]
+    assert idx.children[""]["src"][0] is True
+    assert idx.children["src"]["a.py"][:2] == (False, 100)
+    assert idx.children[os.path.join("src", "pkg")]["b.py"][:2] == (False, 50)
+    assert idx.children["empty"] == {}
+    assert idx.tree_size("") == (5 + 100 + 50 + 1, 4, 4)
+    assert idx.tree_size("src") == (150, 2, 1)
+
+
+def test_index_skips_names_escaping_the_archive(zip_path):
+    idx = archive.ArchiveIndex(zip_path)
+    assert "escape.txt" not in idx.children[""]
+    assert all(".." not in inner for inner in idx.members)
+
+
+def test_listing_is_shaped_like_a_disk_listing(zip_path):
+    files, dirs, mtimes, sizes = archive.listing(zip_path, "src")
+    a, pkg = os.path.join(zip_path, "src", "a.py"), os.path.join(zip_path, "src", "pkg")
+    assert sorted(files) == [a, pkg]
+    assert dirs == {pkg}
+    assert sizes[a] == 100
+    assert set(mtimes) == set(files)
+
+
+def test_index_is_cached_until_the_zip_changes(zip_path):
+    first = archive.index(zip_path)
+    assert archive.index(zip_path) is first
+    with zipfile.ZipFile(zip_path, "a") as zf:
+        zf.writestr("new.txt", "n")
+    later = time.time() + 5
+    os.utime(zip_path, (later, later))
+    again = archive.index(zip_path)
+    assert again is not first and "new.txt" in again.children[""]
+
+
+def test_corrupt_zip_gives_no_index(tmp_path):
+    bad = tmp_path / "bad.zip"
+    bad.write_bytes(b"PK\x03\x04 not really")
+    assert archive.index(str(bad)) is None
+    assert archive.listing(str(bad), "") == ([], set(), {}, {})
+
+
+def test_extract_single_member_and_reuse(zip_path, tmp_path, monkeypatch):
+    monkeypatch.setattr(archive, "EXTRACT_DIR", str(tmp_path / "out"))
+    out = archive.extract(os.path.join(zip_path, "src", "pkg", "b.py"))
+    assert open(out).read() == "y" * 50
+    assert sorted(os.listdir(os.path.dirname(out))) == ["b.py"]  # only this member was written
+    assert archive.extract(os.path.join(zip_path, "src", "pkg", "b.py")) == out
+
+
+def test_extract_rejects_folders_and_missing_members(zip_path):
+    with pytest.raises(FileNotFoundError):
+        archive.extract(os.path.join(zip_path, "src"))
+    with pytest.raises(FileNotFoundError):
+        archive.extract(zip_path)
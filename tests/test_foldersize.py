@@ -0,0 +1,29 @@
+import foldersize
+
+
+def test_walk_totals(tmp_path):
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "a" / "f.txt").write_bytes(b"x" * 10)
+    (tmp_path / "a" / "b" / "g.txt").write_bytes(b"x" * 5)
+    walk = foldersize._Walk(str(tmp_path))
+    while not walk.run():
+        pass
+    assert (walk.total.size, walk.total.files, walk.total.folders, walk.total.complete) == (15, 2, 2, True)
+
+
+def test_walk_resumes_inside_a_directory(tmp_path, monkeypatch):
+    for i in range(50):
+        (tmp_path / f"f{i}").write_bytes(b"x")
+    monkeypatch.setattr(foldersize, "SLICE_SECONDS", 0.0)  # every slice stops after one entry
+    walk = foldersize._Walk(str(tmp_path))
+    slices = 1
+    while not walk.run():
+        assert walk._it is not None  # paused mid-directory
+        slices += 1
+    assert slices == 51  # the last slice only finds the end of the directory
+    assert walk.total.files == 50 and walk.total.complete and walk._it is None
+
+
+def test_format_size():
+    assert foldersize.format_size(0) == "0.0 B"
+    assert foldersize.format_size(1536) == "1.5 KB"
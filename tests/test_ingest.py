@@ -0,0 +1,63 @@
+import os
+
+from ingest import unique_destination, _is_inside, IngestJob
+
+
+def test_unique_destination_free_name(tmp_path):
+    assert unique_destination(str(tmp_path), "a.txt") == os.path.join(str(tmp_path), "a.txt")
+
+
+def test_unique_destination_numbers_existing_names(tmp_path):
+    (tmp_path / "a.txt").write_text("x")
+    (tmp_path / "a (2).txt").write_text("x")
+    assert unique_destination(str(tmp_path), "a.txt") == os.path.join(str(tmp_path), "a (3).txt")
+
+
+def test_unique_destination_tracks_names_taken_in_the_same_batch(tmp_path):
+    taken = set()
+    first = unique_destination(str(tmp_path), "a.txt", taken)
+    second = unique_destination(str(tmp_path), "a.txt", taken)
+    assert first != second
+    assert os.path.basename(second) == "a (2).txt"
+    assert taken == {first, second}
+
+
+def test_is_inside(tmp_path):
+    assert _is_inside(str(tmp_path / "a" / "b"), str(tmp_path / "a"))
+    assert _is_inside(str(tmp_path / "a"), str(tmp_path / "a"))
+    assert not _is_inside(str(tmp_path / "ab"), str(tmp_path / "a"))
+
+
+def _run(job):
+    chunks, finished = [], []
+    job.chunk_done.connect(chunks.append)
+    job.finished.connect(lambda done, errors: finished.append((done, errors)))
+    job._run()  # synchronously, instead of start()
+    return [p for c in chunks for p in c], finished[0]
+
+
+def test_ingest_copies_with_unique_names(tmp_path):
+    src, dest = tmp_path / "src", tmp_path / "dest"
+    src.mkdir()
+    dest.mkdir()
+    (src / "a.txt").write_text("new")
+    (dest / "a.txt").write_text("old")
+    placed, (done, errors) = _run(IngestJob([str(src / "a.txt")], str(dest)))
+    assert placed == [str(dest / "a (2).txt")]
+    assert (dest / "a.txt").read_text() == "old"
+    assert (src / "a.txt").exists()
+    assert (done, errors) == (1, [])
+
+
+def test_ingest_refuses_folder_into_itself(tmp_path):
+    inner = tmp_path / "outer" / "inner"
+    inner.mkdir(parents=True)
+    placed, (done, errors) = _run(IngestJob([str(tmp_path / "outer")], str(inner)))
+    assert placed == [] and len(errors) == 1
+
+
+def test_ingest_skips_drops_onto_own_folder(tmp_path):
+    (tmp_path / "a.txt").write_text("x")
+    placed, (_done, errors) = _run(IngestJob([str(tmp_path / "a.txt")], str(tmp_path), move=True))
+    assert placed == [] and errors == []
+    assert os.listdir(tmp_path) == ["a.txt"]
@@ -0,0 +1,112 @@
+import threading
+
+import pytest
+
+import ioscheduler
+
+
+@pytest.fixture
+def volume(tmp_path):
+    path = str(tmp_path / "x")
+    return path, ioscheduler.volume_of(path)
+
+
+def _gate(sched, path):
+    """Occupy the volume's only slot until the returned event is set."""
+    release, started = threading.Event(), threading.Event()
+
+    def hold():
+        started.set()
+        release.wait(5)
+    sched.submit(("gate", id(release)), hold, path, ioscheduler.USER)
+    assert started.wait(5)
+    return release
+
+
+def test_identical_pending_requests_share_one_job(qapp, pump, volume):
+    path, vol = volume
+    sched = ioscheduler.IOScheduler({vol: 1})
+    release = _gate(sched, path)
+    runs, got = [], []
+    for _ in range(3):
+        sched.submit("k", lambda: runs.append(1) or "r", path, ioscheduler.VISIBLE, got.append)
+    release.set()
+    assert pump(lambda: len(got) == 3)
+    assert runs == [1] and got == ["r", "r", "r"]
+
+
+def test_higher_priority_runs_first(qapp, pump, volume):
+    path, vol = volume
+    sched = ioscheduler.IOScheduler({vol: 1})
+    release = _gate(sched, path)
+    order = []
+    sched.submit("bg", lambda: order.append("bg"), path, ioscheduler.BACKGROUND)
+    sched.submit("vis", lambda: order.append("vis"), path, ioscheduler.VISIBLE)
+    sched.submit("user", lambda: order.append("user"), path, ioscheduler.USER)
+    release.set()
+    assert pump(lambda: len(order) == 3)
+    assert order == ["user", "vis", "bg"]
+
+
+def test_resubmitting_at_higher_priority_promotes_the_job(qapp, pump, volume):
+    path, vol = volume
+    sched = ioscheduler.IOScheduler({vol: 1})
+    release = _gate(sched, path)
+    order = []
+    sched.submit("a", lambda: order.append("a"), path, ioscheduler.VISIBLE)
+    sched.submit("b", lambda: order.append("b"), path, ioscheduler.BACKGROUND)
+    sched.submit("b", lambda: order.append("b"), path, ioscheduler.USER)
+    release.set()
+    assert pump(lambda: len(order) == 2)
+    assert order == ["b", "a"]
+
+
+def test_cancelled_pending_job_never_runs(qapp, pump, volume):
+    path, vol = volume
+    sched = ioscheduler.IOScheduler({vol: 1})
+    release = _gate(sched, path)
+    ran, got = [], []
+    req = sched.submit("k", lambda: ran.append(1), path, ioscheduler.VISIBLE, got.append)
+    req.cancel()
+    done = []
+    sched.submit("after", lambda: None, path, ioscheduler.BACKGROUND, done.append)
+    release.set()
+    assert pump(lambda: done)
+    assert ran == [] and got == []
+    assert sched.stats()[vol]["queued"] == 0
+
+
+def test_failing_job_calls_back_with_none(qapp, pump, volume):
+    path, _vol = volume
+    sched = ioscheduler.IOScheduler()
+    got = []
+
+    def boom():
+        raise OSError("gone")
+    sched.submit("k", boom, path, ioscheduler.USER, lambda r: got.append(("called", r)))
+    assert pump(lambda: got)
+    assert got == [("called", None)]
+
+
+def test_concurrency_stays_within_the_volume_limit(qapp, pump, volume):
+    path, vol = volume
+    sched = ioscheduler.IOScheduler({vol: 2})
+    lock = threading.Lock()
+    state = {"now": 0, "peak": 0}
+    done = []
+
+    def job():
+        with lock:
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+        threading.Event().wait(0.01)
+        with lock:
+            state["now"] -= 1
+    for i in range(10):
+        sched.submit(i, job, path, ioscheduler.VISIBLE, done.append)
+    assert pump(lambda: len(done) == 10)
+    assert state["peak"] == 2
+
+
+def test_unc_volumes_get_the_network_limit():
+    assert ioscheduler.default_limit("\\\\NAS\\SHARE") == ioscheduler.NETWORK_LIMIT
@@ -0,0 +1,40 @@
+import metrics
+
+
+class FakeZone:
+    def __init__(self, title):
+        self.title_bar = type("Title", (), {"text": lambda _self: title})()
+        self.file_list = ["a", "b"]
+        self.cells_built, self.last_refresh_ms, self.repaints_avoided, self.idle = 2, 1.5, 0, False
+
+    def findChildren(self, _type):
+        return []
+
+
+def _families(text):
+    """Metric family of each sample line, in output order."""
+    names = []
+    for line in text.splitlines():
+        if line.startswith("# TYPE "):
+            family = line.split()[2]
+        elif not line.startswith("#"):
+            assert line.startswith(family), line
+            names.append(family)
+    return names
+
+
+def test_each_family_is_one_contiguous_group(qapp):
+    text = metrics.to_prometheus(metrics.collect([FakeZone("One"), FakeZone("Two")]))
+    names = _families(text)
+    groups = [n for i, n in enumerate(names) if i == 0 or names[i - 1] != n]
+    assert len(groups) == len(set(groups))
+    assert names.count(metrics.PREFIX + "zone_files") == 2
+    assert text.count("# TYPE " + metrics.PREFIX + "zone_files ") == 1
+
+
+def test_rows_group_by_name_in_first_seen_order():
+    rows = [("a", "gauge", "A", {"id": "0"}, 1), ("b", "gauge", "B", {"id": "0"}, 2),
+            ("a", "gauge", "A", {"id": "1"}, 3)]
+    lines = [ln for ln in metrics.to_prometheus(rows).splitlines() if not ln.startswith("#")]
+    p = metrics.PREFIX
+    assert lines == [f'{p}a{{id="0"}} 1', f'{p}a{{id="1"}} 3', f'{p}b{{id="0"}} 2']
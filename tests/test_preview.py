@@ -0,0 +1,87 @@
+import os
+
+import preview
+
+
+def _log(path, lines):
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        for i in range(lines):
+            f.write(f"line {i:07d} some log text\n")
+    return str(path)
+
+
+def test_small_file_is_shown_whole(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_text("one\ntwo\n", encoding="utf-8")
+    text, detail = preview.read_text(str(path))
+    assert text == "one\ntwo"
+    assert detail == "8.0 B"
+
+
+def test_empty_and_binary_files(tmp_path):
+    (tmp_path / "e.txt").write_bytes(b"")
+    (tmp_path / "b.txt").write_bytes(b"abc\0def")
+    assert preview.read_text(str(tmp_path / "e.txt")) == ("", "empty")
+    assert preview.read_text(str(tmp_path / "b.txt")) is None
+
+
+def test_many_short_lines_within_the_head(tmp_path):
+    path = _log(tmp_path / "mid.log", 100)
+    lines = preview.read_text(path)[0].splitlines()
+    assert lines[0] == "line 0000000 some log text"
+    assert lines[preview.MAX_LINES] == f"··· {100 - 2 * preview.MAX_LINES} lines ···"
+    assert lines[-1] == "line 0000099 some log text"
+    assert len(lines) == 2 * preview.MAX_LINES + 1
+
+
+def test_file_between_head_and_head_plus_tail_is_read_whole(tmp_path):
+    path = _log(tmp_path / "near.log", 8000)  # ~216 KB: past HEAD_BYTES, within HEAD_BYTES + TAIL_BYTES
+    assert preview.HEAD_BYTES < os.path.getsize(path) <= preview.HEAD_BYTES + preview.TAIL_BYTES
+    lines = preview.read_text(path)[0].splitlines()
+    assert lines[preview.MAX_LINES] == f"··· {8000 - 2 * preview.MAX_LINES} lines ···"
+    assert lines[-1] == "line 0007999 some log text"
+
+
+def test_big_file_shows_head_and_tail_only(tmp_path):
+    path = _log(tmp_path / "big.log", 40_000)  # ~1 MB, well past HEAD_BYTES + TAIL_BYTES
+    lines = preview.read_text(path)[0].splitlines()
+    assert lines[0] == "line 0000000 some log text"
+    assert lines[preview.MAX_LINES - 1] == f"line {preview.MAX_LINES - 1:07d} some log text"
+    assert "not read" in lines[preview.MAX_LINES]
+    assert lines[-1] == "line 0039999 some log text"
+    assert len(lines) == 2 * preview.MAX_LINES + 1
+    assert all(ln.startswith("line ") for ln in lines[preview.MAX_LINES + 1:])  # partial line dropped
+
+
+def test_tail_window_at_an_unaligned_offset(tmp_path):
+    path = tmp_path / "odd.txt"
+    size = preview.HEAD_BYTES + preview.TAIL_BYTES + 12345
+    path.write_bytes(b"a" * (size - 4) + b"\nEND")
+    with open(path, "rb") as f:
+        assert preview._mapped(f, size, size - 4, 100) == b"\nEND"
+    assert preview.read_text(str(path))[0].endswith("END")
+
+
+def test_long_lines_and_bad_utf8_are_tamed(tmp_path):
+    path = tmp_path / "x.txt"
+    path.write_bytes(b"\xef\xbb\xbf" + b"x" * 1000 + b"\n\xff\xfe broken\n")
+    lines = preview.read_text(str(path))[0].splitlines()
+    assert len(lines[0]) == preview.MAX_LINE_CHARS and lines[0].endswith("…")
+    assert lines[1].endswith("broken")
+
+
+def test_image_is_decoded_at_preview_size(qapp, tmp_path):
+    from PyQt6.QtGui import QImage, QColor
+    img = QImage(2000, 1000, QImage.Format.Format_RGB32)
+    img.fill(QColor("#336699"))
+    path = str(tmp_path / "p.png")
+    assert img.save(path)
+    got = preview.build(path)
+    assert got.image.width() == preview.PREVIEW_SIZE[0]
+    assert got.image.height() == preview.PREVIEW_SIZE[0] // 2
+    assert got.detail.startswith("2000 × 1000")
+
+
+def test_can_preview():
+    assert preview.can_preview("A.LOG") and preview.can_preview("x.jpeg")
+    assert not preview.can_preview("setup.exe")
@@ -0,0 +1,81 @@
+import os
+
+from recent import RecentIndex
+
+ROOT = os.path.abspath(os.sep + "nowhere")
+
+
+def P(*parts):
+    return os.path.join(ROOT, *parts)
+
+
+def _listing(folder, mtimes, dirs=()):
+    files = [os.path.join(folder, n) for n in mtimes] + [os.path.join(folder, d) for d in dirs]
+    paths = {os.path.join(folder, n): m for n, m in mtimes.items()}
+    paths.update({os.path.join(folder, d): 0.0 for d in dirs})
+    return folder, files, frozenset(os.path.join(folder, d) for d in dirs), paths
+
+
+class Owner:
+    pass
+
+
+def _index(capacity=3):
+    # folders that were never listed: contents only arrive through on_listing
+    index = RecentIndex(capacity)
+    a, b = Owner(), Owner()
+    index.set_folder(a, P("a"))
+    index.set_folder(b, P("b"))
+    return index, a, b
+
+
+def test_top_is_newest_first_across_folders_and_skips_dirs(qapp):
+    index, _a, _b = _index()
+    index.on_listing(*_listing(P("a"), {"1.txt": 10, "2.txt": 30}, dirs=["sub"]))
+    index.on_listing(*_listing(P("b"), {"3.txt": 20, "4.txt": 40}))
+    assert index.top(3) == [P("b", "4.txt"), P("a", "2.txt"), P("b", "3.txt")]
+    assert len(index) == 4
+
+
+def test_listings_of_unregistered_folders_are_ignored(qapp):
+    index, _a, _b = _index()
+    index.on_listing(*_listing(P("c"), {"x.txt": 99}))
+    assert index.top() == []
+
+
+def test_edit_moves_a_file_up_and_delete_removes_it(qapp):
+    index, _a, _b = _index()
+    index.on_listing(*_listing(P("a"), {"1.txt": 10, "2.txt": 20, "3.txt": 30, "4.txt": 5}))
+    index.on_listing(*_listing(P("a"), {"1.txt": 50, "2.txt": 20, "3.txt": 30, "4.txt": 5}))
+    assert index.top(2) == [P("a", "1.txt"), P("a", "3.txt")]
+    index.on_listing(*_listing(P("a"), {"2.txt": 20, "3.txt": 30, "4.txt": 5}))
+    assert index.top(3) == [P("a", "3.txt"), P("a", "2.txt"), P("a", "4.txt")]
+
+
+def test_file_below_the_cut_is_promoted_after_an_edit(qapp):
+    index, _a, _b = _index(capacity=2)
+    index.on_listing(*_listing(P("a"), {"1.txt": 10, "2.txt": 20, "3.txt": 30}))
+    assert index.top(2) == [P("a", "3.txt"), P("a", "2.txt")]
+    index.on_listing(*_listing(P("a"), {"1.txt": 99, "2.txt": 20, "3.txt": 30}))
+    assert index.top(2) == [P("a", "1.txt"), P("a", "3.txt")]
+
+
+def test_parking_a_zone_drops_its_files(qapp):
+    index, a, b = _index()
+    index.on_listing(*_listing(P("a"), {"1.txt": 10}))
+    index.on_listing(*_listing(P("b"), {"2.txt": 20}))
+    index.remove(b)
+    assert index.top() == [P("a", "1.txt")]
+    index.set_folder(a, None)
+    assert index.top() == [] and len(index) == 0
+
+
+def test_folder_shown_by_two_zones_stays_until_both_leave(qapp):
+    index, a, _b = _index()
+    c = Owner()
+    index.set_folder(c, P("a"))
+    index.on_listing(*_listing(P("a"), {"1.txt": 10}))
+    index.remove(a)
+    assert index.top() == [P("a", "1.txt")]
+    index.remove(c)
+    assert index.top() == []
@@ -0,0 +1,143 @@
+import os, struct
+
+import pytest
+
+import ioscheduler
+import shortcuts
+from conftest import FIXTURES
+
+
+def fixture(name: str) -> bytes:
+    with open(os.path.join(FIXTURES, name), "rb") as f:
+        return f.read()
+
+
+def test_parse_lnk_local_ansi():
+    info, relative = shortcuts.parse_lnk(fixture("local_ansi.lnk"))
+    assert info.kind == "lnk"
+    assert info.target == r"C:\Tools\app.exe"
+    assert info.arguments == "--fast"
+    assert info.icon_index == 2
+    assert relative == ""
+
+
+def test_parse_lnk_unicode_strings_and_env_expansion(monkeypatch):
+    monkeypatch.setenv("USERPROFILE", r"C:\Users\Zoë")
+    info, _relative = shortcuts.parse_lnk(fixture("local_unicode.lnk"))
+    assert info.target == "C:\\Users\\Zoë\\Документы"
+    assert info.description == "My documents"
+    assert info.working_dir == r"C:\Users\Zoë"
+    assert info.icon_location == r"C:\icons\docs.ico"
+
+
+def test_parse_lnk_network_share():
+    info, _relative = shortcuts.parse_lnk(fixture("network.lnk"))
+    assert info.target == r"\\NAS\share\reports\q3.xlsx"
+
+
+def test_parse_lnk_relative_only():
+    info, relative = shortcuts.parse_lnk(fixture("relative.lnk"))
+    assert info.target == ""
+    assert relative == r"..\notes\todo.txt"
+
+
+def test_parse_lnk_environment_block(monkeypatch):
+    monkeypatch.setenv("SystemRoot", r"C:\Windows")
+    info, _relative = shortcuts.parse_lnk(fixture("environment.lnk"))
+    assert info.target == r"C:\Windows\notepad.exe"
+
+
+@pytest.mark.parametrize("name", ["truncated.lnk", "not_a_link.lnk"])
+def test_parse_lnk_rejects_bad_files(name):
+    with pytest.raises(shortcuts.ShortcutError):
+        shortcuts.parse_lnk(fixture(name))
+
+
+def test_parse_lnk_truncated_anywhere_raises_shortcut_error_only():
+    data = fixture("local_unicode.lnk")
+    for n in range(len(data) - 4):  # the last 4 bytes are the optional terminal block
+        try:
+            shortcuts.parse_lnk(data[:n])
+        except shortcuts.ShortcutError:
+            pass
+
+
+def test_link_info_local_and_network():
+    data = fixture("local_ansi.lnk")
+    assert shortcuts._link_info(data, shortcuts.LNK_HEADER_SIZE) == r"C:\Tools\app.exe"
+    data = fixture("network.lnk")
+    assert shortcuts._link_info(data, shortcuts.LNK_HEADER_SIZE) == r"\\NAS\share\reports\q3.xlsx"
+
+
+def test_link_info_without_known_flags_is_empty():
+    info = struct.pack("<7I", 0x1C, 0x1C, 0, 0, 0, 0, 0)
+    assert shortcuts._link_info(info, 0) == ""
+
+
+def test_link_info_corrupt_network_offset():
+    info = struct.pack("<7I", 0x1C, 0x1C, shortcuts.COMMON_NETWORK_RELATIVE_LINK, 0, 0, 0x400, 0)
+    with pytest.raises(struct.error):
+        shortcuts._link_info(info, 0)
+
+
+def test_parse_url():
+    info = shortcuts.parse_url(fixture("web.url").decode("utf-8"))
+    assert info.kind == "url"
+    assert info.url == "https://example.com/docs"
+    assert info.icon_location == r"C:\icons\web.ico"
+    assert info.icon_index == 3
+
+
+def test_parse_url_other_sections_and_bad_icon_index():
+    info = shortcuts.parse_url(fixture("web_bom.url").decode("utf-8-sig"))
+    assert info.url == "https://example.org/ü"
+    assert info.icon_index == 0
+
+
+def test_parse_url_without_url():
+    with pytest.raises(shortcuts.ShortcutError):
+        shortcuts.parse_url(fixture("no_url.url").decode("utf-8"))
+
+
+def test_load_resolves_relative_path_and_marks_broken():
+    info = shortcuts.load(os.path.join(FIXTURES, "relative.lnk"))
+    assert info.target == os.path.normpath(os.path.join(FIXTURES, "..", "notes", "todo.txt"))
+    assert info.broken is True
+
+
+def test_load_leaves_remote_targets_unchecked():
+    info = shortcuts.load(os.path.join(FIXTURES, "network.lnk"))
+    assert info.broken is None
+
+
+def test_is_remote_drive_letters(monkeypatch):
+    types = {"Z:": ioscheduler.DRIVE_REMOTE, "E:": ioscheduler.DRIVE_REMOVABLE, "C:": ioscheduler.DRIVE_FIXED}
+    monkeypatch.setattr(ioscheduler, "drive_type", lambda drive: types.get(drive.upper()))
+    assert shortcuts._is_remote(r"Z:\projects\a.txt")
+    assert shortcuts._is_remote(r"e:\photos")
+    assert not shortcuts._is_remote(r"C:\Tools\app.exe")
+    assert not shortcuts._is_remote("/home/me/file")
+    assert shortcuts._is_remote(r"\\NAS\share")
+
+
+def test_cached_is_keyed_on_mtime_and_keeps_failures(tmp_path):
+    bad = str(tmp_path / "bad.lnk")
+    with open(bad, "wb") as f:
+        f.write(fixture("not_a_link.lnk"))
+    assert shortcuts.resolve(bad, 1.0) is None
+    assert bad in shortcuts._cache  # the failure is remembered
+    good = os.path.join(FIXTURES, "web.url")
+    info = shortcuts.resolve(good, 1.0)
+    assert shortcuts.cached(good, 1.0) is info
+    assert shortcuts.cached(good, 2.0) is None  # changed since it was parsed
+    assert shortcuts.cached(good) is info
+
+
+def test_load_checks_the_icon_file(tmp_path):
+    ico = tmp_path / "app.ico"
+    ico.write_bytes(b"\0\0\1\0")
+    link = tmp_path / "a.url"
+    link.write_text(f"[InternetShortcut]\nURL=https://example.com\nIconFile={ico}\n", encoding="utf-8")
+    assert shortcuts.load(str(link)).has_icon_file is True
+    ico.unlink()
+    assert shortcuts.load(str(link)).has_icon_file is False
@@ -0,0 +1,91 @@
+from itertools import combinations
+
+from spatial import SpatialIndex, snap_rect, arrange, screen_for, ARRANGE_GAP, SNAP_DISTANCE
+
+SCREEN = (0, 0, 1920, 1080)
+
+
+def _overlap(a, b):
+    return a[0] < b[0] + b[2] and b[0] < a[0] + a[2] and a[1] < b[1] + b[3] and b[1] < a[1] + a[3]
+
+
+def test_index_query_update_remove():
+    index = SpatialIndex(bucket=100)
+    index.update("a", (0, 0, 50, 50))
+    index.update("b", (500, 500, 50, 50))
+    assert [k for k, _r in index.query((40, 40, 20, 20))] == ["a"]
+    index.update("a", (480, 480, 30, 30))
+    assert sorted(k for k, _r in index.query((490, 490, 20, 20))) == ["a", "b"]
+    assert index.query((0, 0, 60, 60)) == []
+    index.remove("b")
+    assert len(index) == 1 and index.rect("b") is None
+    assert [k for k, _r in index.query((490, 490, 20, 20), exclude="a")] == []
+
+
+def test_snap_move_to_screen_edge():
+    assert snap_rect((5, 300, 200, 100), SpatialIndex(), [SCREEN]) == (0, 300, 200, 100)
+
+
+def test_snap_move_flush_against_neighbour():
+    index = SpatialIndex()
+    index.update("n", (400, 300, 200, 200))
+    x, y, w, h = snap_rect((400 + 200 + ARRANGE_GAP + 5, 303, 100, 100), index, [SCREEN], key="me")
+    assert (x, y) == (400 + 200 + ARRANGE_GAP, 300)
+
+
+def test_snap_ignores_far_edges_and_self():
+    index = SpatialIndex()
+    index.update("me", (300, 300, 100, 100))
+    rect = (300, 300, 100, 100)
+    assert snap_rect(rect, index, [SCREEN], key="me") == rect
+    far = (SNAP_DISTANCE + 50, 500, 100, 100)
+    assert snap_rect(far, index, [SCREEN], key="x") == far
+
+
+def test_snap_resize_moves_only_given_edges():
+    x, y, w, h = snap_rect((100, 100, 1815, 200), SpatialIndex(), [SCREEN], edges="right")
+    assert (x, y, h) == (100, 100, 200) and x + w == 1920
+
+
+def test_screen_for_centre_and_nearest():
+    screens = [SCREEN, (1920, 0, 1280, 1024)]
+    assert screen_for((2000, 100, 100, 100), screens) == 1
+    assert screen_for((5000, 100, 100, 100), screens) == 1
+    assert screen_for((-500, 100, 100, 100), screens) == 0
+
+
+def test_arrange_packs_without_overlap_and_keeps_sizes():
+    rects = {i: (i * 37 % 900, i * 53 % 600, 200 + i * 10, 150 + (i % 3) * 40) for i in range(12)}
+    out = arrange(rects, [SCREEN])
+    assert set(out) == set(rects)
+    for k, r in out.items():
+        assert r[2:] == rects[k][2:]
+        assert r[0] >= 0 and r[1] >= 0 and r[0] + r[2] <= 1920 and r[1] + r[3] <= 1080
+    assert not any(_overlap(a, b) for a, b in combinations(out.values(), 2))
+
+
+def test_arrange_cascades_overflow_on_screen():
+    rects = {i: (0, 0, 900, 500) for i in range(8)}
+    out = arrange(rects, [SCREEN])
+    assert all(0 <= r[0] < 1920 and 0 <= r[1] < 1080 for r in out.values())
+
+
+def test_arrange_overflow_does_not_cover_packed_zones():
+    out = arrange({i: (0, 0, 900, 500) for i in range(8)}, [SCREEN])
+    packed = [r for r in out.values() if r[1] + r[3] <= 1080]
+    spilled = [r for r in out.values() if r[1] + r[3] > 1080]
+    assert len(packed) == 4 and len(spilled) == 4
+    assert not any(_overlap(a, b) for a in packed for b in spilled)
+    assert not any(_overlap(a, b) for a, b in combinations(packed, 2))
+
+
+def test_arrange_spills_overflow_onto_another_screen():
+    screens = [SCREEN, (1920, 0, 1920, 1080)]
+    out = arrange({i: (0, 0, 900, 500) for i in range(8)}, screens)
+    assert sum(1 for r in out.values() if r[0] >= 1920) == 4
+    assert not any(_overlap(a, b) for a, b in combinations(out.values(), 2))
+
+
+def test_arrange_without_screens_is_identity():
+    rects = {"a": (1, 2, 3, 4)}
+    assert arrange(rects, []) == rects
@@ -0,0 +1,27 @@
+import os
+
+import pytest
+
+import startup_budget
+
+# wall-clock budgets are meaningless on a loaded CI box; the side-effect checks always run
+timing = pytest.mark.skipif(bool(os.environ.get("SKIP_STARTUP_TIMING")), reason="SKIP_STARTUP_TIMING is set")
+
+
+def test_import_has_no_side_effects():
+    timings, created = startup_budget.measure_imports("zone, trayapp")
+    assert "zone" in timings and "trayapp" in timings
+    assert [m for m in startup_budget.LAZY_MODULES if m in timings] == []
+    assert created == []
+
+
+@timing
+def test_import_time_within_budget():
+    best = min(startup_budget.measure_imports()[0]["trayapp"][1] for _ in range(startup_budget.RUNS))
+    assert best / 1000 <= startup_budget.IMPORT_BUDGET_MS
+
+
+@timing
+def test_time_to_tray_within_budget():
+    best = min(startup_budget.measure_time_to_tray() for _ in range(startup_budget.RUNS))
+    assert best <= startup_budget.TRAY_BUDGET_MS
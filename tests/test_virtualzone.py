@@ -0,0 +1,70 @@
+import os, threading, time
+
+from virtualzone import normalize_spec, filter_entries, walk_roots, scan_virtual, chunked, take
+
+
+def _entries(folder):
+    with os.scandir(folder) as it:
+        return list(it)
+
+
+def test_normalize_spec_defaults_and_unknown_keys():
+    spec = normalize_spec({"bogus": 1})
+    assert "bogus" not in spec
+    assert spec["roots"] == [] and spec["extensions"] == []
+    assert spec["depth"] == 0 and spec["limit"] == 500
+
+
+def test_normalize_spec_cleans_values():
+    spec = normalize_spec({"roots": ["C:/a", "", None], "extensions": [" PDF", ".Docx", ""],
+                           "depth": "2", "modified_days": None, "limit": 0})
+    assert spec["roots"] == ["C:/a"]
+    assert spec["extensions"] == [".pdf", ".docx"]
+    assert spec["depth"] == 2
+    assert spec["modified_days"] == 0.0
+    assert spec["limit"] == 1
+
+
+def test_filter_entries_extension_and_pattern(tmp_path):
+    for name in ("Invoice-1.PDF", "invoice-2.txt", "notes.pdf"):
+        (tmp_path / name).write_text("x")
+    spec = normalize_spec({"extensions": ["pdf"], "name_pattern": "*INVOICE*"})
+    assert [e.name for e in filter_entries(_entries(tmp_path), spec)] == ["Invoice-1.PDF"]
+
+
+def test_filter_entries_modified_days(tmp_path):
+    old, new = tmp_path / "old.txt", tmp_path / "new.txt"
+    old.write_text("x")
+    new.write_text("x")
+    week_ago = time.time() - 7 * 86400
+    os.utime(old, (week_ago, week_ago))
+    spec = normalize_spec({"modified_days": 1})
+    assert [e.name for e in filter_entries(_entries(tmp_path), spec)] == ["new.txt"]
+
+
+def test_walk_roots_depth(tmp_path):
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "a" / "b" / "deep.txt").write_text("x")
+    names = lambda depth: sorted(e.name for e in walk_roots([str(tmp_path)], depth, threading.Event()))
+    assert names(0) == ["a"]
+    assert names(1) == ["a", "b"]
+    assert names(-1) == ["a", "b", "deep.txt"]
+
+
+def test_walk_roots_stops_when_cancelled(tmp_path):
+    (tmp_path / "f.txt").write_text("x")
+    cancel = threading.Event()
+    cancel.set()
+    assert list(walk_roots([str(tmp_path)], -1, cancel)) == []
+
+
+def test_scan_virtual_respects_limit(tmp_path):
+    for i in range(10):
+        (tmp_path / f"f{i}.txt").write_text("x")
+    chunks = list(scan_virtual({"roots": [str(tmp_path)], "limit": 4}, threading.Event()))
+    assert sum(len(c) for c in chunks) == 4
+
+
+def test_chunked_and_take():
+    assert list(chunked(range(5), size=2, interval=60)) == [[0, 1], [2, 3], [4]]
+    assert list(take(iter(range(10)), 3)) == [0, 1, 2]
@@ -1,13 +1,23 @@
-import sys, json
+import sys, json, time
 from pathlib import Path
-from PyQt6.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QFileDialog
+from PyQt6.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QInputDialog, QFileDialog
 from PyQt6.QtGui import QIcon, QAction, QColor
-from PyQt6.QtCore import QRect, Qt
+from PyQt6.QtCore import QRect, Qt, QTimer
 
 from zone import Zone
 import saver
-from saver import ZONES_DIR, SETTINGS_DIR, DEFAULT_GLOBALS, load_global_config, save_global_config, asset_path
-from customizer import CustomizerDialog
+from saver import (
+    ZONES_DIR, SETTINGS_DIR, DEFAULT_GLOBALS, load_global_config, save_global_config, asset_path,
+    load_zone_dicts, list_profiles, set_active_profile, active_profile
+)
+from virtualzone import VirtualZoneDialog
+from spatial import SpatialIndex, arrange
+from surface import SurfaceHost
+from idle import SessionMonitor
+from zonepool import ZonePool
+import metrics
+
+METRICS_INTERVAL_MS = 60_000
 
 def _icon_from_disk() -> QIcon:
     p = asset_path("icon.png")
@@ -26,14 +36,40 @@ class TrayApp(QApplication):
 
         self.menu = QMenu()
         a = QAction("Add Zone", self); a.triggered.connect(self.add_zone); self.menu.addAction(a)
+        v = QAction("Add Virtual Zone", self); v.triggered.connect(self.add_virtual_zone); self.menu.addAction(v)
+        r = QAction("Add Recent Zone", self); r.triggered.connect(self.add_recent_zone); self.menu.addAction(r)
+        self.profiles_menu = self.menu.addMenu("Profiles")
+        self.profiles_menu.aboutToShow.connect(self._build_profiles_menu)
         g = QAction("Global Customize", self); g.triggered.connect(self.global_customize); self.menu.addAction(g)
+        self.surface_action = QAction("Single-Surface Mode", self, checkable=True)
+        self.surface_action.setChecked(bool(self.global_config.get("single_surface")))
+        self.surface_action.toggled.connect(self.set_single_surface)
+        self.menu.addAction(self.surface_action)
+        d = QAction("Diagnostics", self); d.triggered.connect(self.show_diagnostics); self.menu.addAction(d)
+        r = QAction("Auto-Arrange Zones", self); r.triggered.connect(self.arrange_zones); self.menu.addAction(r)
         q = QAction("Quit", self); q.triggered.connect(self.quit); self.menu.addAction(q)
 
         self.tray.setContextMenu(self.menu)
         self.tray.show()
 
         self.zones = []
+        self.zone_index = SpatialIndex()
+        self.surface_host = SurfaceHost()
+        self.session = SessionMonitor(self)
+        self.session.locked_changed.connect(self._on_session_locked)
+        self.pool = ZonePool(lambda: Zone(defaults=self.global_config))
+        set_active_profile(self.global_config.get("active_profile") or saver.DEFAULT_PROFILE)
         self._load_saved_zones()
+        if self.global_config.get("single_surface"):
+            self.surface_host.host_all(self.zones)
+
+        # Local metrics file in Prometheus text format, for fleet collection
+        self.metrics_path = saver.BASE_DIR / "metrics.prom"
+        self._diagnostics = None
+        self.metrics_timer = QTimer(self)
+        self.metrics_timer.timeout.connect(self.write_metrics)
+        self.metrics_timer.start(METRICS_INTERVAL_MS)
+        self.aboutToQuit.connect(self._on_quit)
 
     # Make app attributes proxy the global_config dict
     def __getattr__(self, name):
@@ -77,35 +113,56 @@ class TrayApp(QApplication):
             if hasattr(z, "auto_save"): z.auto_save()
 
     def global_customize(self):
+        from customizer import CustomizerDialog
         dlg = CustomizerDialog(self.tray, self, mode="Global", on_change=self._on_global_change)
         dlg.setWindowModality(Qt.WindowModality.NonModal)
         dlg.show()
 
     def _load_saved_zones(self):
-        if not ZONES_DIR.exists():
-            return
-        for p in ZONES_DIR.glob("*.json"):
+        for data in load_zone_dicts():
             try:
-                with open(p, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                title = data.get("zone_name") or data.get("title") or "Zone"
-                folder = data.get("folder") or None
-                z = Zone(title=title, folder=folder, defaults=self.global_config)
-                for k, v in data.items():
-                    if k == "geometry":
-                        continue
-                    if hasattr(z, k):
-                        setattr(z, k, v)
-                geom = data.get("geometry")
-                if isinstance(geom, (list, tuple)) and len(geom) == 4:
-                    z.setGeometry(QRect(*map(int, geom)))
-                else:
-                    z.adjust_window_size()
-                z.refresh_grid()
+                z = self.pool.acquire(data.get("folder"))
+                z.rebind(data, self.global_config, snapshot=True)
                 self.zones.append(z)
-                z.show()
+                self._show_zone(z)
             except Exception as e:
-                print(f"[Tray] Failed to load {p.name}: {e}")
+                print(f"[Tray] Failed to load {data.get('zone_name')}: {e}")
+
+    # ---------------- Profiles ----------------
+    def _build_profiles_menu(self):
+        self.profiles_menu.clear()
+        current = active_profile()
+        for name in list_profiles():
+            act = self.profiles_menu.addAction(name)
+            act.setCheckable(True)
+            act.setChecked(name == current)
+            act.triggered.connect(lambda _c, n=name: self.switch_profile(n))
+        self.profiles_menu.addSeparator()
+        self.profiles_menu.addAction("New Profile from Current...", self.new_profile)
+
+    def new_profile(self):
+        name, ok = QInputDialog.getText(None, "New Profile", "Profile name:")
+        if not ok or not name.strip():
+            return
+        name = saver.safe_name(name.strip())
+        for z in self.zones:
+            saver.save_zone_config(z, profile=name)
+        self.switch_profile(name)
+
+    def switch_profile(self, name: str):
+        """Swap the visible zone set for another profile's, reusing pooled windows."""
+        if name == active_profile():
+            return
+        t0 = time.perf_counter()
+        for z in self.zones:
+            z.save_now()  # before the active profile (and so the save folder) changes
+            self.pool.release(z)
+        self.zones = []
+        set_active_profile(name)
+        self.active_profile = active_profile()
+        self._save_global()
+        self._load_saved_zones()
+        metrics.observe("profile_switch", time.perf_counter() - t0)
 
     def add_zone(self):
         dlg = QFileDialog()
@@ -116,10 +173,86 @@ class TrayApp(QApplication):
                 z = Zone(title=Path(d).name or "Zone", folder=d, defaults=self.global_config)
                 z.adjust_window_size()
                 z.refresh_grid()
-                z.show()
+                self._show_zone(z)
                 self.zones.append(z)
                 z.auto_save()
 
+    # ---------------- Diagnostics ----------------
+    def show_diagnostics(self):
+        from diagnostics import DiagnosticsDialog
+        if self._diagnostics is None:
+            self._diagnostics = DiagnosticsDialog(self)
+            self._diagnostics.finished.connect(lambda _r: setattr(self, "_diagnostics", None))
+        self._diagnostics.show()
+        self._diagnostics.raise_()
+
+    def write_metrics(self):
+        try:
+            metrics.write_metrics_file(self.metrics_path, self.zones)
+        except Exception as e:
+            print(f"[Tray] Failed to write metrics: {e}")
+        return self.metrics_path
+
+    def _on_quit(self):
+        for z in self.zones:
+            if z.save_pending:
+                z.save_now()
+            if z.isVisible():
+                z.save_snapshot()
+        self.write_metrics()
+
+    def _on_session_locked(self, locked: bool):
+        for z in self.zones:
+            if locked:
+                z.pause_background()
+            else:
+                z.resume_background()
+
+    def set_single_surface(self, enabled: bool):
+        """Switch between one window per zone and one shared surface per screen."""
+        self.single_surface = bool(enabled)
+        self._save_global()
+        if enabled:
+            self.surface_host.host_all(self.zones)
+        else:
+            self.surface_host.release_all(self.zones)
+
+    def _show_zone(self, z):
+        z.show()
+        if self.surface_host.active:
+            self.surface_host.attach(z)
+
+    def arrange_zones(self):
+        screens = [(g.x(), g.y(), g.width(), g.height()) for g in (s.availableGeometry() for s in self.screens())]
+        visible = [z for z in self.zones if z.isVisible()]
+        rects = {z: (g.x(), g.y(), g.width(), g.height()) for z, g in ((z, z.global_geometry()) for z in visible)}
+        for z, r in arrange(rects, screens).items():
+            if r != rects[z]:
+                z.set_global_geometry(QRect(*r))
+                z.auto_save()
+
+    def add_recent_zone(self):
+        z = Zone(title="Recent", defaults=self.global_config)
+        z.set_recent(save=False)
+        z.adjust_window_size()
+        self._show_zone(z)
+        self.zones.append(z)
+        z.auto_save()
+
+    def add_virtual_zone(self):
+        dlg = VirtualZoneDialog()
+        if dlg.exec():
+            spec = dlg.spec()
+            if not spec["roots"]:
+                return
+            title, ok = QInputDialog.getText(None, "Virtual Zone", "Zone name:", text="Virtual Zone")
+            if not ok:
+                return
+            z = Zone(title=title or "Virtual Zone", defaults=self.global_config, virtual=spec)
+            self._show_zone(z)
+            self.zones.append(z)
+            z.auto_save()
+
 if __name__ == "__main__":
     import signal
     signal.signal(signal.SIGINT, signal.SIG_DFL)
@@ -0,0 +1,198 @@
+from __future__ import annotations
+import os, fnmatch, threading, time
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator
+
+from PyQt6.QtWidgets import (
+    QDialog, QFormLayout, QSpinBox, QLineEdit, QDialogButtonBox, QDoubleSpinBox
+)
+from PyQt6.QtCore import QObject, pyqtSignal
+
+import metrics
+import shortcuts
+
+# A virtual zone is described by a plain dict so it can live in the zone JSON as-is.
+DEFAULT_VIRTUAL: Dict[str, Any] = {
+    "roots": [],
+    "depth": 0,             # 0 = only the roots themselves, -1 = unlimited
+    "extensions": [],       # e.g. [".pdf", ".docx"]; empty = any
+    "modified_days": 0.0,   # only entries modified within N days; 0 = any age
+    "name_pattern": "",     # fnmatch pattern, e.g. "*invoice*"
+    "limit": 500,
+}
+
+CHUNK_SIZE = 64
+CHUNK_INTERVAL = 0.15  # seconds; flush a partial chunk if the scan is slow
+
+
+def normalize_spec(spec: Dict[str, Any] | None) -> Dict[str, Any]:
+    out = DEFAULT_VIRTUAL.copy()
+    if spec:
+        out.update({k: v for k, v in spec.items() if k in DEFAULT_VIRTUAL})
+    out["roots"] = [str(r) for r in (out["roots"] or []) if r]
+    out["extensions"] = [
+        (e if e.startswith(".") else "." + e).lower()
+        for e in (x.strip() for x in out["extensions"] or []) if e
+    ]
+    out["depth"] = int(out["depth"])
+    out["modified_days"] = float(out["modified_days"] or 0)
+    out["limit"] = max(1, int(out["limit"]))
+    return out
+
+
+# ---------------- Pipeline stages ----------------
+def walk_roots(roots: Iterable[str], depth: int, cancel: threading.Event) -> Iterator[os.DirEntry]:
+    """Yield directory entries under each root, breadth-first, down to `depth` levels."""
+    for root in roots:
+        pending = deque([(root, 0)])
+        while pending:
+            if cancel.is_set():
+                return
+            folder, level = pending.popleft()
+            try:
+                with os.scandir(folder) as it:
+                    for entry in it:
+                        if cancel.is_set():
+                            return
+                        yield entry
+                        if (depth < 0 or level < depth) and entry.is_dir(follow_symlinks=False):
+                            pending.append((entry.path, level + 1))
+            except OSError:
+                continue
+
+
+def filter_entries(entries: Iterable[os.DirEntry], spec: Dict[str, Any]) -> Iterator[os.DirEntry]:
+    exts = tuple(spec["extensions"])
+    pattern = (spec["name_pattern"] or "").lower()
+    cutoff = time.time() - spec["modified_days"] * 86400 if spec["modified_days"] > 0 else None
+    for entry in entries:
+        name = entry.name.lower()
+        if exts and not name.endswith(exts):
+            continue
+        if pattern and not fnmatch.fnmatch(name, pattern):
+            continue
+        if cutoff is not None:
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    continue
+            except OSError:
+                continue
+        yield entry
+
+
+def take(items: Iterable, limit: int) -> Iterator:
+    for i, item in enumerate(items):
+        if i >= limit:
+            return
+        yield item
+
+
+def chunked(items: Iterable, size: int = CHUNK_SIZE, interval: float = CHUNK_INTERVAL) -> Iterator[list]:
+    chunk: list = []
+    last = time.monotonic()
+    for item in items:
+        chunk.append(item)
+        now = time.monotonic()
+        if len(chunk) >= size or now - last >= interval:
+            yield chunk
+            chunk = []
+            last = now
+    if chunk:
+        yield chunk
+
+
+def scan_virtual(spec: Dict[str, Any], cancel: threading.Event) -> Iterator[list[str]]:
+    """Full pipeline: roots -> filter -> cap -> chunks of paths."""
+    spec = normalize_spec(spec)
+    entries = walk_roots(spec["roots"], spec["depth"], cancel)
+    matches = (_resolved(e) for e in filter_entries(entries, spec))
+    yield from chunked(take(matches, spec["limit"]))
+
+
+def _resolved(entry: os.DirEntry) -> str:
+    """The entry's path, with shortcuts parsed here so the zone's cells only hit the cache."""
+    if shortcuts.is_shortcut(entry.name):
+        try:
+            shortcuts.resolve(entry.path, entry.stat().st_mtime)
+        except OSError:
+            pass
+    return entry.path
+
+
+# ---------------- Background scanner ----------------
+class VirtualScanner(QObject):
+    """Runs scan_virtual on a worker thread and hands chunks back to the GUI thread."""
+    chunk_ready = pyqtSignal(int, list)
+    finished = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.token = 0
+        self._cancel: threading.Event | None = None
+
+    def start(self, spec: Dict[str, Any]) -> int:
+        self.cancel()
+        self.token += 1
+        token, cancel = self.token, threading.Event()
+        self._cancel = cancel
+
+        def run():
+            t0 = time.perf_counter()
+            for chunk in scan_virtual(spec, cancel):
+                if cancel.is_set():
+                    return
+                self.chunk_ready.emit(token, chunk)
+            if not cancel.is_set():
+                metrics.observe("virtual_scan", time.perf_counter() - t0)
+                self.finished.emit(token)
+
+        threading.Thread(target=run, daemon=True).start()
+        return token
+
+    def cancel(self):
+        if self._cancel is not None:
+            self._cancel.set()
+            self._cancel = None
+
+
+# ---------------- Rules dialog ----------------
+class VirtualZoneDialog(QDialog):
+    def __init__(self, parent=None, spec: Dict[str, Any] | None = None):
+        super().__init__(parent)
+        self.setWindowTitle("Virtual Zone Rules")
+        spec = normalize_spec(spec)
+        form = QFormLayout(self)
+
+        self.roots = QLineEdit("; ".join(spec["roots"]))
+        self.roots.setPlaceholderText("C:\\Users\\me\\Desktop; C:\\Users\\me\\Downloads")
+        self.depth = QSpinBox(); self.depth.setRange(-1, 32); self.depth.setValue(spec["depth"])
+        self.depth.setSpecialValueText("Unlimited")
+        self.extensions = QLineEdit(", ".join(spec["extensions"]))
+        self.extensions.setPlaceholderText(".pdf, .docx")
+        self.days = QDoubleSpinBox(); self.days.setRange(0, 3650); self.days.setValue(spec["modified_days"])
+        self.days.setSpecialValueText("Any")
+        self.pattern = QLineEdit(spec["name_pattern"])
+        self.pattern.setPlaceholderText("*report*")
+        self.limit = QSpinBox(); self.limit.setRange(1, 100000); self.limit.setValue(spec["limit"])
+
+        form.addRow("Folders (; separated):", self.roots)
+        form.addRow("Depth:", self.depth)
+        form.addRow("Extensions:", self.extensions)
+        form.addRow("Modified within (days):", self.days)
+        form.addRow("Name pattern:", self.pattern)
+        form.addRow("Max results:", self.limit)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        form.addRow(buttons)
+
+    def spec(self) -> Dict[str, Any]:
+        return normalize_spec({
+            "roots": [r.strip() for r in self.roots.text().split(";") if r.strip()],
+            "depth": self.depth.value(),
+            "extensions": self.extensions.text().replace(";", ",").split(","),
+            "modified_days": self.days.value(),
+            "name_pattern": self.pattern.text().strip(),
+            "limit": self.limit.value(),
+        })
@@ -1,20 +1,75 @@
-import os
+import os, time, hashlib
 from pathlib import Path
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QGridLayout, QLabel, QPushButton, QScrollArea, QMenu,
-    QInputDialog, QLineEdit, QFileDialog, QVBoxLayout as QVBL, QFileIconProvider, QApplication
+    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QPushButton, QScrollArea, QMenu,
+    QInputDialog, QLineEdit, QFileDialog, QProgressDialog, QMessageBox, QVBoxLayout as QVBL,
+    QFileIconProvider, QApplication
 )
-from PyQt6.QtGui import QIcon, QCursor, QColor, QFont
-from PyQt6.QtCore import Qt, QSize, QFileInfo, QPoint
+from PyQt6.QtGui import QIcon, QCursor, QColor, QFont, QPixmap
+from PyQt6.QtCore import Qt, QSize, QFileInfo, QPoint, QRect, QTimer, QFileSystemWatcher
 
 import saver
-from saver import ZONES_DIR, save_zone_config, DEFAULT_GLOBALS, asset_path
-from customizer import CustomizerDialog
+from saver import ZONES_DIR, save_zone_config, DEFAULT_GLOBALS, asset_path, save_zone_snapshot, load_zone_snapshot
+from virtualzone import VirtualScanner, VirtualZoneDialog, normalize_spec
+from foldercache import LRUCache, shared_listings
+from ingest import IngestJob, same_volume
+from spatial import snap_rect
+from idle import IdleSnapshot, IDLE_AFTER_MS
+import ioscheduler
+import shortcuts
+import recent
+import foldersize
+import archive
+import preview
+import metrics
 
-icon_provider = QFileIconProvider()
+_icon_provider: QFileIconProvider | None = None
+
+
+def icon_provider() -> QFileIconProvider:
+    """Shared provider, created on first use rather than at import."""
+    global _icon_provider
+    if _icon_provider is None:
+        _icon_provider = QFileIconProvider()
+    return _icon_provider
+
+
+# Icons only depend on the extension (or on "folder"), so they are shared by all zones.
+_icon_cache: dict[str, QIcon] = {}
+
+
+def cached_icon(key: str, factory) -> QIcon:
+    icon = _icon_cache.get(key)
+    if icon is not None:
+        metrics.inc("icon_cache_hits")
+        return icon
+    metrics.inc("icon_cache_misses")
+    icon = _icon_cache[key] = factory()
+    return icon
+
+
+def icon_cache_size() -> int:
+    return len(_icon_cache)
+
+NAV_CACHE_SIZE = 8  # folders whose built cells are kept around for instant back/forward
+RELOAD_DEBOUNCE_MS = 300
+SAVE_DEBOUNCE_MS = 500
+
+
+def _rect_tuple(r: QRect) -> tuple[int, int, int, int]:
+    return r.x(), r.y(), r.width(), r.height()
 
 class Zone(QWidget):
-    def __init__(self, title: str = "Zone", folder: str | None = None, defaults: dict | None = None):
+    RESIZE_MARGIN = 6
+    GRID_SPACING = 8
+    WINDOW_FLAGS = (
+        Qt.WindowType.FramelessWindowHint |
+        Qt.WindowType.WindowStaysOnBottomHint |
+        Qt.WindowType.Tool
+    )
+
+    def __init__(self, title: str = "Zone", folder: str | None = None, defaults: dict | None = None,
+                 virtual: dict | None = None):
         super().__init__(None)
 
         base_defaults = DEFAULT_GLOBALS.copy()
@@ -33,6 +88,8 @@ class Zone(QWidget):
         self.cell_size = self.cell_icon_size + self.label_height
         self.scale_offset_x = defaults["scale_offset_x"]
         self.scale_offset_y = defaults["scale_offset_y"]
+        self.sort_by = defaults.get("sort_by", "name")
+        self.hover_preview = bool(defaults.get("hover_preview", False))
 
         # colors
         self.bg_color = QColor(defaults["bg_color"])
@@ -46,21 +103,28 @@ class Zone(QWidget):
         self.file_list: list[str] = []
         self.folder = None
         self.local_overrides: set[str] = set()
+        self.cells_built = 0
+        self.last_refresh_ms = 0.0
+        self.virtual: dict | None = None
+        self._scanner: VirtualScanner | None = None
+        self.recent_limit: int | None = None  # set for the built-in Recent zone
+
+        # in-zone browsing: folder stays the configured root, browse_folder is where we are
+        self.browse_folder: str | None = None
+        self._nav_history: list[str] = []
+        self._listings = shared_listings()
+        self._listing_requests: dict[str, ioscheduler.IORequest] = {}  # purpose -> in flight
+        self._cell_cache = LRUCache(NAV_CACHE_SIZE, on_evict=lambda _k, hit: [c.deleteLater() for c in hit[1]])
 
         if folder:
             self.folder = folder
-            try:
-                self.file_list = [os.path.join(folder, f) for f in os.listdir(folder)]
-            except Exception:
-                self.file_list = []
+            self.file_list = self._listings.listing(folder)
 
         # Window flags
-        self.setWindowFlags(
-            Qt.WindowType.FramelessWindowHint |
-            Qt.WindowType.WindowStaysOnBottomHint |
-            Qt.WindowType.Tool
-        )
+        self.setWindowFlags(self.WINDOW_FLAGS)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setAcceptDrops(True)
+        self._ingest_jobs: dict[IngestJob, QWidget] = {}  # job -> its progress dialog
 
         # Layout
         self.layout = QVBoxLayout(self)
@@ -76,6 +140,28 @@ class Zone(QWidget):
         self.title_bar.customContextMenuRequested.connect(self.open_title_menu)
         self.layout.addWidget(self.title_bar)
 
+        # Breadcrumb (only visible while browsing below the zone's folder)
+        self.nav_bar = QWidget()
+        nav = QHBoxLayout(self.nav_bar)
+        nav.setContentsMargins(2, 0, 2, 0)
+        nav.setSpacing(2)
+        self.back_btn = QPushButton("\u2190")
+        self.back_btn.setToolTip("Back")
+        self.back_btn.clicked.connect(self.navigate_back)
+        self.up_btn = QPushButton("\u2191")
+        self.up_btn.setToolTip("Up")
+        self.up_btn.clicked.connect(self.navigate_up)
+        for b in (self.back_btn, self.up_btn):
+            b.setFixedSize(20, 18)
+        self.crumb_label = QLabel()
+        self.crumb_label.linkActivated.connect(lambda href: self.navigate_to(href))
+        nav.addWidget(self.back_btn)
+        nav.addWidget(self.up_btn)
+        nav.addWidget(self.crumb_label, 1)
+        self._apply_nav_style()
+        self.nav_bar.hide()
+        self.layout.addWidget(self.nav_bar)
+
         # Scrollable grid
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
@@ -84,49 +170,544 @@ class Zone(QWidget):
         self.grid_layout = QGridLayout(self.grid_widget)
         self.grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter)
         self.grid_layout.setContentsMargins(self.scale_offset_x, self.scale_offset_y, self.scale_offset_x, self.scale_offset_y)
-        self.grid_layout.setSpacing(8)
+        self.grid_layout.setSpacing(self.GRID_SPACING)
         self.grid_widget.setStyleSheet(f"background-color: {self.bg_color.name()};")
         self.grid_widget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.grid_widget.customContextMenuRequested.connect(self.open_zone_menu)
         self.scroll_area.setWidget(self.grid_widget)
         self.layout.addWidget(self.scroll_area)
 
+        # Interactive move/resize: pointer events only record the target geometry,
+        # a timer running at the display refresh rate applies it.
+        self.resize_dir: str | None = None
+        self._press_pos: QPoint | None = None
+        self._start_geom: QRect | None = None
+        self._pending_geom: QRect | None = None
+        self._frame_timer = QTimer(self)
+        self._frame_timer.timeout.connect(self._apply_pending_geometry)
+        for w in (self, self.title_bar, self.scroll_area, self.scroll_area.viewport(), self.grid_widget):
+            w.setMouseTracking(True)
+
+        # Idle mode: after a quiet period the widget tree is swapped for one cached pixmap
+        self.idle = False
+        self._paused = False
+        self._needs_build = False  # showing a restored snapshot; cells not built yet
+        self._snapshot_key: tuple | None = None  # what the last saved snapshot showed
+        self._idle_hidden: list[QWidget] = []
+        self._snapshot = IdleSnapshot(self)
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.timeout.connect(self.enter_idle)
+        self._idle_timer.start(IDLE_AFTER_MS)
+
+        # Folder watcher; bursts of changes collapse into one reload
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(lambda _p: self._reload_timer.start(RELOAD_DEBOUNCE_MS))
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.timeout.connect(self._reload_folder)
+        self._resort_timer = QTimer(self)  # folder sizes trickling in while sorted by size
+        self._resort_timer.setSingleShot(True)
+        self._resort_timer.timeout.connect(self.refresh_grid)
+        foldersize.sizes().ready.connect(self._on_folder_size)
+        self._hovered_file = None
+        self._preview_timer = QTimer(self)  # only a cell the pointer rests on is previewed
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.timeout.connect(self._show_preview)
+        self._watch_current()
+
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self.save_now)
+
         self.adjust_window_size()
 
+        if virtual:
+            self.set_virtual(virtual, save=False)
+
     # ---- small helpers ----
     def _apply_title_style(self):
-        self.title_bar.setStyleSheet(
+        css = (
             f"background-color: {self.title_bg.name()}; "
             f"color: {self.title_text.name()}; "
             f"font-size: {self.title_text_size}px; font-weight: bold; padding-left:2px;"
         )
+        if self.title_bar.styleSheet() != css:
+            self.title_bar.setStyleSheet(css)
+        if hasattr(self, "nav_bar"):
+            self._apply_nav_style()
+
+    def _apply_nav_style(self):
+        css = (
+            f"background-color: {self.bg_color.name()}; color: {self.name_color.name()}; "
+            f"font-size: {self.text_size}px; border:none;"
+        )
+        if self.nav_bar.styleSheet() != css:
+            self.nav_bar.setStyleSheet(css)
+
+    def _shortcut_icon(self, info: shortcuts.Shortcut) -> QIcon | None:
+        """Icon of what a shortcut points at: its .ico, the target program, or the target's type."""
+        icon = None
+        loc = info.icon_location
+        if info.has_icon_file:  # checked when the shortcut was parsed, off the GUI thread
+            icon = cached_icon("ico:" + loc.lower(), lambda: QIcon(loc))
+        elif info.target and info.broken is False:
+            target = info.target
+            if info.target_is_dir:
+                icon = self._folder_icon(target)
+            elif target.lower().endswith((".exe", ".ico")):
+                # programs carry their own icon
+                icon = cached_icon("target:" + target.lower(), lambda: icon_provider().icon(QFileInfo(target)))
+            else:
+                icon = self._extension_icon(target)
+        elif info.target and (info.broken or os.path.splitext(info.target)[1]):
+            # targets on shares are never touched here: only their extension says what they are
+            icon = self._extension_icon(info.target)
+        if icon is not None and info.broken:
+            size = QSize(self.cell_icon_size, self.cell_icon_size)
+            base = icon
+            icon = cached_icon(f"broken:{info.target.lower()}:{self.cell_icon_size}",
+                               lambda: QIcon(base.pixmap(size, QIcon.Mode.Disabled)))
+        return icon
+
+    def _folder_icon(self, path: str) -> QIcon:
+        icon_file = asset_path("folder.png")
+        return cached_icon(":folder", lambda: QIcon(str(icon_file)) if icon_file.exists()
+                           else icon_provider().icon(QFileInfo(str(path))))
 
     def _extension_icon(self, path: str) -> QIcon:
-        ext = os.path.splitext(path)[1]
+        ext = os.path.splitext(path)[1].lower()
         if ext == "":
-            return icon_provider.icon(QFileInfo(path))
-        return icon_provider.icon(QFileInfo("dummy" + ext))
+            return icon_provider().icon(QFileInfo(path))  # depends on the file itself, so not shared
+        return cached_icon(ext, lambda: icon_provider().icon(QFileInfo("dummy" + ext)))
+
+    # ---------------- Dragging / resizing ----------------
+    def _edge_at(self, pos: QPoint) -> str | None:
+        m = self.RESIZE_MARGIN
+        rect = self.rect()
+        vert = "top" if pos.y() < m else "bottom" if pos.y() > rect.height() - m else ""
+        horz = "left" if pos.x() < m else "right" if pos.x() > rect.width() - m else ""
+        return (vert + horz) or None
+
+    def _update_cursor(self, edge: str | None):
+        if edge in ("topleft", "bottomright"):
+            self.setCursor(Qt.CursorShape.SizeFDiagCursor)
+        elif edge in ("topright", "bottomleft"):
+            self.setCursor(Qt.CursorShape.SizeBDiagCursor)
+        elif edge in ("left", "right"):
+            self.setCursor(Qt.CursorShape.SizeHorCursor)
+        elif edge in ("top", "bottom"):
+            self.setCursor(Qt.CursorShape.SizeVerCursor)
+        else:
+            self.unsetCursor()
+
+    def _frame_interval(self) -> int:
+        screen = self.screen() or QApplication.primaryScreen()
+        rate = screen.refreshRate() if screen else 0
+        return max(4, int(1000 / (rate if rate > 0 else 60)))
+
+    def _snapped(self, geom: QRect, edges: str) -> QRect:
+        index = getattr(QApplication.instance(), "zone_index", None)
+        if index is None or QApplication.keyboardModifiers() & Qt.KeyboardModifier.AltModifier:
+            return geom  # hold Alt to place freely
+        screens = [_rect_tuple(s.availableGeometry()) for s in QApplication.screens()]
+        return QRect(*snap_rect(_rect_tuple(geom), index, screens, key=self, edges=edges))
+
+    def _update_index(self):
+        index = getattr(QApplication.instance(), "zone_index", None)
+        if index is not None:
+            if self.isVisible():
+                index.update(self, _rect_tuple(self.global_geometry()))
+            else:
+                index.remove(self)
+
+    def moveEvent(self, event):
+        super().moveEvent(event)
+        self._update_index()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._update_index()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._hide_preview()
+        self._update_index()
+
+    def global_geometry(self) -> QRect:
+        """Geometry in screen coordinates, whether top-level or hosted on a surface."""
+        if self.parentWidget() is None:
+            return self.geometry()
+        return QRect(self.parentWidget().mapToGlobal(self.pos()), self.size())
+
+    def set_global_geometry(self, rect: QRect):
+        if self.parentWidget() is None:
+            self.setGeometry(rect)
+        else:
+            self.setGeometry(rect.translated(-self.parentWidget().mapToGlobal(QPoint(0, 0))))
+
+    def _apply_pending_geometry(self):
+        if self._pending_geom is not None and self._pending_geom != self.global_geometry():
+            self.set_global_geometry(self._pending_geom)
+        self._pending_geom = None
 
-    # ---------------- Dragging ----------------
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton and not self.locked:
-            local_pos = self.mapFromGlobal(event.globalPosition().toPoint())
-            if self.title_bar.geometry().contains(local_pos):
-                self.drag_pos = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
-                event.accept()
+            gpos = event.globalPosition().toPoint()
+            local_pos = self.mapFromGlobal(gpos)
+            edge = self._edge_at(local_pos)
+            if edge:
+                self.resize_dir = edge
+                self._press_pos = gpos
+                self._start_geom = self.global_geometry()
+            elif self.title_bar.geometry().contains(local_pos):
+                self.drag_pos = gpos - self.global_geometry().topLeft()
+            else:
+                return
+            if self.parentWidget() is not None:
+                self.raise_()  # hosted on a shared surface: bring to front among siblings
+            self._frame_timer.start(self._frame_interval())
+            event.accept()
 
     def mouseMoveEvent(self, event):
+        gpos = event.globalPosition().toPoint()
         if self.drag_pos:
-            self.move(event.globalPosition().toPoint() - self.drag_pos)
+            self._pending_geom = self._snapped(QRect(gpos - self.drag_pos, self.size()), "leftrighttopbottom")
+            event.accept()
+        elif self.resize_dir:
+            self._pending_geom = self._snapped(self._resized_geometry(gpos), self.resize_dir)
             event.accept()
+        elif not self.locked:
+            self._update_cursor(self._edge_at(self.mapFromGlobal(gpos)))
 
     def mouseReleaseEvent(self, event):
+        if self.drag_pos is None and self.resize_dir is None:
+            return
+        self._frame_timer.stop()
+        gpos = event.globalPosition().toPoint()
+        if self.drag_pos:
+            self._pending_geom = self._snapped(QRect(gpos - self.drag_pos, self.size()), "leftrighttopbottom")
+        else:
+            self._pending_geom = self._snapped(self._resized_geometry(gpos), self.resize_dir)
+        self._apply_pending_geometry()
+        if self.resize_dir:
+            self._reflow_cells()
+            # keep the size the user picked when global rows/cols change later
+            self.local_overrides.update(("rows", "cols"))
         self.drag_pos = None
+        self.resize_dir = None
+        self._press_pos = self._start_geom = None
+        self.unsetCursor()
+        host = getattr(QApplication.instance(), "surface_host", None)
+        if host is not None and host.active and self.parentWidget() is not None:
+            host.attach(self)  # may have been dragged onto another screen's surface
+        self.auto_save()
+
+    def _resized_geometry(self, gpos: QPoint) -> QRect:
+        diff = gpos - self._press_pos
+        geom = QRect(self._start_geom)
+        min_w, min_h = self.cell_size + 2 * self.RESIZE_MARGIN, self.title_bar.height() + self.cell_size // 2
+        if "left" in self.resize_dir:
+            geom.setLeft(min(geom.left() + diff.x(), geom.right() - min_w))
+        if "right" in self.resize_dir:
+            geom.setRight(max(geom.right() + diff.x(), geom.left() + min_w))
+        if "top" in self.resize_dir:
+            geom.setTop(min(geom.top() + diff.y(), geom.bottom() - min_h))
+        if "bottom" in self.resize_dir:
+            geom.setBottom(max(geom.bottom() + diff.y(), geom.top() + min_h))
+        return geom
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_index()
+        if self.idle and event.size() != self._snapshot.size():
+            self.wake()
+        if self.resize_dir:
+            self._reflow_cells()
+
+    def _reflow_cells(self):
+        """Recompute rows/cols from the current size and move the existing cells into place."""
+        v_w = self.scroll_area.verticalScrollBar().sizeHint().width()
+        step = self.cell_size + self.GRID_SPACING
+        avail_w = self.width() - v_w - 2 * self.scale_offset_x + self.GRID_SPACING
+        avail_h = self.height() - self.title_bar.height() - 2 * self.scale_offset_y + self.GRID_SPACING
+        cols, rows = max(1, avail_w // step), max(1, avail_h // step)
+        self.rows = rows
+        if cols == self.cols:
+            return
+        self.cols = cols
+        cells = []
+        for i in range(self.grid_layout.count()):
+            w = self.grid_layout.itemAt(i).widget()
+            if w is not None and w is not self.search_bar:
+                r, c, _rs, _cs = self.grid_layout.getItemPosition(i)
+                cells.append((r, c, w))
+        cells.sort(key=lambda t: (t[0], t[1]))
+        for _r, _c, w in cells:
+            self.grid_layout.removeWidget(w)
+        if self.search_bar:
+            self.grid_layout.removeWidget(self.search_bar)
+            self.grid_layout.addWidget(self.search_bar, 0, 0, 1, self.cols)
+        start_row = 1 if self.search_bar else 0
+        for idx, (_r, _c, w) in enumerate(cells):
+            self.grid_layout.addWidget(w, idx // self.cols + start_row, idx % self.cols)
+
+    # ---------------- Idle mode / background work ----------------
+    def enter_idle(self):
+        """Render the zone once and show only that image until something needs the live widgets."""
+        if self.idle or not self.isVisible():
+            return
+        busy = self.underMouse() or self.search_bar or self.drag_pos or self.resize_dir or self._ingest_jobs
+        if busy:
+            self._idle_timer.start(IDLE_AFTER_MS)
+            return
+        self._show_snapshot(self.grab())
+        self.save_snapshot()
+
+    def _show_snapshot(self, pixmap: QPixmap):
+        self._idle_hidden = [w for w in (self.title_bar, self.nav_bar, self.scroll_area) if not w.isHidden()]
+        self._snapshot.setGeometry(self.rect())
+        self._snapshot.set_pixmap(pixmap)
+        self._snapshot.show()
+        self._snapshot.raise_()
+        for w in self._idle_hidden:
+            w.hide()
+        self.idle = True
+
+    def wake(self):
+        if self.idle:
+            self.idle = False
+            scroll = None
+            if self._needs_build:
+                # restored from disk at startup: build the live grid now
+                self.refresh_grid()
+                scroll = self._snapshot.property("scroll")
+            for w in self._idle_hidden:
+                w.show()
+            self._idle_hidden = []
+            self._snapshot.hide()
+            self._snapshot.set_pixmap(QPixmap())
+            if scroll:
+                QTimer.singleShot(0, lambda v=int(scroll): self.scroll_area.verticalScrollBar().setValue(v))
+        if not self._paused:
+            self._idle_timer.start(IDLE_AFTER_MS)
+
+    # ---------------- Persisted snapshots ----------------
+    def listing_fingerprint(self) -> str:
+        """Changes whenever the grid would look different: entries, cell style, columns, size."""
+        h = hashlib.sha1()
+        for name in sorted(os.path.basename(str(f)) for f in self.file_list):
+            h.update(name.encode("utf-8", "surrogatepass") + b"\0")
+        folders_first = getattr(QApplication.instance(), "folders_first", True)
+        h.update(repr((self._cell_key(""), self.cols, folders_first, self.title_bar.text(),
+                       self.bg_color.name(), self.title_bg.name(), self.title_text.name(),
+                       self.width(), self.height())).encode())
+        return h.hexdigest()
+
+    def save_snapshot(self):
+        """Persist what the zone currently shows, unless that is already on disk."""
+        if self.virtual is not None or self.browse_folder or not self.folder:
+            return
+        key = (self.listing_fingerprint(), self.scroll_area.verticalScrollBar().value())
+        if key == self._snapshot_key:
+            return
+        pixmap = self._snapshot.pixmap if self.idle else self.grab()
+        if pixmap.isNull():
+            return
+        try:
+            save_zone_snapshot(self.title_bar.text(), pixmap, {"fingerprint": key[0], "scroll": key[1]})
+            self._snapshot_key = key
+        except Exception as e:
+            print(f"[Zone] Failed to save snapshot: {e}")
+
+    def restore_snapshot(self) -> bool:
+        """Show the saved image of this zone right away and check it against a background listing.
+
+        If the folder still matches, cells are built on first interaction;
+        otherwise the zone switches to the live grid as soon as the listing is in.
+        """
+        pixmap, meta = load_zone_snapshot(self.title_bar.text())
+        if pixmap is None:
+            return False
+        size = pixmap.deviceIndependentSize()  # fractional scaling may round by a pixel
+        if abs(size.width() - self.width()) > 1 or abs(size.height() - self.height()) > 1:
+            return False
+        self._needs_build = True
+        self._show_snapshot(pixmap)
+        self._snapshot.setProperty("scroll", meta.get("scroll", 0))
+        self._snapshot.setProperty("fingerprint", meta.get("fingerprint"))
+        self.file_list = []
+        folder = os.path.normpath(self.folder)
+
+        def done(files):
+            if folder != self.current_folder():
+                return
+            self.file_list = files
+            if not self._needs_build:  # woken before the listing came back
+                self.refresh_grid()
+                return
+            fingerprint = self.listing_fingerprint()
+            if fingerprint == self._snapshot.property("fingerprint"):
+                self._snapshot_key = (fingerprint, self._snapshot.property("scroll"))
+                metrics.inc("snapshot_fresh")
+            else:
+                metrics.inc("snapshot_stale")
+                self.wake()
+        self._request_listing(folder, done, "restore")
+        return True
+
+    @property
+    def repaints_avoided(self) -> int:
+        return self._snapshot.avoided
+
+    def enterEvent(self, event):
+        super().enterEvent(event)
+        self.wake()
+
+    def leaveEvent(self, event):
+        super().leaveEvent(event)
+        self._hide_preview()
+        if not self._paused:
+            self._idle_timer.start(IDLE_AFTER_MS)
+
+    def wheelEvent(self, event):
+        self._hide_preview()
+        if self.idle:
+            self.wake()
+        super().wheelEvent(event)
+
+    def _watch_current(self):
+        if self._watcher.directories():
+            self._watcher.removePaths(self._watcher.directories())
+        self._update_recent_source()
+        if self._paused:
+            return
+        if self.virtual is not None:
+            paths = self.virtual["roots"]
+        else:
+            paths = [self.current_folder()] if self.current_folder() else []
+        paths = [p for p in paths if os.path.isdir(p)]
+        if paths:
+            self._watcher.addPaths(paths)
+
+    def _reload_folder(self):
+        if self._paused:
+            return
+        if self.recent_limit is not None:
+            files = recent.index().top(self.recent_limit)
+            if files != self.file_list:
+                self.file_list = files
+                self.refresh_grid()
+            return
+        if self.virtual is not None:
+            self.set_virtual(self.virtual, save=False)
+            return
+        folder = self.current_folder()
+        if not folder:
+            return
+        # the watcher also fires for in-place edits, which don't change the folder's mtime
+        self._listings.invalidate(folder)
+        foldersize.sizes().invalidate(folder)
+
+        def done(files):
+            if folder == self.current_folder() and set(files) != set(self.file_list):
+                self.file_list = files
+                self.refresh_grid()
+        self._request_listing(folder, done, "reload")
+
+    def _update_recent_source(self):
+        """Tell the Recent index what this zone shows; nothing while paused or parked."""
+        if self._paused or self.recent_limit is not None:
+            recent.index().remove(self)
+        elif self.virtual is not None:
+            recent.index().set_paths(self, self.file_list)
+        else:
+            recent.index().set_folder(self, self.current_folder())
+
+    def set_recent(self, limit: int = recent.DEFAULT_RECENT, save: bool = True):
+        """Turn this zone into a Recent zone: the newest files across all other zones."""
+        if self._scanner is not None:
+            self._scanner.cancel()
+        self.recent_limit = max(1, min(int(limit), recent.RECENT_CAPACITY))
+        self.virtual = None
+        self.folder = None
+        self._reset_navigation()
+        if not getattr(self, "_recent_connected", False):
+            # debounced like watcher events; bursts of changes rebuild the grid once
+            recent.index().changed.connect(self._on_recent_changed)
+            self._recent_connected = True
+        self._watch_current()
+        self.file_list = recent.index().top(self.recent_limit)
+        self.refresh_grid()
+        if save:
+            self.auto_save()
+
+    def _on_recent_changed(self):
+        if self.recent_limit is not None and not self._paused:
+            self._reload_timer.start(RELOAD_DEBOUNCE_MS)
+
+    def edit_recent_size(self):
+        val, ok = QInputDialog.getInt(self, "Recent Zone", "Number of files:", self.recent_limit or recent.DEFAULT_RECENT,
+                                      1, recent.RECENT_CAPACITY)
+        if ok:
+            self.set_recent(val)
+
+    def _io_priority(self, user: bool = False) -> int:
+        if user:
+            return ioscheduler.USER
+        return ioscheduler.VISIBLE if self.isVisible() else ioscheduler.HIDDEN
+
+    def _request_listing(self, folder: str, callback, purpose: str, user: bool = False):
+        """List `folder` off the GUI thread.
+
+        A newer request for the same purpose ("restore", "reload", "navigate")
+        replaces the old one; navigating replaces them all, since it changes
+        the folder the others were for.
+        """
+        for key in (list(self._listing_requests) if purpose == "navigate" else [purpose]):
+            old = self._listing_requests.pop(key, None)
+            if old is not None:
+                old.cancel()
+
+        def done(files):
+            self._listing_requests.pop(purpose, None)
+            callback(files or [])
+        self._listing_requests[purpose] = self._listings.fetch(folder, done, self._io_priority(user))
+
+    def pause_background(self):
+        """Stop watchers, timers and scans (e.g. while the session is locked)."""
+        self._paused = True
+        self._idle_timer.stop()
+        self._reload_timer.stop()
+        self._watch_current()
+        if self._scanner is not None:
+            self._scanner.cancel()
+
+    def resume_background(self):
+        if not self._paused:
+            return
+        self._paused = False
+        self._watch_current()
+        self._reload_folder()  # pick up whatever changed while we were paused
+        self._idle_timer.start(IDLE_AFTER_MS)
 
     # ---------------- Titlebar menu ----------------
     def open_title_menu(self, pos):
         menu = QMenu(self)
-        menu.addAction("Change Folder", self.change_folder)
+        sort_action = menu.addAction("Sort by Size")
+        sort_action.setCheckable(True)
+        sort_action.setChecked(self.sort_by == "size")
+        sort_action.triggered.connect(lambda checked: self.set_sort_by("size" if checked else "name"))
+        preview_action = menu.addAction("Hover Preview")
+        preview_action.setCheckable(True)
+        preview_action.setChecked(self.hover_preview)
+        preview_action.triggered.connect(self.set_hover_preview)
+        if self.virtual is not None:
+            menu.addAction("Edit Rules", self.edit_virtual_rules)
+        elif self.recent_limit is not None:
+            menu.addAction("Number of Files", self.edit_recent_size)
+        else:
+            menu.addAction("Change Folder", self.change_folder)
         menu.addAction("Rename Zone", self.rename_zone)
         lock_action = menu.addAction("Lock Movement")
         lock_action.setCheckable(True)
@@ -137,6 +718,7 @@ class Zone(QWidget):
 
     # ---------------- Zone background menu - search toggle ----------------
     def open_zone_menu(self, pos):
+        self.wake()
         if self.search_bar:
             self.search_bar.deleteLater()
             self.search_bar = None
@@ -171,114 +753,559 @@ class Zone(QWidget):
         folder = QFileDialog.getExistingDirectory(self, "Select Folder")
         if folder:
             self.folder = folder
-            try:
-                self.file_list = [os.path.join(folder, f) for f in os.listdir(folder)]
-            except Exception:
-                self.file_list = []
+            self.recent_limit = None
+            self._reset_navigation()
+            self.file_list = self._listings.listing(folder)
+            self._watch_current()
             self.adjust_window_size()
             self.refresh_grid()
             self.auto_save()
 
+    # ---------------- In-zone navigation ----------------
+    def current_folder(self) -> str | None:
+        folder = self.browse_folder or self.folder
+        return os.path.normpath(folder) if folder else None
+
+    def _cell_key(self, folder: str) -> tuple:
+        # cells are only reusable if nothing that affects how they were built changed
+        return (folder, self.cell_icon_size, self.cell_size, self.text_size,
+                self.label_height, self.name_color.name(), self.sort_by, self.hover_preview)
+
+    def _listing_stamp(self) -> tuple:
+        # the entries the cells were built from; a stashed set is only valid for the same listing
+        return tuple((f, self._listings.mtime_of(f), self._listings.size_of(f)) for f in self.file_list)
+
+    def _stash_cells(self):
+        """Detach the current folder's cells from the grid and keep them for later."""
+        folder = self.current_folder()
+        cells = []
+        for i in reversed(range(self.grid_layout.count())):
+            w = self.grid_layout.itemAt(i).widget()
+            if w is None or w is self.search_bar:
+                continue
+            self.grid_layout.removeWidget(w)
+            w.hide()
+            cells.append(w)
+        cells.reverse()
+        if folder and cells:
+            self._cell_cache.put(self._cell_key(folder), (self._listing_stamp(), cells))
+
+    def _place_cells(self, cells: list):
+        start_row = 1 if self.search_bar else 0
+        for idx, cell in enumerate(cells):
+            self.grid_layout.addWidget(cell, idx // self.cols + start_row, idx % self.cols)
+            cell.show()
+        if self.search_bar:
+            self.apply_search(self.search_bar.text())
+
+    def navigate_to(self, path: str, push: bool = True):
+        path = os.path.normpath(str(path))
+        here = self.current_folder()
+        if not self.folder or path == here:
+            return
+        if push and here:
+            self._nav_history.append(here)
+        self._stash_cells()
+        self.file_list = []  # nothing of the old folder stays clickable while the new one lists
+        self.browse_folder = None if path == os.path.normpath(self.folder) else path
+        self._watch_current()
+        self._update_breadcrumb()
+
+        def done(files):
+            if path == self.current_folder():
+                self.file_list = files
+                self._show_cells(path)
+                self.scroll_area.verticalScrollBar().setValue(0)
+        self._request_listing(path, done, "navigate", user=True)
+
+    def _show_cells(self, folder: str):
+        """Put the folder's cells in the grid, reusing cached ones when the listing is unchanged."""
+        hit = self._cell_cache.pop(self._cell_key(folder))
+        if hit is not None and hit[0] == self._listing_stamp():
+            self._place_cells(hit[1])
+        else:
+            if hit is not None:
+                for c in hit[1]:
+                    c.deleteLater()
+            self.refresh_grid()
+
+    def has_cached_cells(self, folder: str | None) -> bool:
+        if not folder:
+            return False
+        folder = os.path.normpath(folder)
+        return any(k[0] == folder for k in self._cell_cache.keys())
+
+    def navigate_back(self):
+        if self._nav_history:
+            self.navigate_to(self._nav_history.pop(), push=False)
+
+    def navigate_up(self):
+        if self.browse_folder:
+            self.navigate_to(os.path.dirname(self.browse_folder))
+
+    def _reset_navigation(self):
+        self.browse_folder = None
+        self._nav_history.clear()
+        self._cell_cache.clear()
+        self._update_breadcrumb()
+
+    def _update_breadcrumb(self):
+        if not self.browse_folder or not self.folder:
+            self.nav_bar.hide()
+            return
+        root = os.path.normpath(self.folder)
+        rel = os.path.relpath(self.browse_folder, root)
+        crumbs = [f'<a href="{root}" style="color:{self.name_color.name()}">{os.path.basename(root) or root}</a>']
+        acc = root
+        for part in rel.split(os.sep):
+            acc = os.path.join(acc, part)
+            crumbs.append(f'<a href="{acc}" style="color:{self.name_color.name()}">{part}</a>')
+        self.crumb_label.setText(" \u203a ".join(crumbs))
+        self.back_btn.setEnabled(bool(self._nav_history))
+        self.nav_bar.show()
+
+    def _open_path(self, path: Path):
+        p = str(path)
+        if self.folder and self.virtual is None and (self._listings.is_dir(p) or archive.is_archive(p)):
+            self.navigate_to(p)  # folders, and zips browsed like folders
+        elif archive.split_archive(p):
+            def extracted(out):
+                if out is None:  # the scheduler has logged why
+                    QMessageBox.warning(self, "Could not open", f"{path.name} could not be extracted from the archive.")
+                else:
+                    os.startfile(out)
+            # only this member is extracted, off the GUI thread
+            ioscheduler.scheduler().submit(("extract", p), lambda: archive.extract(p), p,
+                                           ioscheduler.USER, extracted)
+        elif path.exists():
+            os.startfile(p)
+
+    # ---------------- Virtual zones ----------------
+    def edit_virtual_rules(self):
+        dlg = VirtualZoneDialog(self, self.virtual)
+        if dlg.exec():
+            self.set_virtual(dlg.spec())
+
+    def set_virtual(self, spec: dict, save: bool = True):
+        """(Re)start the rule scan; any scan for the previous definition is cancelled."""
+        self.virtual = normalize_spec(spec)
+        self.folder = None
+        self.recent_limit = None
+        if self._scanner is None:
+            self._scanner = VirtualScanner(self)
+            self._scanner.chunk_ready.connect(self._on_virtual_chunk)
+            self._scanner.finished.connect(self._on_virtual_done)
+        self.file_list = []
+        self.refresh_grid()
+        self._watch_current()
+        if not self._paused:
+            self._scanner.start(self.virtual)
+        if save:
+            self.auto_save()
+
+    def _on_virtual_chunk(self, token: int, paths: list):
+        if self._scanner is None or token != self._scanner.token:
+            return
+        # Append cells as they stream in; the sorted layout is applied once the scan ends.
+        self.add_files(paths, refresh=False)
+
+    def _on_virtual_done(self, token: int):
+        if self._scanner is None or token != self._scanner.token:
+            return
+        self.adjust_window_size()
+        # the streamed cells are already built: only put them in display order
+        cells = {}
+        for i in range(self.grid_layout.count()):
+            w = self.grid_layout.itemAt(i).widget()
+            if w is not None and w is not self.search_bar:
+                cells[getattr(w, "file_path", None)] = w
+        order = [str(p) for p in self._sorted_files()]
+        if len(cells) == len(order) and all(p in cells for p in order):
+            for w in cells.values():
+                self.grid_layout.removeWidget(w)
+            self._place_cells([cells[p] for p in order])
+        else:
+            self.refresh_grid()  # duplicates, or the grid changed under the stream
+        recent.index().set_paths(self, self.file_list)
+
     # ---------------- Customize dialog (LIVE) ----------------
     def customize_zone_dialog(self):
         app = QApplication.instance()
+        from customizer import CustomizerDialog
         dlg = CustomizerDialog(self, self, mode="Local", global_ref=app, on_change=getattr(app, "_on_global_change", None))
         dlg.setWindowModality(Qt.WindowModality.NonModal)
         dlg.show()
 
     # ---------------- Add / Refresh grid ----------------
-    def add_files(self, files):
-        from pathlib import Path
+    def add_files(self, files, refresh: bool = True):
+        """Add paths to the zone. With refresh=False new cells are appended unsorted
+        and the caller is expected to do one full refresh when its batch is complete."""
+        start = len(self.file_list)
         for f in files:
             if isinstance(f, (str, Path)):
-                self.file_list.append(Path(f))
+                self.file_list.append(str(f))
             elif isinstance(f, (tuple, list)) and len(f) == 2:
-                self.file_list.append(Path(f[0]))
+                self.file_list.append(str(f[0]))
+        if refresh:
+            self.adjust_window_size()
+            self.refresh_grid()
+            self.auto_save()
+            return
+        max_chars = max(6, (self.cell_size // 7))
+        start_row = 1 if self.search_bar else 0
+        for idx in range(start, len(self.file_list)):
+            cell = self._build_cell(Path(self.file_list[idx]), max_chars)
+            self.grid_layout.addWidget(cell, idx // self.cols + start_row, idx % self.cols)
+
+    # ---------------- Drag & drop ingestion ----------------
+    def dragEnterEvent(self, event):
+        folder = self.current_folder()
+        if event.mimeData().hasUrls() and folder and self.virtual is None and not archive.split_archive(folder):
+            event.acceptProposedAction()  # archives are browsed read-only
+
+    def dragMoveEvent(self, event):
+        if event.mimeData().hasUrls():
+            event.acceptProposedAction()
+
+    def dropEvent(self, event):
+        dest = self.current_folder()
+        if not dest or self.virtual is not None or archive.split_archive(dest):
+            return
+        sources = [u.toLocalFile() for u in event.mimeData().urls() if u.isLocalFile()]
+        if not sources:
+            return
+        mods = event.modifiers()
+        if mods & Qt.KeyboardModifier.ControlModifier:
+            move = False
+        elif mods & Qt.KeyboardModifier.ShiftModifier:
+            move = True
+        else:
+            # Explorer's default: move within a volume, copy across volumes
+            move = same_volume(sources[0], dest)
+        event.setDropAction(Qt.DropAction.MoveAction if move else Qt.DropAction.CopyAction)
+        event.accept()
+        self.ingest(sources, dest, move)
+
+    def ingest(self, sources: list[str], dest: str, move: bool = False):
+        job = IngestJob(sources, dest, move, self)
+        job.chunk_done.connect(lambda paths, d=dest: self._on_ingest_chunk(d, paths))
+        job.finished.connect(lambda done, errors, j=job: self._on_ingest_done(j, errors))
+        progress = QProgressDialog("Moving files..." if move else "Copying files...", "Cancel", 0, len(sources), self)
+        progress.setWindowModality(Qt.WindowModality.NonModal)
+        progress.setMinimumDuration(500)
+        progress.canceled.connect(job.cancel)
+        job.progress.connect(lambda done, _total: progress.setValue(done))
+        self._ingest_jobs[job] = progress
+        job.start()
+
+    def _on_ingest_chunk(self, dest: str, paths: list):
+        if os.path.normpath(dest) != self.current_folder():
+            return  # user navigated elsewhere meanwhile; the folder is re-listed on return
+        self.add_files(paths, refresh=False)
+        self.auto_save()
+
+    def _on_ingest_done(self, job: IngestJob, errors: list):
+        progress = self._ingest_jobs.pop(job, None)
+        if progress is not None:
+            progress.reset()
+            progress.deleteLater()
+        job.deleteLater()
         self.adjust_window_size()
         self.refresh_grid()
-        self.auto_save()
+        if errors:
+            QMessageBox.warning(self, "Some items were not added",
+                                "\n".join(errors[:20]) + (f"\n... and {len(errors) - 20} more" if len(errors) > 20 else ""))
 
 
     def refresh_grid(self):
         from pathlib import Path
+        self._needs_build = False
+        self._hide_preview()
+        self.wake()
+        t0 = time.perf_counter()
+
+        # Clear old widgets (the search bar, if open, stays)
+        for i in reversed(range(self.grid_layout.count())):
+            w = self.grid_layout.itemAt(i).widget()
+            if w is self.search_bar:
+                continue
+            self.grid_layout.takeAt(i)
+            if w:
+                w.deleteLater()
+
+        files = self._sorted_files()
+        max_chars = max(6, (self.cell_size // 7))
+        start_row = 1 if self.search_bar else 0
+
+        for idx, path in enumerate(files):
+            cell = self._build_cell(path, max_chars)
+            row = idx // self.cols
+            col = idx % self.cols
+            self.grid_layout.addWidget(cell, row + start_row, col)
+        if self.search_bar:
+            self.apply_search(self.search_bar.text())
 
-        # Clear old widgets
-        while self.grid_layout.count():
-            item = self.grid_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        elapsed = time.perf_counter() - t0
+        self.last_refresh_ms = elapsed * 1000
+        metrics.observe("refresh_grid", elapsed)
 
-        # Normalize all paths
+    def _sorted_files(self) -> list[Path]:
+        """file_list in display order."""
         files = [Path(f) for f in self.file_list]
 
         # Sort with folders on top if option enabled
-        if getattr(QApplication.instance(), "folders_first", True):
-            files.sort(key=lambda f: (not f.is_dir(), f.name.lower()))
+        folders_first = getattr(QApplication.instance(), "folders_first", True)
+        if self.recent_limit is not None:
+            pass  # already newest first
+        elif self.sort_by == "size":
+            files.sort(key=lambda f: (folders_first and not self._listings.is_dir(f),
+                                      -self._size_key(f), f.name.lower()))
+        elif folders_first:
+            files.sort(key=lambda f: (not self._listings.is_dir(f), f.name.lower()))
         else:
             files.sort(key=lambda f: f.name.lower())
+        return files
 
-        max_chars = max(6, (self.cell_size // 7))
-        start_row = 1 if self.search_bar else 0
+    # ---------------- Folder sizes ----------------
+    def _size_key(self, path: Path) -> int:
+        """Bytes for sorting; folders are measured in the background and sort as 0 until known."""
+        if not self._listings.is_dir(path):
+            return self._listings.size_of(path) or 0
+        sizes = foldersize.sizes()
+        if sizes.get(str(path)) is None:
+            sizes.request(str(path))
+        info = sizes.last_known(str(path))
+        return info.size if info is not None else 0
 
-        for idx, path in enumerate(files):
-            name = path.name
-            if name.lower().endswith((".lnk", ".url")):
-                name = os.path.splitext(name)[0]
-            display = name if len(name) <= max_chars else (name[: max_chars - 3] + "...")
-
-            if path.is_dir():
-                icon_file = asset_path("folder.png")
-                icon = QIcon(str(icon_file)) if icon_file.exists() \
-                    else icon_provider.icon(QFileInfo(str(path)))
+    def _folder_tooltip(self, name: str, path: str, request: bool = True) -> str:
+        info = foldersize.sizes().get(path)
+        if info is not None:
+            return f"{name}\n{info.describe()}"
+        if request:
+            foldersize.sizes().request(path, ioscheduler.USER)
+            return f"{name}\nMeasuring size..."
+        return name
+
+    def _on_folder_hover(self, btn: QPushButton, name: str, path: str):
+        self._listings.prefetch(path)
+        btn.setToolTip(self._folder_tooltip(name, path))
+        self._hovered_folder = (btn, name, path)
+
+    def _on_folder_size(self, folder: str):
+        hovered = getattr(self, "_hovered_folder", None)
+        if hovered and hovered[2] == folder:
+            try:
+                hovered[0].setToolTip(self._folder_tooltip(hovered[1], folder, request=False))
+            except RuntimeError:  # cell was rebuilt meanwhile
+                self._hovered_folder = None
+        if self.sort_by == "size" and os.path.dirname(folder) == self.current_folder():
+            self._resort_timer.start(RELOAD_DEBOUNCE_MS)
+
+    def set_sort_by(self, mode: str):
+        self.sort_by = mode
+        self.local_overrides.add("sort_by")
+        self.refresh_grid()
+        self.auto_save()
+
+    def set_hover_preview(self, enabled: bool):
+        self.hover_preview = bool(enabled)
+        self.local_overrides.add("hover_preview")
+        self.refresh_grid()  # cells get their hover hooks when built
+        self.auto_save()
+
+    def _on_file_hover(self, btn: QPushButton, name: str, path: str):
+        self._hovered_file = (btn, name, path)
+        self._preview_timer.start(preview.HOVER_DELAY_MS)
+
+    def _show_preview(self):
+        hovered = self._hovered_file
+        if hovered is None:
+            return
+        btn, name, path = hovered
+
+        def done(result):
+            if self._hovered_file is not hovered:
+                return  # the pointer moved on while it was being read
+            try:
+                anchor = QRect(btn.mapToGlobal(QPoint(0, 0)), btn.size())
+            except RuntimeError:  # cell was rebuilt meanwhile
+                return
+            size = self._listings.size_of(path)
+            title = name if result is not None or size is None else f"{name}   {foldersize.format_size(size)}"
+            preview.popup().show_for(anchor, title, result)
+        preview.previews().request(path, done)
+
+    def _hide_preview(self):
+        self._preview_timer.stop()
+        if self._hovered_file is not None:
+            self._hovered_file = None
+            preview.hide_popup()
+
+    def _build_cell(self, path: Path, max_chars: int) -> QWidget:
+        self.cells_built += 1
+        metrics.inc("cells_built")
+        name = path.name
+        link = None
+        if shortcuts.is_shortcut(name):
+            name = os.path.splitext(name)[0]
+            # parsed by whoever listed the folder (or ran the virtual scan), on a worker
+            link = shortcuts.cached(path, self._listings.mtime_of(path))
+        display = name if len(name) <= max_chars else (name[: max_chars - 3] + "...")
+
+        is_dir = self._listings.is_dir(path)
+        if is_dir:
+            icon = self._folder_icon(str(path))
+        else:
+            icon = (link and self._shortcut_icon(link)) or self._extension_icon(str(path)) \
+                or QIcon(str(asset_path("placeholder.png")))
+
+        btn = QPushButton()
+        btn.setIcon(icon)
+        btn.setIconSize(QSize(self.cell_icon_size, self.cell_icon_size))
+        btn.setFixedSize(self.cell_icon_size, self.cell_icon_size)
+        if link:
+            btn.setToolTip(link.tooltip(name))
+        elif is_dir:
+            btn.setToolTip(self._folder_tooltip(name, str(path), request=False))
+        else:
+            p = str(path)
+            if self.hover_preview and preview.can_preview(p) and not (".zip" in p.lower() and archive.split_archive(p)):
+                # the popup replaces the tooltip; archive members aren't previewed
+                btn.enterEvent = lambda e, b=btn, n=name, p=p: self._on_file_hover(b, n, p)
+                btn.leaveEvent = lambda e: self._hide_preview()
             else:
-                icon = self._extension_icon(str(path)) or QIcon(str(asset_path("placeholder.png")))
-
-            btn = QPushButton()
-            btn.setIcon(icon)
-            btn.setIconSize(QSize(self.cell_icon_size, self.cell_icon_size))
-            btn.setFixedSize(self.cell_icon_size, self.cell_icon_size)
-            btn.setToolTip(name)
-            btn.setStyleSheet("border:none; background:transparent;")
-            btn.mouseDoubleClickEvent = lambda e, p=path: (os.startfile(str(p)) if p.exists() else None)
-
-            label = QLabel(display)
-            label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            font = QFont()
-            font.setPixelSize(self.text_size)
+                size = self._listings.size_of(path)
+                btn.setToolTip(name if size is None else f"{name}\n{foldersize.format_size(size)}")
+        btn.setStyleSheet("border:none; background:transparent;")
+        btn.mouseDoubleClickEvent = lambda e, p=path: self._open_path(p)
+        if is_dir:
+            btn.enterEvent = lambda e, b=btn, n=name, p=str(path): self._on_folder_hover(b, n, p)
+
+        label = QLabel(display)
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        font = QFont()
+        font.setPixelSize(self.text_size)
+        label.setFont(font)
+        label.setStyleSheet(f"color: {self.name_color.name()};")
+        if link and link.broken:
+            font.setItalic(True)
+            font.setStrikeOut(True)
             label.setFont(font)
-            label.setStyleSheet(f"color: {self.name_color.name()};")
-            label.setFixedHeight(self.label_height)
-            label.setFixedWidth(self.cell_size)
-
-            cell = QWidget()
-            v = QVBL(cell)
-            v.setContentsMargins(0, 0, 0, 0)
-            v.setSpacing(2)
-            v.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop)
-            cell.setFixedSize(self.cell_size, self.cell_size)
-            v.addWidget(btn, alignment=Qt.AlignmentFlag.AlignCenter)
-            v.addWidget(label, alignment=Qt.AlignmentFlag.AlignCenter)
+        label.setFixedHeight(self.label_height)
+        label.setFixedWidth(self.cell_size)
 
-            row = idx // self.cols
-            col = idx % self.cols
-            self.grid_layout.addWidget(cell, row + start_row, col)
+        cell = QWidget()
+        v = QVBL(cell)
+        v.setContentsMargins(0, 0, 0, 0)
+        v.setSpacing(2)
+        v.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop)
+        cell.setFixedSize(self.cell_size, self.cell_size)
+        v.addWidget(btn, alignment=Qt.AlignmentFlag.AlignCenter)
+        v.addWidget(label, alignment=Qt.AlignmentFlag.AlignCenter)
+        cell.file_path = str(path)
+        return cell
 
 
     # ---------------- Window sizing ----------------
     def adjust_window_size(self):
         v_w = self.scroll_area.verticalScrollBar().sizeHint().width()
         h_h = self.scroll_area.horizontalScrollBar().sizeHint().height()
-        width = self.cols * self.cell_size + (self.scale_offset_x * 2) + (v_w * 2)
-        height = self.rows * self.cell_size + self.title_bar.height() + (self.scale_offset_y * 2)
+        step = self.cell_size + self.GRID_SPACING
+        # the exact inverse of _reflow_cells, so a resize keeps the configured rows/cols
+        width = self.cols * step - self.GRID_SPACING + v_w + 2 * self.scale_offset_x
+        height = self.rows * step - self.GRID_SPACING + self.title_bar.height() + 2 * self.scale_offset_y
         if len(self.file_list) > self.rows * self.cols:
             height += h_h
         width = max(width, 160)
         height = max(height, self.title_bar.height() + 50)
         self.resize(width, height)
 
+    # ---------------- Config / pooling ----------------
+    def apply_config(self, data: dict, defaults: dict | None = None):
+        """Apply size and colour settings from a saved zone dict layered over `defaults`."""
+        merged = {**DEFAULT_GLOBALS, **(defaults or {})}
+        merged.update({k: v for k, v in data.items() if k in DEFAULT_GLOBALS})
+        for key in ("rows", "cols", "cell_icon_size", "text_size", "title_text_size",
+                    "title_height", "label_height", "scale_offset_x", "scale_offset_y"):
+            setattr(self, key, int(merged[key]))
+        for key in ("bg_color", "name_color", "title_bg", "title_text"):
+            setattr(self, key, QColor(merged[key]))
+        self.sort_by = merged["sort_by"] if merged.get("sort_by") in ("name", "size") else "name"
+        self.hover_preview = bool(merged["hover_preview"])
+        self.cell_size = self.cell_icon_size + self.label_height
+        self.local_overrides = set(data.get("local_overrides") or [])
+
+        self.title_bar.setFixedHeight(self.title_height)
+        self._apply_title_style()
+        # restyling repolishes every child, so skip it when the theme is unchanged
+        for w, css in ((self.scroll_area, f"background-color: {self.bg_color.name()}; border:none;"),
+                       (self.grid_widget, f"background-color: {self.bg_color.name()};")):
+            if w.styleSheet() != css:
+                w.setStyleSheet(css)
+        self.grid_layout.setContentsMargins(self.scale_offset_x, self.scale_offset_y, self.scale_offset_x, self.scale_offset_y)
+
+    def rebind(self, data: dict, defaults: dict | None = None, snapshot: bool = False) -> bool:
+        """Reuse this window for a (different) saved zone: title, folder or rules, look and geometry.
+
+        With snapshot=True a persisted image is shown instead of building cells
+        when possible; returns whether that happened.
+        """
+        self.wake()
+        self._stash_cells()
+        if self.search_bar:
+            self.search_bar.deleteLater()
+            self.search_bar = None
+        if self._scanner is not None:
+            self._scanner.cancel()
+        self.browse_folder = None
+        self._nav_history.clear()
+        self._update_breadcrumb()
+        self.locked = False
+        self._paused = False
+
+        self.apply_config(data, defaults)
+        self.title_bar.setText(data.get("zone_name") or data.get("title") or "Zone")
+        self._snapshot_key = None
+        geom = data.get("geometry")
+        if isinstance(geom, (list, tuple)) and len(geom) == 4:
+            self.set_global_geometry(QRect(*map(int, geom)))
+
+        restored = False
+        if data.get("virtual"):
+            self.set_virtual(data["virtual"], save=False)
+        elif data.get("recent"):
+            self.set_recent(data["recent"], save=False)
+        else:
+            self.virtual = None
+            self.recent_limit = None
+            self.folder = data.get("folder") or None
+            self._watch_current()
+            if snapshot and self.folder and not self.has_cached_cells(self.folder):
+                restored = self.restore_snapshot()
+            if restored:
+                pass
+            elif self.folder:
+                self.file_list = self._listings.listing(self.folder)
+                self._show_cells(os.path.normpath(self.folder))
+            else:
+                self.file_list = []
+                self.refresh_grid()
+
+        if not (isinstance(geom, (list, tuple)) and len(geom) == 4):
+            self.adjust_window_size()
+        self._idle_timer.start(IDLE_AFTER_MS)
+        return restored
+
+    def park(self):
+        """Hide and go quiet while sitting in the pool; cells stay cached for a later rebind."""
+        self.hide()
+        self.wake()
+        self._stash_cells()
+        self.pause_background()
+
     # ---------------- Persistence ----------------
     def to_dict(self) -> dict:
-        geom = self.geometry()
+        geom = self.global_geometry()
         return {
             "zone_name": self.title_bar.text(),
             "folder": self.folder or "",
@@ -296,7 +1323,22 @@ class Zone(QWidget):
             "title_bg": self.title_bg.name(),
             "title_text": self.title_text.name(),
             "geometry": [geom.x(), geom.y(), geom.width(), geom.height()],
+            "local_overrides": sorted(self.local_overrides),
+            "virtual": self.virtual,
+            "recent": self.recent_limit,
+            "sort_by": self.sort_by,
+            "hover_preview": self.hover_preview,
         }
 
     def auto_save(self):
-        save_zone_config(self)
+        """Schedule a save; bursts of changes (drags, chunks, spins) are written once."""
+        self._save_timer.start(SAVE_DEBOUNCE_MS)
+
+    @property
+    def save_pending(self) -> bool:
+        return self._save_timer.isActive()
+
+    def save_now(self):
+        self._save_timer.stop()
+        with metrics.timed("zone_save"):
+            save_zone_config(self)
@@ -0,0 +1,27 @@
+from __future__ import annotations
+from typing import Callable
+
+
+class ZonePool:
+    """Keeps hidden Zone windows around so profile switches rebind instead of rebuilding."""
+
+    def __init__(self, factory: Callable[[], object], max_free: int = 64):
+        self.factory = factory
+        self.max_free = max_free
+        self.free: list = []
+
+    def acquire(self, folder: str | None = None):
+        # a window that last showed this folder still has its cells cached
+        for i, z in enumerate(self.free):
+            if z.has_cached_cells(folder):
+                return self.free.pop(i)
+        if self.free:
+            return self.free.pop()
+        return self.factory()
+
+    def release(self, zone):
+        zone.park()
+        if len(self.free) < self.max_free:
+            self.free.append(zone)
+        else:
+            zone.deleteLater()